@@ -5,84 +5,3100 @@ bl_info = {
 }
 
 import bpy
+import bmesh
+import numpy as np
 import os
-import glob
 import time
 import shutil
 import traceback
 import importlib
 import sys
+import json
+import zlib
+import struct
+import collections
+import math
+import contextlib
+import hashlib
+import tempfile
 import subprocess
+import argparse
+import pickle
+import copyreg
+import re
 from bpy_extras.io_utils import ImportHelper
-from bpy.props import StringProperty, BoolProperty, IntProperty
-from importlib import import_module
+from mathutils import Color, Euler, Matrix, Quaternion, Vector
+from bpy.props import StringProperty, BoolProperty, IntProperty, FloatProperty, EnumProperty
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-class JarvisToolsPanel(bpy.types.Panel):
-    """Main panel for Jarvis Tools"""
-    bl_label = "Jarvis Tools"
-    bl_idname = "OBJECT_PT_jarvis_tools"
-    bl_space_type = 'VIEW_3D'
-    bl_region_type = 'UI'
-    bl_category = "Jarvis Tools"
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+#[HELPER] Batch Logging
+# SUMMARY lines (log header and final counts) are written at every verbosity
+LOG_LEVELS = {'SUMMARY': 0, 'ERROR': 0, 'WARNING': 1, 'INFO': 2, 'DEBUG': 3}
+
+LOG_LEVEL_ITEMS = [
+    ('ERROR', "Errors", "Only log failures and the summary"),
+    ('INFO', "Info", "Log per-file progress"),
+    ('DEBUG', "Debug", "Also dump every scene object, collection and mesh after each import"),
+]
+
+
+class BatchLogger:
+    """Buffered log shared by the batch operators.
+
+    The log file is opened once and flushed every `flush_interval` seconds
+    instead of being reopened for every line. Lines above `level` are dropped,
+    so the full scene dumps only cost anything at DEBUG. When `json_path` is
+    given, `record` writes one JSON object per line next to the text log.
+    A logger created without a path silently discards everything.
+    """
+
+    def __init__(self, path=None, level='INFO', json_path=None, flush_interval=2.0):
+        self.level = LOG_LEVELS[level]
+        self.flush_interval = flush_interval
+        self.file = open(path, 'w', buffering=1 << 16, encoding='utf-8') if path else None
+        self.json_file = None
+        if path and json_path:
+            self.json_file = open(json_path, 'w', buffering=1 << 16, encoding='utf-8')
+        self.last_flush = time.monotonic()
+
+    @property
+    def enabled(self):
+        return self.file is not None
+
+    def enabled_for(self, level):
+        return self.file is not None and LOG_LEVELS[level] <= self.level
+
+    def write(self, text, level='INFO'):
+        if not self.enabled_for(level):
+            return
+        self.file.write(text)
+        self.maybe_flush()
+
+    def exception(self, message):
+        """Log an error message with the traceback of the exception being handled"""
+        self.write(f"ERROR: {message}\n", 'ERROR')
+        self.write("TRACE: " + traceback.format_exc() + "\n", 'ERROR')
+
+    def record(self, **fields):
+        """Write one structured JSON-lines record"""
+        if self.json_file is None:
+            return
+        fields.setdefault("time", round(time.time(), 3))
+        self.json_file.write(json.dumps(fields) + "\n")
+        self.maybe_flush()
+
+    def append_file(self, path, level='INFO'):
+        """Copy another text log (e.g. from a worker process) into this log"""
+        if path and self.enabled_for(level) and os.path.exists(path):
+            with open(path, 'r', encoding='utf-8', errors='replace') as other:
+                shutil.copyfileobj(other, self.file)
+
+    def append_json_file(self, path):
+        if path and self.json_file is not None and os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as other:
+                shutil.copyfileobj(other, self.json_file)
+
+    def maybe_flush(self):
+        if time.monotonic() - self.last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        for handle in (self.file, self.json_file):
+            if handle is not None:
+                handle.flush()
+        self.last_flush = time.monotonic()
+
+    def close(self):
+        for handle in (self.file, self.json_file):
+            if handle is not None:
+                handle.close()
+        self.file = self.json_file = None
+
+
+def open_batch_log(operator, job, log_path):
+    """Create the BatchLogger of a batch operator run.
+
+    Workers log to the files named in their job; the parent merges them.
+    """
+    if not operator.debug_mode:
+        return BatchLogger()
+    if job:
+        return BatchLogger(job["log_path"], operator.log_level, job["json_log_path"])
+    json_path = os.path.splitext(log_path)[0] + ".jsonl" if operator.json_log else None
+    return BatchLogger(log_path, operator.log_level, json_path)
+
+
+#[HELPER] Batch Summary
+# Counts of the last batch run in this process, read by the command-line entry point
+BATCH_SUMMARY = {}
+
+
+def record_batch_summary(operator, total, success_count, error_count, skipped_count=0):
+    BATCH_SUMMARY.clear()
+    BATCH_SUMMARY.update(operator=operator.bl_idname, total=total, success=success_count,
+                         failed=error_count, skipped=skipped_count)
+
+
+#[HELPER] Performance Report
+class StageTimer:
+    """Wall-clock time spent in each stage, per file and for the whole batch.
+
+    Stages timed between start_file and end_file are attributed to that file;
+    stages outside a file (e.g. texture staging) go to `batch`.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.files = {}
+        self.batch = {}
+        self.counters = {}
+        self.current = self.batch
+
+    def start_file(self, path):
+        self.current = self.files.setdefault(path, {})
+
+    def end_file(self):
+        stages = self.current
+        self.current = self.batch
+        return stages
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        stages = self.current
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            stages[name] = stages.get(name, 0.0) + time.perf_counter() - start
+
+    def merge(self, files):
+        """Add per-file timings collected by a worker process"""
+        self.files.update(files)
+
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def timing_stats(values):
+    values = sorted(values)
+    return {
+        "total": sum(values),
+        "mean": sum(values) / len(values) if values else 0.0,
+        "p50": percentile(values, 0.50),
+        "p90": percentile(values, 0.90),
+        "p99": percentile(values, 0.99),
+        "max": values[-1] if values else 0.0,
+    }
+
+
+def write_performance_report(output_folder, title, timer, slowest_count=10):
+    """Write performance_report.txt and performance_report.json to `output_folder`.
+
+    The report lists per-stage totals and percentiles, the slowest files with
+    their stage breakdown and the overall throughput in files per minute.
+    """
+    elapsed = timer.elapsed()
+    file_totals = {path: sum(stages.values()) for path, stages in timer.files.items()}
+    stage_names = []
+    for stages in timer.files.values():
+        stage_names.extend(name for name in stages if name not in stage_names)
+    slowest = sorted(file_totals, key=file_totals.get, reverse=True)[:slowest_count]
+    
+    report = {
+        "title": title,
+        "generated": time.strftime('%Y-%m-%d %H:%M:%S'),
+        "blender_version": bpy.app.version_string,
+        "files": len(file_totals),
+        "elapsed_seconds": elapsed,
+        "files_per_minute": len(file_totals) * 60.0 / elapsed if elapsed > 0 else 0.0,
+        "batch_stages": timer.batch,
+        "counters": timer.counters,
+        "per_file": timing_stats(file_totals.values()),
+        "stages": {
+            name: timing_stats([stages[name] for stages in timer.files.values() if name in stages])
+            for name in stage_names
+        },
+        "slowest": [
+            {"file": path, "seconds": file_totals[path], "stages": timer.files[path]} for path in slowest
+        ],
+    }
+    
+    with open(os.path.join(output_folder, "performance_report.json"), 'w') as json_file:
+        json.dump(report, json_file, indent=2)
+    
+    with open(os.path.join(output_folder, "performance_report.txt"), 'w') as report_file:
+        report_file.write(f"Jarvis Tools Performance Report - {title}\n")
+        report_file.write("=" * 50 + "\n\n")
+        report_file.write(f"Generated: {report['generated']}\n")
+        report_file.write(f"Blender version: {report['blender_version']}\n")
+        report_file.write(f"Files timed: {report['files']}\n")
+        report_file.write(f"Wall time: {elapsed:.2f} s\n")
+        report_file.write(f"Throughput: {report['files_per_minute']:.1f} files/minute\n\n")
+        
+        if timer.batch:
+            report_file.write("Batch stages:\n")
+            for name, seconds in timer.batch.items():
+                report_file.write(f"  {name:<16} {seconds:10.3f} s\n")
+            report_file.write("\n")
+        
+        if timer.counters:
+            report_file.write("Counters:\n")
+            for name, value in timer.counters.items():
+                report_file.write(f"  {name:<28} {value:>10}\n")
+            report_file.write("\n")
+        
+        report_file.write(f"{'Stage':<18}{'total':>10}{'mean':>10}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}\n")
+        rows = list(report["stages"].items()) + [("per file", report["per_file"])]
+        for name, stats in rows:
+            report_file.write(f"  {name:<16}" + "".join(f"{stats[key]:10.3f}" for key in
+                                                           ("total", "mean", "p50", "p90", "p99", "max")) + "\n")
+        
+        if slowest:
+            report_file.write(f"\nSlowest {len(slowest)} files:\n")
+            for entry in report["slowest"]:
+                breakdown = ", ".join(f"{name} {seconds:.2f}" for name, seconds in entry["stages"].items())
+                report_file.write(f"  {entry['seconds']:8.2f} s  {entry['file']}  ({breakdown})\n")
+    
+    return report
+
+
+#[HELPER] Worker Farm
+# Batch operators can shard their file list across headless Blender processes.
+# Each worker runs this file with WORKER_ARG and a job description; the job
+# re-invokes the same operator on its shard and writes a result file that the
+# parent merges into one summary and one log.
+WORKER_ARG = "--jarvis-worker"
+
+# Operator properties that describe the farm itself and are not forwarded to workers
+FARM_PROPERTIES = {"directory", "filepath", "filter_glob", "job_path", "use_workers", "worker_count",
+                   "use_isolation", "files_per_process", "file_timeout", "process_memory_cap_mb"}
+
+
+def resolve_worker_count(requested):
+    """Return the number of worker processes to launch (0 = one per CPU core)"""
+    if requested > 0:
+        return requested
+    return os.cpu_count() or 1
+
+
+def isolation_options(operator):
+    """Keyword arguments for run_worker_farm from the isolation settings of `operator`"""
+    if not operator.use_isolation:
+        return {}
+    return {
+        "files_per_worker": operator.files_per_process,
+        "file_timeout": operator.file_timeout,
+        "memory_cap_mb": operator.process_memory_cap_mb,
+    }
+
+
+def resolve_operator(idname):
+    """Return the bpy.ops callable for 'jarvis.name' or 'JARVIS_OT_name'"""
+    if "_OT_" in idname:
+        module, name = idname.split("_OT_", 1)
+    else:
+        module, name = idname.split(".", 1)
+    return getattr(getattr(bpy.ops, module.lower()), name)
+
+
+def operator_options(operator, exclude=()):
+    """Collect the settable properties of an operator as a JSON-friendly dict"""
+    options = {}
+    for prop in operator.bl_rna.properties:
+        name = prop.identifier
+        if name == "rna_type" or name in exclude or prop.is_readonly:
+            continue
+        value = getattr(operator, name)
+        if isinstance(value, set):
+            value = sorted(value)
+        options[name] = value
+    return options
+
+
+def shard_files(files, count):
+    """Split files round-robin into at most `count` non-empty shards"""
+    count = max(1, min(count, len(files)))
+    return [files[index::count] for index in range(count)]
+
+
+def load_worker_job(job_path):
+    """Read a job description written by run_worker_farm"""
+    with open(job_path, 'r') as job_file:
+        return json.load(job_file)
+
+
+def write_worker_result(job, success_count, error_count, outputs, failed, timings, remaining=()):
+    """Write the outcome of a worker shard for the parent to merge.
+
+    `remaining` lists the files a worker left unprocessed after reaching its
+    memory limit or being cancelled; the farm hands them to a fresh worker
+    process unless the batch was cancelled.
+    """
+    result = {
+        "success": success_count,
+        "error": error_count,
+        "outputs": outputs,
+        "failed": failed,
+        "timings": timings,
+        "remaining": list(remaining),
+    }
+    tmp_path = job["result_path"] + ".tmp"
+    with open(tmp_path, 'w') as result_file:
+        json.dump(result, result_file)
+    os.replace(tmp_path, job["result_path"])
+
+
+def launch_worker(job_path, output_path):
+    """Start a headless Blender process that runs a single worker job"""
+    command = [
+        bpy.app.binary_path,
+        "--background",
+        "--python-exit-code", "1",
+        "--python", os.path.abspath(__file__),
+        "--", WORKER_ARG, job_path,
+    ]
+    output_file = open(output_path, 'w')
+    try:
+        return subprocess.Popen(command, stdout=output_file, stderr=subprocess.STDOUT)
+    finally:
+        output_file.close()
+
+
+def run_worker_farm(operator, idname, source_folder, files, worker_count, log, journal_dir=None,
+                    files_per_worker=0, file_timeout=0, memory_cap_mb=0):
+    """Run `idname` over `files` split across headless Blender workers.
+
+    Every worker starts from its own clean scene and processes one shard. The
+    per-worker logs are appended to `log` (a BatchLogger) and the counts are
+    merged into a single result dict with the same keys as write_worker_result,
+    plus "crashed" and "reasons".
+
+    Workers journal their files (in `journal_dir` when given), so when one
+    crashes the file it was working on is reported in "crashed" and the rest
+    of its shard goes to a fresh worker. In isolation mode the files are
+    split into shards of `files_per_worker`, at most `worker_count` run at
+    once, and a worker is killed when it makes no progress for `file_timeout`
+    seconds or grows past `memory_cap_mb`; its current file then fails with
+    the reason in "reasons" instead of being reported as a crash.
+
+    This is a generator that yields while the workers run, so a modal
+    operator can keep the UI responsive, and returns the merged result.
+    When the batch is cancelled no new worker is started, running workers
+    stop after their current file and the files left over are listed in
+    "cancelled".
+    """
+    work_dir = tempfile.mkdtemp(prefix="jarvis_farm_")
+    cancel_path = os.path.join(work_dir, "cancel")
+    options = operator_options(operator, FARM_PROPERTIES)
+    concurrency = resolve_worker_count(worker_count)
+    if files_per_worker:
+        shards = [files[start:start + files_per_worker] for start in range(0, len(files), files_per_worker)]
+    else:
+        shards = shard_files(files, concurrency)
+    pending = collections.deque((index, 0, shard) for index, shard in enumerate(shards))
+
+    def start_worker(index, generation, shard):
+        name = f"{index}_{generation}"
+        job = {
+            "operator": idname,
+            "directory": source_folder,
+            "files": shard,
+            "options": options,
+            "log_path": os.path.join(work_dir, f"worker_{name}.log") if log.enabled else "",
+            "json_log_path": os.path.join(work_dir, f"worker_{name}.jsonl") if log.json_file else "",
+            "result_path": os.path.join(work_dir, f"result_{name}.json"),
+            "journal_path": os.path.join(journal_dir or work_dir, f"worker_{name}.journal.jsonl"),
+            "cancel_path": cancel_path,
+        }
+        journal_paths.append(job["journal_path"])
+        job_path = os.path.join(work_dir, f"job_{name}.json")
+        with open(job_path, 'w') as job_file:
+            json.dump(job, job_file)
+        output_path = os.path.join(work_dir, f"worker_{name}.out")
+        return {"index": index, "generation": generation, "job": job, "output_path": output_path,
+                "process": launch_worker(job_path, output_path), "started": time.time(), "killed": None}
+
+    def check_limits(worker):
+        """Kill a worker that stalls on one file or outgrows the memory cap"""
+        if file_timeout:
+            # The journal is written at every file boundary, so its mtime marks the last progress
+            try:
+                last_progress = max(worker["started"], os.path.getmtime(worker["job"]["journal_path"]))
+            except OSError:
+                last_progress = worker["started"]
+            if time.time() - last_progress > file_timeout:
+                worker["killed"] = f"timed out after {file_timeout} seconds"
+        if memory_cap_mb and not worker["killed"]:
+            memory = process_memory_mb(worker["process"].pid)
+            if memory > memory_cap_mb:
+                worker["killed"] = f"exceeded the memory cap ({memory:.0f} MB > {memory_cap_mb} MB)"
+        if worker["killed"]:
+            worker["process"].kill()
+            worker["process"].wait()
+
+    workers = []
+    journal_paths = []
+    merged = {"success": 0, "error": 0, "outputs": {}, "failed": [], "timings": {}, "crashed": [], "reasons": {},
+              "cancelled": []}
+    cancelled = False
+    last_check = 0.0
+    while workers or pending:
+        if not cancelled and batch_cancelled():
+            # Workers check for this file between files, like the memory limit
+            cancelled = True
+            open(cancel_path, 'w').close()
+            merged["cancelled"].extend(path for _, _, shard in pending for path in shard)
+            pending.clear()
+        while pending and len(workers) < concurrency:
+            workers.append(start_worker(*pending.popleft()))
+        
+        if time.time() - last_check >= 1.0:
+            last_check = time.time()
+            for worker in workers:
+                if worker["process"].poll() is None:
+                    check_limits(worker)
+            # Count the files the running workers have journaled as done
+            done = sum(1 for entry in read_journal(journal_paths).values() if entry.get("state") == "done")
+            report_batch_progress(max(done, merged["success"] + merged["error"]), len(files))
+        
+        finished = [worker for worker in workers if worker["process"].poll() is not None]
+        if not finished:
+            time.sleep(0.05)
+            yield
+            continue
+        for worker in finished:
+            workers.remove(worker)
+            index, generation, job = worker["index"], worker["generation"], worker["job"]
+            return_code = worker["process"].returncode
+            try:
+                with open(job["result_path"], 'r') as result_file:
+                    result = json.load(result_file)
+            except (OSError, ValueError):
+                result = recover_worker_result(job, worker["killed"])
+            merged["crashed"].extend(result.get("crashed", []))
+            merged["reasons"].update(result.get("reasons", {}))
+            merged["success"] += result["success"]
+            merged["error"] += result["error"]
+            merged["outputs"].update(result["outputs"])
+            merged["failed"].extend(result["failed"])
+            merged["timings"].update(result["timings"])
+            remaining = result.get("remaining", [])
+
+            log.write(f"\n{'#'*50}\n")
+            log.write(f"Worker {index}.{generation}: {len(job['files'])} files, exit code {return_code}\n")
+            log.write(f"{'#'*50}\n")
+            log.append_file(job["log_path"])
+            log.append_json_file(job["json_log_path"])
+            if return_code != 0:
+                log.write("\nWorker output:\n", 'ERROR')
+                log.append_file(worker["output_path"], 'ERROR')
+            
+            for path, reason in result.get("reasons", {}).items():
+                log.write(f"Worker {index} failed {path}: {reason}\n", 'ERROR')
+                log.record(file=path, status="failed", stage="worker", error=reason)
+            # A worker that stopped at its memory limit, crashed or was killed is replaced by a fresh process
+            for crashed in result.get("crashed", []):
+                log.write(f"Worker {index} crashed while processing {crashed}; the file is quarantined\n", 'ERROR')
+            if remaining and cancelled:
+                merged["cancelled"].extend(remaining)
+            elif remaining:
+                log.write(f"Worker {index} stopped early; restarting it for {len(remaining)} remaining files\n",
+                          'WARNING')
+                pending.appendleft((index, generation + 1, remaining))
+        report_batch_progress(max(BATCH_PROGRESS.get("done", 0), merged["success"] + merged["error"]), len(files))
+
+    shutil.rmtree(work_dir, ignore_errors=True)
+    return merged
+
+
+def recover_worker_result(job, killed=None):
+    """Rebuild the result of a worker that died without writing one.
+
+    Files the worker finished keep their outcome according to its journal,
+    the file it was processing is reported as crashed (or, when the farm
+    `killed` it, failed with that reason) and the files it never reached are
+    left to a new worker. A worker that made no progress at all fails its
+    whole shard with a reason, so a process that cannot even start is not
+    relaunched forever; only a file the journal shows as started is ever
+    reported as crashed and quarantined.
+    """
+    latest = read_journal([job["journal_path"]])
+    completed, failed, crashed = journal_outcome(latest)
+    # Grouped files that were still waiting for their export are converted again
+    finished = set(completed) | set(failed) | set(crashed)
+    finished.update(path for path, entry in latest.items() if entry.get("status") == "skipped")
+    remaining = [path for path in job["files"] if path not in finished]
+    reasons = {}
+    if not finished or (killed and not crashed):
+        # No file was being processed, so none of them is to blame (e.g. Sollumz failed to load)
+        reasons = {path: killed or "worker failed to start" for path in remaining}
+        remaining = []
+    if killed:
+        reasons.update((path, killed) for path in crashed)
+        crashed = []
+    return {
+        "success": len(completed),
+        "error": len(failed) + len(crashed) + len(reasons),
+        "outputs": completed,
+        "failed": failed + crashed + list(reasons),
+        "timings": {},
+        "crashed": crashed,
+        "reasons": reasons,
+        "remaining": remaining,
+    }
+
+
+def run_worker_job(job_path):
+    """Entry point of a worker process: run the job's operator on its shard"""
+    job = load_worker_job(job_path)
+    operator = resolve_operator(job["operator"])
+    try:
+        operator(directory=job["directory"], job_path=job_path, **job["options"])
+    except RuntimeError:
+        # bpy.ops raises for the ERROR reports of failed files once the shard is done;
+        # those are already counted in the result, only a missing result is a crash
+        if not os.path.exists(job["result_path"]):
+            raise
+
+
+#[HELPER] Import Synchronization
+def import_ready(object_count, mesh_count, expected=None):
+    """Check whether an import has produced its objects and meshes"""
+    if expected is not None:
+        try:
+            return expected.name in bpy.data.objects
+        except ReferenceError:
+            return False
+    return len(bpy.data.objects) > object_count or len(bpy.data.meshes) > mesh_count
+
+
+def wait_for_import(context, object_count, mesh_count, expected=None, timeout=0.0, poll_interval=0.05):
+    """Synchronize with an importer instead of sleeping a fixed amount of time.
+
+    The depsgraph is updated and the import is considered complete once the
+    expected object (or any new object or mesh) exists. Synchronous importers
+    pass on the first check; `timeout` only bounds the polling for importers
+    that finish asynchronously. Returns True when the imported data is present.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        context.view_layer.update()
+        if import_ready(object_count, mesh_count, expected):
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(poll_interval)
+
+
+#[HELPER] Import Diff
+def id_pointers(id_blocks):
+    """Set of the memory addresses of `id_blocks`, for O(1) membership tests"""
+    return {id_block.as_pointer() for id_block in id_blocks}
+
+
+def new_id_blocks(id_blocks, existing):
+    """Data blocks of `id_blocks` whose pointer is not in `existing`, in order"""
+    return [id_block for id_block in id_blocks if id_block.as_pointer() not in existing]
+
+
+def add_collection_objects(objects, collections):
+    """Append the objects of `collections` that `objects` does not hold yet"""
+    seen = id_pointers(objects)
+    for coll in collections:
+        for obj in coll.objects:
+            pointer = obj.as_pointer()
+            if pointer not in seen:
+                seen.add(pointer)
+                objects.append(obj)
+    return objects
+
+
+def with_descendants(roots, objects):
+    """`roots` and their descendants among `objects`, as {pointer: object}.
+
+    The parent links of `objects` are walked once, unlike children_recursive
+    which scans every object in the file for each root.
+    """
+    children = collections.defaultdict(list)
+    for obj in objects:
+        if obj.parent is not None:
+            children[obj.parent.as_pointer()].append(obj)
+    found = {}
+    stack = list(roots)
+    while stack:
+        obj = stack.pop()
+        pointer = obj.as_pointer()
+        if pointer not in found:
+            found[pointer] = obj
+            stack.extend(children.get(pointer, ()))
+    return found
+
+
+def select_only(context, objects):
+    """Select exactly `objects` in the scene and make the first one active"""
+    selected = id_pointers(objects)
+    for obj in context.scene.objects:
+        obj.select_set(obj.as_pointer() in selected)
+    if objects:
+        context.view_layer.objects.active = objects[0]
+
+
+def benchmark_import_diff(context, sizes=(1000, 2500, 5000, 10000), legacy_limit=5000):
+    """Time import diffing and selection on synthetic scenes of `sizes` objects.
+
+    One object in ten is a '.mesh' root parenting the next nine. Returns
+    {size: {"seconds": ..., "legacy_seconds": ...}}; the list-based code
+    this replaced is only timed up to `legacy_limit` objects because it
+    grows quadratically. Seconds per object stay flat when scaling is linear.
+    """
+    results = {}
+    for size in sizes:
+        reset_scene(context)
+        existing = id_pointers(bpy.data.objects)
+        existing_objs = set(bpy.data.objects)
+        collection = bpy.data.collections.new(f"bench_diff_{size}")
+        context.scene.collection.children.link(collection)
+        root = None
+        for index in range(size):
+            obj = bpy.data.objects.new(f"bench_{index}.mesh" if index % 10 == 0 else f"bench_{index}", None)
+            if index % 10 == 0:
+                root = obj
+            else:
+                obj.parent = root
+            collection.objects.link(obj)
+        context.view_layer.update()
+        
+        start = time.perf_counter()
+        new_objs = add_collection_objects(new_id_blocks(bpy.data.objects, existing), [collection])
+        roots = [obj for obj in new_objs if obj.name.endswith(".mesh")]
+        keep = with_descendants(roots, new_objs)
+        select_only(context, [obj for obj in new_objs if obj.as_pointer() in keep])
+        entry = {"seconds": time.perf_counter() - start, "legacy_seconds": None}
+        
+        if size <= legacy_limit:
+            start = time.perf_counter()
+            new_objs = [obj for obj in bpy.data.objects if obj not in existing_objs]
+            for obj in collection.objects:
+                if obj not in new_objs:
+                    new_objs.append(obj)
+            keep = set()
+            for obj in new_objs:
+                if obj.name.endswith(".mesh"):
+                    keep.add(obj)
+                    keep.update(obj.children_recursive)
+            kept = [obj for obj in bpy.data.objects if obj in keep]
+            for obj in context.scene.objects:
+                obj.select_set(obj in kept)
+            entry["legacy_seconds"] = time.perf_counter() - start
+        results[size] = entry
+    reset_scene(context)
+    return results
+
+
+#[HELPER] Incremental Manifest
+MANIFEST_NAME = ".jarvis_manifest.json"
+
+# Operator properties that do not change the exported files
+MANIFEST_IGNORED = FARM_PROPERTIES | {"debug_mode", "log_level", "json_log", "wait_time", "skip_unchanged",
+                                       "use_content_hash", "performance_report", "slowest_count", "texture_link_mode",
+                                       "use_file_index", "use_parse_cache", "parse_cache_dir",
+                                       "parse_cache_mb", "group_size", "group_max_objects", "group_max_memory_mb",
+                                       "memory_limit_mb", "use_journal", "retry_quarantined"}
+
+
+def settings_digest(settings):
+    """Short hash of an operator settings dict, used to match journal entries to a run's settings"""
+    return hashlib.sha1(json.dumps(settings, sort_keys=True).encode()).hexdigest()
+
+
+def file_fingerprint(path, use_hash=False):
+    """Return size and mtime of a file, plus a SHA-1 of its content if requested"""
+    stat = os.stat(path)
+    fingerprint = {"size": stat.st_size, "mtime": stat.st_mtime_ns}
+    if use_hash:
+        digest = hashlib.sha1()
+        with open(path, 'rb') as data_file:
+            for chunk in iter(lambda: data_file.read(1 << 20), b""):
+                digest.update(chunk)
+        fingerprint["sha1"] = digest.hexdigest()
+    return fingerprint
+
+
+class BatchManifest:
+    """Manifest stored in a batch output folder.
+
+    For every input it records a fingerprint, the operator settings used and
+    the output path, so a later run can skip inputs whose outputs are current.
+    Paths are stored relative to the source and output folders.
+    """
+    version = 1
+
+    def __init__(self, source_folder, output_folder, settings, use_hash=False):
+        self.source_folder = source_folder
+        self.output_folder = output_folder
+        self.path = os.path.join(output_folder, MANIFEST_NAME)
+        self.settings = settings
+        self.use_hash = use_hash
+        self.entries = {}
+        try:
+            with open(self.path, 'r') as manifest_file:
+                data = json.load(manifest_file)
+            if data.get("version") == self.version:
+                self.entries = data["files"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def key(self, path):
+        return os.path.relpath(path, self.source_folder)
+
+    def is_current(self, path):
+        """True if `path` was converted with the same settings and is unchanged"""
+        entry = self.entries.get(self.key(path))
+        if not entry or entry["settings"] != self.settings:
+            return False
+        if not os.path.exists(os.path.join(self.output_folder, entry["output"])):
+            return False
+        try:
+            current = file_fingerprint(path)
+        except OSError:
+            return False
+        recorded = entry["fingerprint"]
+        if current["size"] != recorded["size"]:
+            return False
+        if current["mtime"] == recorded["mtime"]:
+            return True
+        # Touched but possibly identical: only the content hash can tell
+        if self.use_hash and "sha1" in recorded:
+            return file_fingerprint(path, True)["sha1"] == recorded["sha1"]
+        return False
+
+    def filter(self, paths):
+        """Split paths into (pending, skipped) lists"""
+        pending, skipped = [], []
+        for path in paths:
+            (skipped if self.is_current(path) else pending).append(path)
+        return pending, skipped
+
+    def record(self, path, output_path):
+        try:
+            fingerprint = file_fingerprint(path, self.use_hash)
+        except OSError:
+            return
+        self.entries[self.key(path)] = {
+            "fingerprint": fingerprint,
+            "settings": self.settings,
+            "output": os.path.relpath(output_path, self.output_folder),
+        }
+
+    def record_outputs(self, outputs):
+        for path, output_path in outputs.items():
+            self.record(path, output_path)
+
+    def save(self):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w') as manifest_file:
+            json.dump({"version": self.version, "files": self.entries}, manifest_file)
+        os.replace(tmp_path, self.path)
+
+
+#[HELPER] Batch Journal
+JOURNAL_DIR = ".jarvis_journal"
+QUARANTINE_NAME = ".jarvis_quarantine.json"
+
+
+class BatchJournal:
+    """Write-ahead journal of a batch run, one JSON line per event.
+
+    'started' is flushed and fsynced before a file is processed and 'done'
+    is written once it is, so after a crash the 'started' entry without a
+    'done' names the file that took Blender down. Every process writes its
+    own journal file; a run that completes clears the journal folder.
+    Without a path the journal does nothing. Entries carry the digest of
+    the run's `settings`, so a rerun only trusts work done with its own.
+    """
+
+    def __init__(self, path=None, settings=None):
+        self.path = path
+        self.settings = settings
+        self.file = None
+        if path:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self.file = open(path, 'a')
+
+    def write(self, path, state, sync=False, **fields):
+        if self.file is None:
+            return
+        self.file.write(json.dumps({"file": path, "state": state, "time": time.time(), "settings": self.settings,
+                                    **fields}) + "\n")
+        self.file.flush()
+        if sync:
+            os.fsync(self.file.fileno())
+
+    def iterate(self, files, outputs, failed=(), group=None):
+        """Yield `files`, journaling each one around the loop body.
+
+        A loop left early (memory limit or a Python exception) marks the
+        current file 'interrupted', which is not treated as a crash.
+        """
+        for path in files:
+            self.write(path, "started", sync=True)
+            try:
+                yield path
+            except GeneratorExit:
+                self.write(path, "interrupted")
+                raise
+            self.write(path, "done", **self.outcome(path, outputs, failed, group))
+
+    @staticmethod
+    def outcome(path, outputs, failed, group):
+        output = outputs.get(path) or (group.exported.get(path) if group else None)
+        if output:
+            return {"status": "ok", "output": output}
+        if group and any(asset.key == path for asset in group.assets):
+            return {"status": "queued"}
+        return {"status": "failed" if path in failed else "skipped"}
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+def read_journal(paths):
+    """Latest journal entry of every file across the given journal files"""
+    latest = {}
+    for path in paths:
+        try:
+            with open(path, 'r') as journal_file:
+                lines = journal_file.readlines()
+        except OSError:
+            continue
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # Half-written last line of a crashed process
+                continue
+            previous = latest.get(entry["file"])
+            if previous is None or entry["time"] >= previous["time"]:
+                latest[entry["file"]] = entry
+    return latest
+
+
+def journal_outcome(latest):
+    """Split journal entries into ({path: output} converted, [failed], [crashed])"""
+    completed = {}
+    failed = []
+    crashed = []
+    for path, entry in latest.items():
+        if entry["state"] == "started":
+            crashed.append(path)
+        elif entry["state"] == "done" and entry.get("status") == "ok":
+            completed[path] = entry["output"]
+        elif entry["state"] == "done" and entry.get("status") == "failed":
+            failed.append(path)
+    return completed, failed, crashed
+
+
+def recover_journal(journal_dir, settings=None):
+    """Read the journals an interrupted run left behind and remove them.
+
+    Returns ({path: output} files converted with the same `settings` digest
+    whose output still exists, [files that were started but never finished]).
+    """
+    try:
+        paths = [os.path.join(journal_dir, name) for name in os.listdir(journal_dir) if name.endswith(".jsonl")]
+    except OSError:
+        return {}, []
+    latest = read_journal(paths)
+    completed, _failed, crashed = journal_outcome(latest)
+    completed = {path: output for path, output in completed.items()
+                 if latest[path].get("settings") == settings and os.path.exists(output)}
+    clear_journal(journal_dir)
+    return completed, crashed
+
+
+def clear_journal(journal_dir):
+    shutil.rmtree(journal_dir, ignore_errors=True)
+
+
+class Quarantine:
+    """Inputs that crashed Blender, kept out of later runs until the file changes.
+
+    Stored next to the manifest in the output folder, keyed by the path
+    relative to the source folder together with the file's size and mtime.
+    """
+    version = 1
+
+    def __init__(self, source_folder, output_folder):
+        self.source_folder = source_folder
+        self.path = os.path.join(output_folder, QUARANTINE_NAME)
+        self.entries = {}
+        try:
+            with open(self.path, 'r') as quarantine_file:
+                data = json.load(quarantine_file)
+            if data.get("version") == self.version:
+                self.entries = data["files"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def key(self, path):
+        return os.path.relpath(path, self.source_folder)
+
+    def add(self, path, reason):
+        try:
+            fingerprint = file_fingerprint(path)
+        except OSError:
+            return
+        self.entries[self.key(path)] = {"fingerprint": fingerprint, "reason": reason}
+
+    def contains(self, path):
+        entry = self.entries.get(self.key(path))
+        if not entry:
+            return False
+        try:
+            return file_fingerprint(path) == entry["fingerprint"]
+        except OSError:
+            return False
+
+    def filter(self, paths):
+        """Split paths into (allowed, quarantined) lists"""
+        allowed, quarantined = [], []
+        for path in paths:
+            (quarantined if self.contains(path) else allowed).append(path)
+        return allowed, quarantined
+
+    def save(self):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w') as quarantine_file:
+            json.dump({"version": self.version, "files": self.entries}, quarantine_file)
+        os.replace(tmp_path, self.path)
+
+
+class BatchResume:
+    """Journal recovery and quarantine for the parent process of a batch run.
+
+    filter() drops the files an interrupted run already converted with the
+    same settings (recording them in the manifest, unless the operator does
+    not skip unchanged files) and quarantines the file that was being
+    processed when it crashed; quarantined files are skipped until they
+    change unless the operator retries them.
+    """
+
+    def __init__(self, operator, source_folder, output_folder, log):
+        self.quarantine = Quarantine(source_folder, output_folder)
+        self.journal_dir = os.path.join(output_folder, JOURNAL_DIR) if operator.use_journal else None
+        self.settings = settings_digest(operator_options(operator, MANIFEST_IGNORED))
+        self.skip_completed = operator.skip_unchanged
+        self.retry = operator.retry_quarantined
+        self.log = log
+        self.resumed = []
+        self.quarantined = []
+
+    def filter(self, files, manifest):
+        if self.journal_dir:
+            completed, crashed = recover_journal(self.journal_dir, self.settings)
+            if not self.skip_completed:
+                completed = {}
+            if completed or crashed:
+                self.log.write(f"\nResuming an interrupted run: {len(completed)} files already converted, "
+                               f"{len(crashed)} stopped Blender\n", 'WARNING')
+            manifest.record_outputs(completed)
+            manifest.save()
+            self.add_crashed(crashed)
+            self.resumed = [path for path in files if path in completed]
+            files = [path for path in files if path not in completed]
+        if not self.retry:
+            files, self.quarantined = self.quarantine.filter(files)
+            for path in self.quarantined:
+                self.log.write(f"QUARANTINED: {path} stopped Blender in an earlier run and is skipped until it changes\n",
+                               'WARNING')
+        return files
+
+    def journal(self):
+        return BatchJournal(os.path.join(self.journal_dir, "batch.jsonl") if self.journal_dir else None, self.settings)
+
+    def add_crashed(self, paths):
+        for path in paths:
+            self.quarantine.add(path, "Blender stopped while processing this file")
+            self.log.write(f"QUARANTINED: {path} stopped Blender\n", 'ERROR')
+        if paths:
+            self.quarantine.save()
+
+    def finish(self, journal):
+        """Close the journal of a completed run and remove the journal folder"""
+        journal.close()
+        if self.journal_dir:
+            clear_journal(self.journal_dir)
+
+
+#[HELPER] File Index
+INDEX_NAME = ".jarvis_index.json"
+
+# Compound suffixes tried before the plain extension, longest first
+INDEX_SUFFIXES = ("_hi.yft.xml", ".yft.xml", ".ydr.xml", ".ytd.xml", ".ybn.xml")
+
+TEXTURE_SUFFIXES = (".png", ".jpg", ".jpeg", ".tga")
+
+
+def file_suffix(name):
+    """Bucket key of a file name: a known compound suffix or the lowercase extension"""
+    lower = name.lower()
+    for suffix in INDEX_SUFFIXES:
+        if lower.endswith(suffix):
+            return suffix
+    return os.path.splitext(lower)[1]
+
+
+class FileIndex:
+    """Single-pass scandir listing of a source tree, bucketed by file suffix.
+
+    With `cache` the listing is stored in the source folder and a directory is
+    only listed again when its modification time changed (entries added,
+    removed or renamed); unchanged directories cost one stat. The root is
+    usually relisted because batch runs write into it. Hidden entries
+    are skipped like glob does, symlinked directories are not followed, and
+    `exclude` names top-level folders such as the batch output folders.
+    """
+    version = 1
+
+    def __init__(self, root, exclude=(), cache=True):
+        self.root = root
+        self.path = os.path.join(root, INDEX_NAME)
+        self.exclude = set(exclude)
+        self.cache = cache
+        self.dirs = {}
+        self.buckets = {}
+        self.listed = 0
+        self.reused = 0
+        self.changed = False
+
+    def load(self):
+        try:
+            with open(self.path, 'r') as index_file:
+                data = json.load(index_file)
+            if data.get("version") == self.version:
+                return data["dirs"]
+        except (OSError, ValueError, KeyError):
+            pass
+        return {}
+
+    def save(self):
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, 'w') as index_file:
+                json.dump({"version": self.version, "dirs": self.dirs}, index_file)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+    def list_dir(self, path):
+        files, subdirs = [], []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                    elif entry.is_file():
+                        files.append(entry.name)
+                except OSError:
+                    continue
+        return files, subdirs
+
+    def scan(self):
+        cached = self.load() if self.cache else {}
+        self.dirs = {}
+        self.changed = False
+        pending = [""]
+        while pending:
+            rel_dir = pending.pop()
+            path = os.path.join(self.root, rel_dir)
+            try:
+                mtime = os.stat(path).st_mtime_ns
+                entry = cached.get(rel_dir)
+                if entry and entry["mtime"] == mtime:
+                    self.reused += 1
+                else:
+                    files, subdirs = self.list_dir(path)
+                    if not entry or entry["files"] != files or entry["subdirs"] != subdirs:
+                        entry = {"mtime": mtime, "files": files, "subdirs": subdirs}
+                        self.changed = True
+                    self.listed += 1
+            except OSError:
+                continue
+            self.dirs[rel_dir] = entry
+            for name in entry["subdirs"]:
+                if rel_dir or name not in self.exclude:
+                    pending.append(os.path.join(rel_dir, name))
+        
+        self.buckets = {}
+        for rel_dir, entry in self.dirs.items():
+            folder = os.path.join(self.root, rel_dir)
+            for name in entry["files"]:
+                self.buckets.setdefault(file_suffix(name), []).append(os.path.join(folder, name))
+        # Writing the index touches the root folder, so it is only rewritten when a listing changed
+        if self.cache and self.changed:
+            self.save()
+        return self
+
+    def files(self, *suffixes):
+        """Sorted paths of every file in the given suffix buckets"""
+        paths = []
+        for suffix in suffixes:
+            paths.extend(self.buckets.get(suffix, ()))
+        return sorted(paths)
+
+
+#[HELPER] Parse Cache
+PARSE_CACHE_NAME = ".jarvis_cache"
+
+# Sollumz XML trees hold mathutils values, which do not pickle on their own
+MATHUTILS_REDUCERS = {
+    Vector: lambda value: (Vector, (tuple(value),)),
+    Quaternion: lambda value: (Quaternion, (tuple(value),)),
+    Euler: lambda value: (Euler, (tuple(value), value.order)),
+    Matrix: lambda value: (Matrix, ([tuple(row) for row in value],)),
+    Color: lambda value: (Color, (tuple(value),)),
+}
+
+# A cache whose first stores all fail is switched off instead of hashing every file for nothing
+PARSE_CACHE_MAX_FAILURES = 3
+
+
+def sollumz_version(module):
+    """Version string of the loaded Sollumz add-on, used to invalidate cached parses"""
+    version = getattr(module, "bl_info", {}).get("version")
+    if version:
+        return ".".join(str(part) for part in version)
+    # Extensions keep their version in blender_manifest.toml instead of bl_info
+    manifest_path = os.path.join(os.path.dirname(module.__file__), "blender_manifest.toml")
+    try:
+        with open(manifest_path, 'r') as manifest_file:
+            for line in manifest_file:
+                key, _, value = line.partition("=")
+                if key.strip() == "version":
+                    return value.strip().strip('"\'')
+    except OSError:
+        pass
+    return "unknown"
+
+
+class ParseCache:
+    """On-disk cache of parsed Sollumz XML objects.
+
+    Entries are pickles named after the SHA-1 of the XML content and a
+    namespace (parser kind, Sollumz and Python version), so edited files and
+    add-on updates miss automatically. Loading refreshes an entry's mtime,
+    and the least recently used entries are deleted once the folder grows
+    past `max_mb`. Store failures are counted, and the cache turns itself
+    off when nothing could be stored after the first few parses.
+    """
+
+    def __init__(self, folder, namespace, max_mb=2048):
+        self.folder = folder
+        self.namespace = namespace
+        self.max_bytes = max_mb * 1024 * 1024
+        self.hits = 0
+        self.misses = 0
+        self.stored = 0
+        self.failures = 0
+        self.last_error = None
+        os.makedirs(folder, exist_ok=True)
+        self.size = sum(entry.stat().st_size for entry in os.scandir(folder)
+                        if entry.is_file() and entry.name.endswith(".pickle"))
+
+    def entry_path(self, path):
+        digest = hashlib.sha1(self.namespace.encode())
+        digest.update(file_fingerprint(path, True)["sha1"].encode())
+        return os.path.join(self.folder, digest.hexdigest() + ".pickle")
+
+    def load(self, entry_path):
+        try:
+            with open(entry_path, 'rb') as cache_file:
+                data = pickle.load(cache_file)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Truncated or incompatible entry: drop it and parse again
+            with contextlib.suppress(OSError):
+                os.remove(entry_path)
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(entry_path)
+        return data
+
+    def store(self, entry_path, data):
+        tmp_path = f"{entry_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as cache_file:
+                pickler = pickle.Pickler(cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+                pickler.dispatch_table = {**copyreg.dispatch_table, **MATHUTILS_REDUCERS}
+                pickler.dump(data)
+            os.replace(tmp_path, entry_path)
+            size = os.path.getsize(entry_path)
+        except Exception as error:
+            # Objects that cannot be pickled are not cached, but the failure is counted
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            self.failures += 1
+            self.last_error = f"{type(error).__name__}: {error}"
+            return
+        self.stored += 1
+        self.size += size
+        if self.size > self.max_bytes:
+            self.evict()
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits its size cap"""
+        entries = []
+        for entry in os.scandir(self.folder):
+            if entry.is_file() and entry.name.endswith(".pickle"):
+                with contextlib.suppress(OSError):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        entries.sort()
+        self.size = sum(size for _mtime, size, _path in entries)
+        for _mtime, size, path in entries:
+            if self.size <= self.max_bytes:
+                break
+            with contextlib.suppress(OSError):
+                os.remove(path)
+                self.size -= size
+
+    @property
+    def disabled(self):
+        return not self.stored and self.failures >= PARSE_CACHE_MAX_FAILURES
+
+    def stats(self):
+        """Counters for the performance report"""
+        return {"parse_cache_hits": self.hits, "parse_cache_misses": self.misses,
+                "parse_cache_store_failures": self.failures}
+
+    def summary(self):
+        text = f"Parse cache: {self.hits} loaded, {self.misses} parsed, {self.failures} could not be stored"
+        if self.last_error:
+            text += f" (last error: {self.last_error})"
+        if self.disabled:
+            text += "; the cache was switched off"
+        return text
+
+    def wrap(self, parse):
+        """Return a drop-in replacement for `parse(path)` that goes through the cache"""
+        def cached_parse(path):
+            if self.disabled:
+                self.misses += 1
+                return parse(path)
+            entry_path = self.entry_path(path)
+            data = self.load(entry_path)
+            if data is not None:
+                self.hits += 1
+                return data
+            self.misses += 1
+            data = parse(path)
+            self.store(entry_path, data)
+            return data
+        return cached_parse
+
+
+#[HELPER] Scene Reset
+# ID collections emptied between batch files. Scenes, worlds, workspaces and
+# window managers are kept so the active scene and the UI stay valid.
+RESET_ID_TYPES = (
+    "objects", "collections", "meshes", "materials", "textures", "images",
+    "armatures", "actions", "node_groups", "curves", "lights", "cameras",
+    "lattices", "metaballs", "fonts", "particles", "grease_pencils",
+    "volumes", "pointclouds", "hair_curves", "lightprobes", "speakers",
+    "sounds", "cache_files", "movieclips", "masks",
+)
+
+
+def reset_scene(context):
+    """Remove all objects and every importable data block in one pass.
+
+    Uses a single bpy.data.batch_remove over RESET_ID_TYPES instead of the
+    delete operator plus per-type orphan loops, so armatures, actions, node
+    groups and nested collections do not pile up between files. Data blocks
+    with a fake user and Blender's render/compositor images are kept.
+    Returns the number of removed data blocks.
+    """
+    try:
+        if context.object and context.object.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+    except Exception as e:
+        print(f"Error leaving edit mode before scene reset: {e}")
+    
+    ids = []
+    for type_name in RESET_ID_TYPES:
+        id_collection = getattr(bpy.data, type_name, None)
+        if id_collection is None:
+            continue
+        for id_block in id_collection:
+            if id_block.use_fake_user:
+                continue
+            if type_name == "images" and id_block.type in {'RENDER_RESULT', 'COMPOSITING'}:
+                continue
+            ids.append(id_block)
+    if ids:
+        bpy.data.batch_remove(ids)
+    context.view_layer.update()
+    return len(ids)
+
+
+def create_synthetic_asset(context, index, object_count=20):
+    """Build a small asset touching every ID type that reset_scene clears"""
+    collection = bpy.data.collections.new(f"bench_{index}")
+    context.scene.collection.children.link(collection)
+    
+    material = bpy.data.materials.new(f"bench_mat_{index}")
+    material.use_nodes = True
+    image = bpy.data.images.new(f"bench_img_{index}", 64, 64)
+    texture_node = material.node_tree.nodes.new('ShaderNodeTexImage')
+    texture_node.image = image
+    bpy.data.node_groups.new(f"bench_group_{index}", 'ShaderNodeTree')
+    
+    armature = bpy.data.armatures.new(f"bench_arm_{index}")
+    armature_obj = bpy.data.objects.new(f"bench_arm_{index}", armature)
+    collection.objects.link(armature_obj)
+    armature_obj.animation_data_create().action = bpy.data.actions.new(f"bench_action_{index}")
+    
+    verts = [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)]
+    for obj_index in range(object_count):
+        mesh = bpy.data.meshes.new(f"bench_mesh_{index}_{obj_index}")
+        mesh.from_pydata(verts, [], [(0, 1, 2, 3)])
+        mesh.materials.append(material)
+        obj = bpy.data.objects.new(mesh.name, mesh)
+        obj.parent = armature_obj
+        collection.objects.link(obj)
+
+
+def benchmark_scene_reset(context, file_count=1000, object_count=20, window=100):
+    """Measure per-file cost of create + reset_scene over a synthetic batch.
+
+    Returns a list of (first file index, average seconds per file) for every
+    `window` files; a flat series means nothing accumulates between files.
+    """
+    reset_scene(context)
+    averages = []
+    timings = []
+    for index in range(file_count):
+        start = time.perf_counter()
+        create_synthetic_asset(context, index, object_count)
+        reset_scene(context)
+        timings.append(time.perf_counter() - start)
+        if len(timings) == window:
+            averages.append((index + 1 - window, sum(timings) / window))
+            timings = []
+    if timings:
+        averages.append((file_count - len(timings), sum(timings) / len(timings)))
+    return averages
+
+
+#[HELPER] Grouped Export
+# FBX settings shared by every batch export
+FBX_EXPORT_OPTIONS = {
+    "use_mesh_modifiers": False,
+    "path_mode": 'COPY',
+    "embed_textures": True,
+    "mesh_smooth_type": 'FACE',
+}
+
+# Blender's suffix for a data block whose name was already taken
+DUPLICATE_NAME = re.compile(r"^(.*)\.\d{3,}$")
+
+
+def process_memory_mb(pid=None):
+    """Resident memory of a process (default: this one) in MB.
+
+    Falls back to the peak value for this process on platforms without a
+    current one, and returns 0.0 when another process cannot be inspected.
+    """
+    try:
+        with open(f"/proc/{pid or 'self'}/statm", 'r') as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        pass
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD)] + [
+                (name, ctypes.c_size_t) for name in (
+                    "PeakWorkingSetSize", "WorkingSetSize", "QuotaPeakPagedPoolUsage", "QuotaPagedPoolUsage",
+                    "QuotaPeakNonPagedPoolUsage", "QuotaNonPagedPoolUsage", "PagefileUsage", "PeakPagefileUsage")
+            ]
+
+        kernel32 = ctypes.windll.kernel32
+        kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+        kernel32.OpenProcess.restype = wintypes.HANDLE
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        # PROCESS_QUERY_LIMITED_INFORMATION | PROCESS_VM_READ
+        process = kernel32.GetCurrentProcess() if pid is None else kernel32.OpenProcess(0x1010, False, pid)
+        if not process:
+            return 0.0
+        try:
+            if ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+                return counters.WorkingSetSize / (1024 * 1024)
+            return 0.0
+        finally:
+            if pid is not None:
+                kernel32.CloseHandle(process)
+    if pid is not None:
+        try:
+            output = subprocess.run(["ps", "-o", "rss=", "-p", str(pid)], capture_output=True, text=True).stdout
+            return int(output.strip() or 0) / 1024
+        except (OSError, ValueError):
+            return 0.0
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class GroupedAsset:
+    """An asset queued in an ExportGroup: its source key, output path, collection, objects and data blocks"""
+
+    def __init__(self, key, output_path, collection, objects, ids, record):
+        self.key = key
+        self.output_path = output_path
+        self.collection = collection
+        self.objects = objects
+        self.ids = ids
+        self.record = record
+
+
+class ExportGroup:
+    """Assets imported side by side and exported with one FBX batch pass.
+
+    Each asset's objects are moved into their own collection and the group
+    is written with the exporter's batch_mode='COLLECTION', so the operator
+    and exporter setup is paid once per group. The caller only resets the
+    scene once the group has been flushed, which happens when it holds
+    `max_assets` assets or the object or memory budget is reached. An asset
+    whose data blocks were renamed because a grouped asset already used the
+    names triggers an early flush, after which the names are restored, so
+    every FBX matches a one-file-per-export run. Flushed assets are
+    journaled as done right away, so a crash in a later group does not
+    convert them again.
+    """
+
+    def __init__(self, output_folder, max_assets=1, max_objects=0, max_memory_mb=0, journal=None):
+        self.output_folder = output_folder
+        self.journal = journal or BatchJournal()
+        self.max_assets = max_assets
+        self.max_objects = max_objects
+        self.max_memory_mb = max_memory_mb
+        self.assets = []
+        self.owned = set()
+        self.counter = 0
+        self.exported = {}
+        self.failed = {}
+
+    @property
+    def enabled(self):
+        return self.max_assets > 1
+
+    def snapshot(self):
+        """Data blocks that exist before an asset is imported"""
+        return {type_name: set(getattr(bpy.data, type_name)) for type_name in RESET_ID_TYPES
+                if hasattr(bpy.data, type_name)}
+
+    def new_ids(self, before):
+        return [(type_name, id_block) for type_name, existing in before.items()
+                for id_block in getattr(bpy.data, type_name) if id_block not in existing]
+
+    def collisions(self, ids):
+        """Map data blocks renamed because of a grouped asset to the name they should have"""
+        renamed = {}
+        for type_name, id_block in ids:
+            match = DUPLICATE_NAME.match(id_block.name)
+            if match:
+                holder = getattr(bpy.data, type_name).get(match.group(1))
+                if holder is not None and holder in self.owned:
+                    renamed[id_block] = match.group(1)
+        return renamed
+
+    def discard(self, before):
+        """Remove the data blocks an asset added since `before` when it is not queued.
+
+        Without this a failed or rejected asset would stay in the scene and be
+        written into the next group's FBX, since the scene is only reset once
+        the group is flushed.
+        """
+        if before is None:
+            return
+        id_blocks = [id_block for _type_name, id_block in self.new_ids(before)]
+        if id_blocks:
+            bpy.data.batch_remove(id_blocks)
+
+    def is_full(self):
+        if len(self.assets) >= self.max_assets:
+            return True
+        if self.max_objects and len(bpy.data.objects) >= self.max_objects:
+            return True
+        return bool(self.max_memory_mb) and process_memory_mb() >= self.max_memory_mb
+
+    def add(self, context, key, output_path, objects, before, log, timer, **record):
+        """Queue an imported asset; flushes the group when it is full"""
+        ids = self.new_ids(before)
+        renamed = self.collisions(ids)
+        if renamed:
+            log.write(f"{len(renamed)} data blocks collide with grouped assets; exporting the group first\n")
+            self.flush(context, log, timer, release=True)
+            for id_block, name in renamed.items():
+                id_block.name = name
+        
+        self.counter += 1
+        collection = bpy.data.collections.new(f"JarvisAsset{self.counter:05d}")
+        context.scene.collection.children.link(collection)
+        for obj in objects:
+            for owner in list(obj.users_collection):
+                owner.objects.unlink(obj)
+            collection.objects.link(obj)
+        ids.append(("collections", collection))
+        self.owned.update(id_block for _type_name, id_block in ids)
+        self.assets.append(GroupedAsset(key, output_path, collection, objects, ids, record))
+        if self.is_full():
+            self.flush(context, log, timer)
+
+    def export(self, context):
+        """Write every asset of the group; returns {key: error} for the ones that failed"""
+        errors = {}
+        export_dir = tempfile.mkdtemp(prefix=".jarvis_export_", dir=self.output_folder)
+        try:
+            try:
+                bpy.ops.export_scene.fbx(
+                    filepath=os.path.join(export_dir, "group.fbx"),
+                    batch_mode='COLLECTION',
+                    batch_own_dir=False,
+                    use_selection=False,
+                    **FBX_EXPORT_OPTIONS
+                )
+                # The exporter names each file after the cleaned-up collection name
+                produced = os.listdir(export_dir)
+                for asset in self.assets:
+                    suffix = bpy.path.clean_name(asset.collection.name) + ".fbx"
+                    name = next((name for name in produced if name.endswith(suffix)), None)
+                    if name:
+                        os.replace(os.path.join(export_dir, name), asset.output_path)
+                    else:
+                        errors[asset.key] = "missing from the grouped export"
+                return errors
+            except Exception as e:
+                print(f"Grouped FBX export failed, exporting assets one by one: {e}")
+            
+            # Fall back to one export per asset, like the ungrouped mode
+            for asset in self.assets:
+                try:
+                    select_only(context, asset.objects)
+                    bpy.ops.export_scene.fbx(filepath=asset.output_path, use_selection=True, **FBX_EXPORT_OPTIONS)
+                except Exception as e:
+                    errors[asset.key] = str(e)
+            return errors
+        finally:
+            shutil.rmtree(export_dir, ignore_errors=True)
+
+    def release(self):
+        """Remove the data blocks of the grouped assets, keeping everything else"""
+        id_blocks = []
+        for asset in self.assets:
+            for _type_name, id_block in asset.ids:
+                try:
+                    id_block.name
+                except ReferenceError:
+                    continue
+                id_blocks.append(id_block)
+        if id_blocks:
+            bpy.data.batch_remove(id_blocks)
+
+    def flush(self, context, log, timer, release=False):
+        """Export the queued assets and record their outcome.
+
+        The caller resets the scene before the next asset unless `release`
+        removes just the grouped data blocks.
+        """
+        if not self.assets:
+            return
+        log.write(f"\nExporting group of {len(self.assets)} assets\n")
+        with timer.stage("export"):
+            errors = self.export(context)
+        for asset in self.assets:
+            error = errors.get(asset.key)
+            if error is None:
+                self.exported[asset.key] = asset.output_path
+                log.write(f"SUCCESS: Exported {asset.key} to {asset.output_path}\n")
+                log.record(file=asset.key, status="ok", output=asset.output_path, objects=len(asset.objects),
+                           group=len(self.assets), **asset.record)
+                self.journal.write(asset.key, "done", status="ok", output=asset.output_path)
+            else:
+                self.failed[asset.key] = error
+                log.write(f"ERROR: Failed to export {asset.output_path}: {error}\n", 'ERROR')
+                log.record(file=asset.key, status="failed", stage="export", error=error, **asset.record)
+                self.journal.write(asset.key, "done", status="failed")
+        if release:
+            self.release()
+        self.assets = []
+        self.owned = set()
+
+
+#[HELPER] Memory Limits
+def memory_exceeded(limit_mb):
+    """True when a memory limit is set and this process has reached it"""
+    return bool(limit_mb) and process_memory_mb() >= limit_mb
+
+
+@contextlib.contextmanager
+def global_undo_disabled(context):
+    """Turn off global undo for a batch run; undo steps of imported scenes only cost memory"""
+    preferences = context.preferences
+    was_dirty = preferences.is_dirty
+    previous = preferences.edit.use_global_undo
+    preferences.edit.use_global_undo = False
+    try:
+        yield
+    finally:
+        preferences.edit.use_global_undo = previous
+        # Do not leave the preferences flagged as modified by the batch run
+        preferences.is_dirty = was_dirty
+
+
+def continue_in_new_process(operator, source_folder, remaining, log, journal_dir=None):
+    """Hand the rest of a batch that reached its memory limit to a fresh headless Blender.
+
+    The worker recycles itself again whenever it reaches the same limit.
+    A generator like run_worker_farm, returning the merged worker result.
+    """
+    log.write(f"\nMemory limit of {operator.memory_limit_mb} MB reached ({process_memory_mb():.0f} MB in use); "
+              f"continuing {len(remaining)} files in a new Blender process\n", 'WARNING')
+    return (yield from run_worker_farm(operator, operator.bl_idname, source_folder, remaining, 1, log, journal_dir))
+
+
+#[HELPER] Modal Batch
+# Progress of the running batch, drawn by the panel and polled for cancellation
+BATCH_PROGRESS = {}
+
+
+def start_batch_progress(label, cancel_path=""):
+    BATCH_PROGRESS.clear()
+    BATCH_PROGRESS.update(label=label, done=0, total=0, current="", started=time.monotonic(),
+                          running=True, cancelled=False, cancel_path=cancel_path)
+
+
+def report_batch_progress(done, total, current=""):
+    """Record that `done` of `total` files are finished and `current` is next"""
+    BATCH_PROGRESS.update(done=done, total=total, current=current)
+
+
+def batch_cancelled():
+    """Whether Esc was pressed in the UI, or the parent process cancelled this worker"""
+    if BATCH_PROGRESS.get("cancelled"):
+        return True
+    cancel_path = BATCH_PROGRESS.get("cancel_path")
+    return bool(cancel_path) and os.path.exists(cancel_path)
+
+
+def format_duration(seconds):
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes:02d}m" if hours else f"{minutes}m {seconds:02d}s"
+
+
+def batch_progress_text():
+    """'12/340 files, 1.80 files/s, ETA 3m 02s' for the running batch"""
+    done = BATCH_PROGRESS.get("done", 0)
+    total = BATCH_PROGRESS.get("total", 0)
+    elapsed = time.monotonic() - BATCH_PROGRESS.get("started", time.monotonic())
+    text = f"{done}/{total} files"
+    if done and elapsed > 0:
+        rate = done / elapsed
+        text += f", {rate:.2f} files/s, ETA {format_duration((total - done) / rate)}"
+    return text
+
+
+def drive_batch(steps):
+    """Run a batch generator to completion and return its result"""
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
+
+
+def batch_session(context, log, steps):
+    """Run batch `steps` with global undo disabled and close `log` when they end"""
+    try:
+        with global_undo_disabled(context):
+            return (yield from steps)
+    finally:
+        log.close()
+
+
+class ModalBatch:
+    """Mixin that runs a batch operator from a timer-driven modal handler.
+
+    `run_batch` is a generator that yields between files and returns the
+    operator result. In the UI it is stepped from a window manager timer,
+    so Blender stays responsive, the panel shows progress and Esc cancels
+    after the current file. Background runs (command line and workers)
+    drive it to completion inside execute.
+    """
+
+    def start_batch(self, context, log, steps, job=None):
+        if BATCH_PROGRESS.get("running"):
+            log.close()
+            self.report({'ERROR'}, "Another batch is still running; wait for it or press Esc to cancel it.")
+            return {'CANCELLED'}
+        start_batch_progress(self.bl_label, job.get("cancel_path", "") if job else "")
+        steps = batch_session(context, log, steps)
+        if bpy.app.background or context.window is None:
+            try:
+                return drive_batch(steps)
+            finally:
+                BATCH_PROGRESS["running"] = False
+        
+        self._steps = steps
+        window_manager = context.window_manager
+        self._timer = window_manager.event_timer_add(0.01, window=context.window)
+        window_manager.modal_handler_add(self)
+        window_manager.progress_begin(0, 100)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC' and event.value == 'PRESS':
+            if not BATCH_PROGRESS.get("cancelled"):
+                BATCH_PROGRESS["cancelled"] = True
+                self.report({'WARNING'}, "Cancelling the batch after the current file...")
+            return {'RUNNING_MODAL'}
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+        
+        try:
+            next(self._steps)
+        except StopIteration as stop:
+            self.end_batch(context)
+            return stop.value or {'FINISHED'}
+        except Exception as e:
+            self.end_batch(context)
+            self.report({'ERROR'}, f"Batch stopped by an error: {e}")
+            traceback.print_exc()
+            return {'CANCELLED'}
+        
+        total = BATCH_PROGRESS.get("total", 0)
+        if total:
+            context.window_manager.progress_update(100 * BATCH_PROGRESS["done"] // total)
+        redraw_panels(context)
+        return {'RUNNING_MODAL'}
+
+    def cancel(self, context):
+        # Blender is closing or loading another file: unwind the batch right away
+        self._steps.close()
+        self.end_batch(context)
+
+    def end_batch(self, context):
+        context.window_manager.event_timer_remove(self._timer)
+        context.window_manager.progress_end()
+        BATCH_PROGRESS["running"] = False
+        redraw_panels(context)
+
+
+def redraw_panels(context):
+    """Redraw the 3D view sidebars so the progress in the panel is current"""
+    for window in context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+
+#[HELPER] Native DDS Decoding
+# Built-in DDS reader: parses the header directly and decodes only the top mip
+# level of each face with vectorized NumPy block decoders (BC1-BC5 and
+# uncompressed formats). BC6H/BC7 raise DDSFormatError so callers can fall
+# back to Pillow or Blender's own image loader.
+DDS_MAGIC = b"DDS "
+DDSD_MIPMAPCOUNT = 0x20000
+DDPF_ALPHAPIXELS = 0x1
+DDPF_ALPHA = 0x2
+DDPF_FOURCC = 0x4
+DDPF_RGB = 0x40
+DDPF_LUMINANCE = 0x20000
+DDSCAPS2_CUBEMAP = 0x200
+DDSCAPS2_CUBEMAP_FACES = 0xFC00
+DDS_RESOURCE_MISC_TEXTURECUBE = 0x4
+
+DDS_FOURCC_FORMATS = {
+    b"DXT1": "BC1", b"DXT2": "BC2", b"DXT3": "BC2", b"DXT4": "BC3", b"DXT5": "BC3",
+    b"ATI1": "BC4", b"BC4U": "BC4", b"BC4S": "BC4S",
+    b"ATI2": "BC5", b"BC5U": "BC5", b"BC5S": "BC5S",
+}
+
+DDS_DXGI_FORMATS = {
+    27: "RGBA8", 28: "RGBA8", 29: "RGBA8",
+    61: "R8",
+    70: "BC1", 71: "BC1", 72: "BC1",
+    73: "BC2", 74: "BC2", 75: "BC2",
+    76: "BC3", 77: "BC3", 78: "BC3",
+    79: "BC4", 80: "BC4", 81: "BC4S",
+    82: "BC5", 83: "BC5", 84: "BC5S",
+    87: "BGRA8", 88: "BGRX8", 90: "BGRA8", 91: "BGRA8", 92: "BGRX8", 93: "BGRX8",
+    94: "BC6H", 95: "BC6H", 96: "BC6H",
+    97: "BC7", 98: "BC7", 99: "BC7",
+}
+
+# Bytes per 4x4 block for block-compressed formats
+DDS_BLOCK_BYTES = {"BC1": 8, "BC2": 16, "BC3": 16, "BC4": 8, "BC4S": 8, "BC5": 16, "BC5S": 16, "BC6H": 16, "BC7": 16}
+
+# Bytes per pixel for uncompressed DXGI formats
+DDS_PIXEL_BYTES = {"RGBA8": 4, "BGRA8": 4, "BGRX8": 4, "R8": 1}
+
+DDSHeader = collections.namedtuple("DDSHeader", "width height mips faces format bit_count masks luminance offset")
 
-    def draw(self, context):
-        layout = self.layout
-        
-        # Step 1: Model Prep & Import
-        box = layout.box()
-        box.label(text="Step 1: Model Preparation & Import", icon='IMPORT')
-        box.operator("jarvis.import_model")
-        box.operator("jarvis.validate_model")
-        box.operator("jarvis.auto_fix")
-        
-        # Step 2: Modifications
-        box = layout.box()
-        box.label(text="Step 2: Modifications", icon='MODIFIER')
-        box.operator("jarvis.fix_uvs")
-        box.operator("jarvis.apply_transformations")
-        box.operator("jarvis.optimize_geometry")
-        box.operator("jarvis.generate_lods")
+
+class DDSFormatError(ValueError):
+    """Raised for files the built-in DDS decoder cannot read"""
+
+
+def read_dds_header(data):
+    """Parse the DDS (and optional DX10) header at the start of `data`"""
+    if len(data) < 128 or data[:4] != DDS_MAGIC:
+        raise DDSFormatError("Not a DDS file")
+    flags, height, width, _pitch, _depth, mip_count = struct.unpack_from("<6I", data, 8)
+    pf_flags, fourcc, bit_count, r_mask, g_mask, b_mask, a_mask = struct.unpack_from("<I4s5I", data, 80)
+    caps2 = struct.unpack_from("<I", data, 112)[0]
+    mips = mip_count if flags & DDSD_MIPMAPCOUNT and mip_count else 1
+    faces = 6 if caps2 & DDSCAPS2_CUBEMAP else 1
+    offset = 128
+    masks = None
+    
+    if pf_flags & DDPF_FOURCC and fourcc == b"DX10":
+        if len(data) < 148:
+            raise DDSFormatError("Truncated DX10 header")
+        dxgi_format, _dimension, misc_flags, _array_size = struct.unpack_from("<4I", data, 128)
+        offset = 148
+        texture_format = DDS_DXGI_FORMATS.get(dxgi_format)
+        if texture_format is None:
+            raise DDSFormatError(f"Unsupported DXGI format {dxgi_format}")
+        if misc_flags & DDS_RESOURCE_MISC_TEXTURECUBE:
+            faces = 6
+    elif pf_flags & DDPF_FOURCC:
+        texture_format = DDS_FOURCC_FORMATS.get(fourcc)
+        if texture_format is None:
+            raise DDSFormatError(f"Unsupported FourCC {fourcc!r}")
+    elif pf_flags & (DDPF_RGB | DDPF_LUMINANCE | DDPF_ALPHA) and bit_count in (8, 16, 24, 32):
+        texture_format = "MASKED"
+        has_alpha = pf_flags & (DDPF_ALPHAPIXELS | DDPF_ALPHA)
+        masks = (r_mask, g_mask, b_mask, a_mask if has_alpha else 0)
+    else:
+        raise DDSFormatError("Unsupported pixel format")
+    
+    if faces == 6 and caps2 & DDSCAPS2_CUBEMAP_FACES:
+        faces = bin(caps2 & DDSCAPS2_CUBEMAP_FACES).count("1")
+    return DDSHeader(width, height, mips, faces, texture_format, bit_count, masks,
+                     bool(pf_flags & DDPF_LUMINANCE), offset)
+
+
+def dds_level_size(header, width, height):
+    """Size in bytes of one mip level"""
+    if header.format in DDS_BLOCK_BYTES:
+        return max(1, (width + 3) // 4) * max(1, (height + 3) // 4) * DDS_BLOCK_BYTES[header.format]
+    if header.format == "MASKED":
+        return width * height * (header.bit_count // 8)
+    return width * height * DDS_PIXEL_BYTES[header.format]
+
+
+def dds_face_size(header):
+    """Size in bytes of one face including all of its mip levels"""
+    size = 0
+    width, height = header.width, header.height
+    for _ in range(header.mips):
+        size += dds_level_size(header, width, height)
+        width, height = max(1, width // 2), max(1, height // 2)
+    return size
+
+
+def _dds_blocks(data, block_bytes):
+    return np.frombuffer(data, dtype=np.uint8).reshape(-1, block_bytes)
+
+
+def _assemble_blocks(texels, width, height):
+    """Turn (blocks, 16, channels) texels in block order into a (height, width, channels) image"""
+    blocks_x = max(1, (width + 3) // 4)
+    blocks_y = max(1, (height + 3) // 4)
+    channels = texels.shape[-1]
+    image = texels.reshape(blocks_y, blocks_x, 4, 4, channels).transpose(0, 2, 1, 3, 4)
+    return image.reshape(blocks_y * 4, blocks_x * 4, channels)[:height, :width]
+
+
+def _expand_565(colors):
+    red = (colors >> 11) & 0x1F
+    green = (colors >> 5) & 0x3F
+    blue = colors & 0x1F
+    return np.stack([(red << 3) | (red >> 2), (green << 2) | (green >> 4), (blue << 3) | (blue >> 2)], axis=-1)
+
+
+def _decode_color_blocks(blocks, punch_through):
+    """Decode (n, 8) BC1 colour blocks into (n, 16, 4) RGBA texels.
+
+    With `punch_through` (plain BC1) blocks whose first endpoint is not larger
+    than the second use three colours plus transparent black; the colour part
+    of BC2/BC3 always uses four colours.
+    """
+    blocks = np.ascontiguousarray(blocks)
+    count = len(blocks)
+    endpoints = blocks[:, :4].copy().view('<u2').astype(np.int32)
+    indices = blocks[:, 4:8].copy().view('<u4')[:, 0]
+    color0 = _expand_565(endpoints[:, 0])
+    color1 = _expand_565(endpoints[:, 1])
+    
+    four_colors = endpoints[:, 0] > endpoints[:, 1] if punch_through else np.ones(count, dtype=bool)
+    palette = np.empty((count, 4, 4), dtype=np.uint8)
+    palette[:, 0, :3] = color0
+    palette[:, 1, :3] = color1
+    palette[:, 2, :3] = np.where(four_colors[:, None], (2 * color0 + color1) // 3, (color0 + color1) // 2)
+    palette[:, 3, :3] = np.where(four_colors[:, None], (color0 + 2 * color1) // 3, 0)
+    palette[:, :, 3] = 255
+    palette[:, 3, 3] = np.where(four_colors, 255, 0)
+    
+    # Gather whole RGBA texels as packed 32-bit words instead of four separate bytes
+    selectors = ((indices[:, None] >> (2 * np.arange(16, dtype=np.uint32))) & 3).astype(np.intp)
+    texels = np.take_along_axis(palette.view('<u4').reshape(count, 4), selectors, axis=1)
+    return texels.view(np.uint8).reshape(count, 16, 4)
+
+
+def _decode_alpha_blocks(blocks, signed=False):
+    """Decode (n, 8) BC4 blocks (also the alpha half of BC3) into (n, 16) uint8 values"""
+    blocks = np.ascontiguousarray(blocks)
+    count = len(blocks)
+    if signed:
+        endpoints = blocks[:, :2].view(np.int8).astype(np.int32)
+    else:
+        endpoints = blocks[:, :2].astype(np.int32)
+    value0, value1 = endpoints[:, 0], endpoints[:, 1]
+    
+    bits = np.zeros(count, dtype=np.uint64)
+    for byte in range(6):
+        bits |= blocks[:, 2 + byte].astype(np.uint64) << np.uint64(8 * byte)
+    selectors = ((bits[:, None] >> (np.arange(16, dtype=np.uint64) * np.uint64(3))) & np.uint64(7)).astype(np.intp)
+    
+    # Eight-value mode when value0 > value1, otherwise six values plus the range limits
+    eight_values = value0 > value1
+    palette = np.empty((count, 8), dtype=np.int32)
+    palette[:, 0] = value0
+    palette[:, 1] = value1
+    for step in range(1, 7):
+        palette[:, step + 1] = ((7 - step) * value0 + step * value1) // 7
+    for step in range(1, 5):
+        six = ((5 - step) * value0 + step * value1) // 5
+        palette[:, step + 1] = np.where(eight_values, palette[:, step + 1], six)
+    palette[:, 6] = np.where(eight_values, palette[:, 6], -127 if signed else 0)
+    palette[:, 7] = np.where(eight_values, palette[:, 7], 127 if signed else 255)
+    
+    values = np.take_along_axis(palette, selectors, axis=1)
+    if signed:
+        values = (np.clip(values, -127, 127) + 127) * 255 // 254
+    return values.astype(np.uint8)
+
+
+def _decode_bc1(data, header):
+    texels = _decode_color_blocks(_dds_blocks(data, 8), True)
+    return _assemble_blocks(texels, header.width, header.height)
+
+
+def _decode_bc2(data, header):
+    blocks = _dds_blocks(data, 16)
+    texels = _decode_color_blocks(blocks[:, 8:], False)
+    alpha_bits = blocks[:, :8].copy().view('<u8')[:, 0]
+    alpha = (alpha_bits[:, None] >> (np.arange(16, dtype=np.uint64) * np.uint64(4))) & np.uint64(15)
+    texels[:, :, 3] = alpha.astype(np.uint8) * 17
+    return _assemble_blocks(texels, header.width, header.height)
+
+
+def _decode_bc3(data, header):
+    blocks = _dds_blocks(data, 16)
+    texels = _decode_color_blocks(blocks[:, 8:], False)
+    texels[:, :, 3] = _decode_alpha_blocks(blocks[:, :8])
+    return _assemble_blocks(texels, header.width, header.height)
+
+
+def _decode_bc4(data, header):
+    values = _decode_alpha_blocks(_dds_blocks(data, 8), header.format == "BC4S")
+    return _assemble_blocks(values[:, :, None], header.width, header.height)
+
+
+def _decode_bc5(data, header):
+    """Two-channel normal maps: blue is rebuilt as the normal's Z component"""
+    blocks = _dds_blocks(data, 16)
+    signed = header.format == "BC5S"
+    red = _decode_alpha_blocks(blocks[:, :8], signed)
+    green = _decode_alpha_blocks(blocks[:, 8:], signed)
+    x = red.astype(np.float32) / 127.5 - 1.0
+    y = green.astype(np.float32) / 127.5 - 1.0
+    z = np.sqrt(np.clip(1.0 - x * x - y * y, 0.0, 1.0))
+    blue = np.round((z + 1.0) * 127.5).astype(np.uint8)
+    return _assemble_blocks(np.stack([red, green, blue], axis=-1), header.width, header.height)
+
+
+def _decode_rgba8(data, header):
+    pixels = np.frombuffer(data, dtype=np.uint8).reshape(header.height, header.width, 4)
+    if header.format == "BGRA8":
+        return pixels[:, :, [2, 1, 0, 3]]
+    if header.format == "BGRX8":
+        return pixels[:, :, [2, 1, 0]]
+    return pixels
+
+
+def _decode_r8(data, header):
+    return np.frombuffer(data, dtype=np.uint8).reshape(header.height, header.width, 1)
+
+
+def _decode_masked(data, header):
+    """Legacy uncompressed formats described by per-channel bit masks"""
+    pixel_bytes = header.bit_count // 8
+    raw = np.frombuffer(data, dtype=np.uint8).reshape(-1, pixel_bytes).astype(np.uint32)
+    pixels = np.zeros(len(raw), dtype=np.uint32)
+    for byte in range(pixel_bytes):
+        pixels |= raw[:, byte] << np.uint32(8 * byte)
+    
+    # Some writers leave masks outside the pixel width; luminance then falls back to the whole pixel
+    pixel_mask = (1 << header.bit_count) - 1
+    red_mask, green_mask, blue_mask, alpha_mask = (mask & pixel_mask for mask in header.masks)
+    if header.luminance and not red_mask:
+        red_mask = pixel_mask & ~alpha_mask
+    channel_masks = [red_mask] if header.luminance or not (green_mask or blue_mask) else [red_mask, green_mask, blue_mask]
+    if alpha_mask:
+        channel_masks.append(alpha_mask)
+    channels = []
+    for mask in channel_masks:
+        if not mask:
+            channels.append(np.zeros(len(pixels), dtype=np.uint8))
+            continue
+        shift = (mask & -mask).bit_length() - 1
+        maximum = mask >> shift
+        channels.append(((pixels & np.uint32(mask)) >> np.uint32(shift)) * 255 // maximum)
+    image = np.stack(channels, axis=-1).astype(np.uint8)
+    return image.reshape(header.height, header.width, len(channels))
+
+
+DDS_DECODERS = {
+    "BC1": _decode_bc1, "BC2": _decode_bc2, "BC3": _decode_bc3,
+    "BC4": _decode_bc4, "BC4S": _decode_bc4, "BC5": _decode_bc5, "BC5S": _decode_bc5,
+    "RGBA8": _decode_rgba8, "BGRA8": _decode_rgba8, "BGRX8": _decode_rgba8,
+    "R8": _decode_r8, "MASKED": _decode_masked,
+}
+
+
+def decode_dds(path):
+    """Decode the top mip level of a DDS file into a (height, width, channels) uint8 array.
+
+    Cubemap faces are stacked vertically. Fully opaque alpha channels are
+    dropped so the PNG can be stored as RGB.
+    """
+    with open(path, 'rb') as dds_file:
+        data = dds_file.read()
+    header = read_dds_header(data)
+    decoder = DDS_DECODERS.get(header.format)
+    if decoder is None:
+        raise DDSFormatError(f"{header.format} is not supported by the built-in decoder")
+    
+    level_size = dds_level_size(header, header.width, header.height)
+    face_size = dds_face_size(header)
+    faces = []
+    for face in range(header.faces):
+        start = header.offset + face * face_size
+        level = data[start:start + level_size]
+        if len(level) < level_size:
+            raise DDSFormatError("Truncated DDS data")
+        faces.append(decoder(level, header))
+    image = faces[0] if len(faces) == 1 else np.concatenate(faces, axis=0)
+    
+    if image.shape[2] == 4 and np.all(image[:, :, 3] == 255):
+        image = image[:, :, :3]
+    return np.ascontiguousarray(image)
+
+
+def write_png(path, image, compress_level=6):
+    """Write a (height, width, channels) uint8 array as an 8-bit PNG.
+
+    Every row uses the 'Up' filter, computed in one vectorized subtraction,
+    and the data is compressed with zlib, which releases the GIL.
+    """
+    height, width, channels = image.shape
+    color_type = {1: 0, 2: 4, 3: 2, 4: 6}[channels]
+    rows = image.reshape(height, width * channels)
+    filtered = np.empty((height, width * channels + 1), dtype=np.uint8)
+    filtered[:, 0] = 2
+    filtered[:, 1:] = rows
+    filtered[1:, 1:] -= rows[:-1]
+    
+    def chunk(tag, body):
+        return struct.pack(">I", len(body)) + tag + body + struct.pack(">I", zlib.crc32(tag + body) & 0xFFFFFFFF)
+    
+    with open(path, 'wb') as png_file:
+        png_file.write(b"\x89PNG\r\n\x1a\n")
+        png_file.write(chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, color_type, 0, 0, 0)))
+        png_file.write(chunk(b"IDAT", zlib.compress(filtered.tobytes(), compress_level)))
+        png_file.write(chunk(b"IEND", b""))
+
+
+def benchmark_dds_decoders(folder, limit=0):
+    """Compare the built-in DDS decoder with Pillow on the textures under `folder`.
+
+    Returns {format: {"files", "megapixels", "native_seconds", "pillow_seconds",
+    "native_failures", "pillow_failures"}}; Pillow columns stay empty when
+    Pillow is not installed.
+    """
+    results = {}
+    paths = [os.path.join(root, name) for root, _dirs, files in os.walk(folder)
+             for name in files if name.lower().endswith('.dds')]
+    if limit:
+        paths = paths[:limit]
+    for path in paths:
+        try:
+            with open(path, 'rb') as dds_file:
+                header = read_dds_header(dds_file.read(148))
+        except (OSError, DDSFormatError):
+            continue
+        entry = results.setdefault(header.format, {
+            "files": 0, "megapixels": 0.0, "native_seconds": 0.0, "pillow_seconds": 0.0,
+            "native_failures": 0, "pillow_failures": 0,
+        })
+        entry["files"] += 1
+        entry["megapixels"] += header.width * header.height * header.faces / 1e6
         
-        # Transparency Fixes
-        box = layout.box()
-        box.label(text="Transparency Fixes", icon='SHADING_RENDERED')
-        box.operator("jarvis.simplify_transparency")
+        start = time.perf_counter()
+        try:
+            decode_dds(path)
+        except Exception:
+            entry["native_failures"] += 1
+        entry["native_seconds"] += time.perf_counter() - start
         
-        # Step 3: Export
-        box = layout.box()
-        box.label(text="Step 3: Export", icon='EXPORT')
-        box.operator("jarvis.export_model")
-        box.operator("jarvis.verify_export")
-        box.operator("jarvis.pack_textures")
+        if Image is not None:
+            start = time.perf_counter()
+            try:
+                with Image.open(path) as img:
+                    img.load()
+            except Exception:
+                entry["pillow_failures"] += 1
+            entry["pillow_seconds"] += time.perf_counter() - start
+    return results
+
+
+#[HELPER] Texture Conversion
+DDS_DECODER_ITEMS = [
+    ('NATIVE', "Built-in", "NumPy block decoder; BC6H/BC7 fall back to Pillow or Blender's image loader"),
+    ('PILLOW', "Pillow", "Decode every texture with Pillow"),
+    ('BLENDER', "Blender", "Load every texture with bpy.data.images.load (single-threaded)"),
+]
+
+
+def convert_dds_file(src_path, out_file, compress_level=6, decoder='NATIVE'):
+    """Convert one DDS texture to PNG; safe to call from worker threads.
+
+    Raises DDSFormatError when neither the built-in decoder nor Pillow can
+    read the file, so the caller can retry with convert_dds_with_blender.
+    """
+    if decoder == 'NATIVE':
+        try:
+            write_png(out_file, decode_dds(src_path), compress_level)
+            return out_file
+        except DDSFormatError:
+            if Image is None:
+                raise
+    elif Image is None:
+        raise DDSFormatError("Pillow (PIL) is not installed in Blender's Python")
+    try:
+        with Image.open(src_path) as img:
+            img.save(out_file, "PNG", compress_level=compress_level)
+    except (OSError, ValueError, NotImplementedError) as e:
+        # Pillow has no decoder for BC6H/BC7 and rejects some headers Blender reads fine
+        with contextlib.suppress(OSError):
+            os.remove(out_file)
+        raise DDSFormatError(f"Pillow cannot read the file: {e}") from e
+    return out_file
+
+
+def convert_dds_with_blender(src_path, out_file):
+    """Convert a DDS texture through Blender's image loader (main thread only)"""
+    image = bpy.data.images.load(src_path, check_existing=False)
+    try:
+        image.filepath_raw = out_file
+        image.file_format = 'PNG'
+        image.save()
+    finally:
+        bpy.data.images.remove(image)
+    return out_file
+
+
+#[HELPER] Texture Staging
+TEXTURE_LINK_ITEMS = [
+    ('AUTO', "Link or Copy", "Hard-link when source and output share a filesystem, else reflink (copy-on-write), else copy"),
+    ('REFLINK', "Reflink or Copy", "Copy-on-write clone where supported, else copy; never shares the file with the source"),
+    ('COPY', "Copy", "Always make a full copy"),
+]
+
+# Linux FICLONE ioctl: clone the whole file on copy-on-write filesystems (Btrfs, XFS, ...)
+FICLONE = 0x40049409
+
+
+def texture_up_to_date(src_path, dest_path):
+    """True when `dest_path` already has the size and modification time of `src_path`"""
+    try:
+        src_stat = os.stat(src_path)
+        dest_stat = os.stat(dest_path)
+    except OSError:
+        return False
+    return src_stat.st_size == dest_stat.st_size and src_stat.st_mtime_ns == dest_stat.st_mtime_ns
+
+
+def reflink_file(src_path, dest_path):
+    """Clone `src_path` to `dest_path` without copying data; raises OSError where unsupported"""
+    try:
+        import fcntl
+    except ImportError:
+        raise OSError("Reflinks are not supported on this platform")
+    with open(src_path, 'rb') as src_file, open(dest_path, 'wb') as dest_file:
+        try:
+            fcntl.ioctl(dest_file.fileno(), FICLONE, src_file.fileno())
+        except OSError:
+            dest_file.close()
+            os.remove(dest_path)
+            raise
+    shutil.copystat(src_path, dest_path)
+
+
+def stage_texture(src_path, dest_path, link_mode='AUTO'):
+    """Place `src_path` at `dest_path`; returns 'skipped', 'linked', 'reflinked' or 'copied'"""
+    if texture_up_to_date(src_path, dest_path):
+        return 'skipped'
+    if os.path.lexists(dest_path):
+        os.remove(dest_path)
+    if link_mode == 'AUTO':
+        try:
+            os.link(src_path, dest_path)
+            return 'linked'
+        except OSError:
+            pass
+    if link_mode in ('AUTO', 'REFLINK'):
+        try:
+            reflink_file(src_path, dest_path)
+            return 'reflinked'
+        except OSError:
+            pass
+    # copy2 keeps the modification time, so the next run sees the copy as up to date
+    shutil.copy2(src_path, dest_path)
+    return 'copied'
+
+
+def stage_textures(texture_files, output_folder, link_mode='AUTO'):
+    """Stage textures into `output_folder` concurrently.
+
+    Returns ({outcome: count}, [(path, error), ...]). Later files win when
+    several textures share a basename, matching the old sequential copy.
+    """
+    targets = {}
+    for tex in texture_files:
+        targets[os.path.join(output_folder, os.path.basename(tex))] = tex
+    counts = {'skipped': 0, 'linked': 0, 'reflinked': 0, 'copied': 0}
+    failed = []
+    
+    # Copies are I/O bound and release the GIL, so threads overlap them well
+    with ThreadPoolExecutor() as pool:
+        futures = {
+            pool.submit(stage_texture, src_path, dest_path, link_mode): src_path
+            for dest_path, src_path in targets.items()
+        }
+        for future in as_completed(futures):
+            try:
+                counts[future.result()] += 1
+            except Exception as e:
+                failed.append((futures[future], e))
+    return counts, failed
+
+
+#[HELPER] Transparency
+def object_materials(objects):
+    """Distinct materials used by the material slots of `objects`"""
+    materials = {}
+    for obj in objects:
+        for slot in obj.material_slots:
+            if slot.material is not None:
+                materials[slot.material] = None
+    return list(materials)
+
+
+def simplify_transparency(materials):
+    """Make the Principled BSDFs of `materials` fully opaque.
+
+    Links into Alpha are removed through the socket's own links instead of
+    scanning the whole tree per node, and node trees that are already opaque
+    are left untouched. Every node tree is handled once even when several
+    materials share it. Returns the names of the materials that changed.
+    """
+    changed_trees = {}
+    fixed = []
+    for material in materials:
+        if not material.use_nodes or material.node_tree is None:
+            continue
+        node_tree = material.node_tree
+        key = node_tree.as_pointer()
+        if key not in changed_trees:
+            changed = False
+            for node in node_tree.nodes:
+                if node.type != 'BSDF_PRINCIPLED':
+                    continue
+                alpha_input = node.inputs['Alpha']
+                if alpha_input.is_linked:
+                    for link in list(alpha_input.links):
+                        node_tree.links.remove(link)
+                    changed = True
+                if alpha_input.default_value != 1.0:
+                    alpha_input.default_value = 1.0
+                    changed = True
+            changed_trees[key] = changed
+        if changed_trees[key]:
+            fixed.append(material.name)
+    return fixed
+
+
+#[HELPER] Web Export
+GLB_COMPRESSION_ITEMS = [
+    ('NONE', "None", "Write uncompressed geometry"),
+    ('DRACO', "Draco", "Compress meshes with Draco and quantize their attributes"),
+]
+
+GLB_IMAGE_FORMAT_ITEMS = [
+    ('AUTO', "Automatic", "Keep PNG textures as PNG and JPEG textures as JPEG"),
+    ('JPEG', "JPEG", "Write every texture as JPEG"),
+    ('WEBP', "WebP", "Write every texture as WebP (needs a Blender whose glTF exporter supports it)"),
+]
+
+
+def glb_export_options(operator, filepath, use_selection):
+    """glTF exporter arguments for the web settings of `operator`.
+
+    Returns (options, unsupported): settings the installed exporter does not
+    know are left out and listed by name instead of failing the export.
+    """
+    options = {"filepath": filepath, "export_format": 'GLB', "use_selection": use_selection}
+    if operator.web_profile:
+        options["export_apply"] = True
+        options["export_image_format"] = operator.image_format
+        if operator.compression == 'DRACO':
+            options.update(
+                export_draco_mesh_compression_enable=True,
+                export_draco_mesh_compression_level=operator.compression_level,
+                export_draco_position_quantization=operator.position_bits,
+                export_draco_normal_quantization=operator.normal_bits,
+                export_draco_texcoord_quantization=operator.texcoord_bits,
+            )
+    
+    properties = bpy.ops.export_scene.gltf.get_rna_type().properties
+    supported = {}
+    unsupported = []
+    for name, value in options.items():
+        prop = properties.get(name)
+        if prop is None or (prop.type == 'ENUM' and value not in prop.enum_items.keys()):
+            unsupported.append(name)
+        else:
+            supported[name] = value
+    return supported, unsupported
+
+
+def material_images(objects):
+    """Images used by the image texture nodes of the materials of `objects`"""
+    images = set()
+    for material in object_materials(objects):
+        if not material.use_nodes:
+            continue
+        for node in material.node_tree.nodes:
+            if node.type == 'TEX_IMAGE' and node.image is not None:
+                images.add(node.image)
+    return images
+
+
+@contextlib.contextmanager
+def downscaled_textures(images, max_size):
+    """Temporarily replace images larger than `max_size` pixels by scaled copies.
+
+    The originals are remapped back and the copies removed on exit, so the
+    scene and the image files on disk are left untouched.
+    """
+    swapped = []
+    try:
+        for image in images:
+            width, height = image.size
+            if not max_size or max(width, height) <= max_size:
+                continue
+            scale = max_size / max(width, height)
+            copy = image.copy()
+            copy.scale(max(1, round(width * scale)), max(1, round(height * scale)))
+            image.user_remap(copy)
+            swapped.append((image, copy))
+        yield len(swapped)
+    finally:
+        for image, copy in reversed(swapped):
+            copy.user_remap(image)
+            bpy.data.images.remove(copy)
+
+
+def export_web_glb(operator, filepath, objects, use_selection=False):
+    """Export a GLB with the web settings of `operator`.
+
+    Returns (downscaled image count, unsupported exporter settings).
+    """
+    options, unsupported = glb_export_options(operator, filepath, use_selection)
+    max_size = operator.max_texture_size if operator.web_profile else 0
+    with downscaled_textures(material_images(objects) if max_size else (), max_size) as downscaled:
+        bpy.ops.export_scene.gltf(**options)
+    return downscaled, unsupported
+
+
+#[HELPER] Geometry Optimization
+# Faces with a smaller area (in square units) count as degenerate
+DEGENERATE_AREA = 1e-12
+
+
+def mesh_arrays(mesh):
+    """Vertex positions, loop and edge vertex indices and polygon loop ranges of `mesh` as NumPy arrays"""
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    edge_verts = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edge_verts)
+    loop_start = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_start)
+    loop_total = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_total)
+    return co.reshape(-1, 3).astype(np.float64), loop_verts, edge_verts, loop_start, loop_total
+
+
+# Multipliers that hash a grid cell to one integer; collisions only add candidates that the distance test rejects
+CELL_HASH = np.array([73856093, 19349663, 83492791], dtype=np.int64)
+
+# The cell and its 26 neighbours
+NEIGHBOUR_CELLS = np.array([(x, y, z) for x in (-1, 0, 1) for y in (-1, 0, 1) for z in (-1, 0, 1)], dtype=np.int64)
+
+# Grid cells are this many merge distances wide, so only vertices near a border look into the next cell
+MERGE_CELL_SCALE = 4
+
+
+def close_pairs(co, distance):
+    """(low, high) index arrays of every vertex pair at most `distance` apart, sorted.
+
+    Vertices are hashed into a grid and compared with the vertices of their
+    own cell and of the neighbouring cells they are within `distance` of,
+    so pairs that straddle a cell border are found and the test is on the
+    real distance.
+    """
+    scaled = co / (distance * MERGE_CELL_SCALE)
+    cells = np.floor(scaled).astype(np.int64)
+    fraction = scaled - cells
+    near = {-1: fraction <= 1.0 / MERGE_CELL_SCALE, 1: fraction >= 1.0 - 1.0 / MERGE_CELL_SCALE}
+    keys = np.bitwise_xor.reduce(cells * CELL_HASH, axis=1)
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    # One entry per occupied cell: its key and the run of `order` holding its vertices
+    cell_start = np.flatnonzero(np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1])))
+    cell_keys = sorted_keys[cell_start]
+    cell_count = np.diff(np.append(cell_start, len(keys)))
+    cell_of = np.repeat(np.arange(len(cell_keys)), cell_count)
+    
+    pairs = []
+    for offset in NEIGHBOUR_CELLS:
+        if not offset.any():
+            # The own cell: every vertex against the ones after it in its run
+            query = order
+            left = cell_start[cell_of]
+            counts = cell_count[cell_of]
+        else:
+            query = np.ones(len(co), dtype=bool)
+            for axis, step in enumerate(offset.tolist()):
+                if step:
+                    query &= near[step][:, axis]
+            query = np.flatnonzero(query)
+            neighbour_keys = np.bitwise_xor.reduce((cells[query] + offset) * CELL_HASH, axis=1)
+            # Sorted lookups keep the binary searches cache friendly
+            by_key = np.argsort(neighbour_keys)
+            query, neighbour_keys = query[by_key], neighbour_keys[by_key]
+            cell = np.minimum(np.searchsorted(cell_keys, neighbour_keys), len(cell_keys) - 1)
+            left = cell_start[cell]
+            counts = np.where(cell_keys[cell] == neighbour_keys, cell_count[cell], 0)
+        if not counts.any():
+            continue
+        # Expand every vertex into one candidate per vertex of the neighbouring cell
+        low = np.repeat(query, counts)
+        within = np.arange(len(low)) - np.repeat(np.cumsum(counts) - counts, counts)
+        high = order[np.repeat(left, counts) + within]
+        keep = high > low
+        low, high = low[keep], high[keep]
+        keep = ((co[low] - co[high]) ** 2).sum(axis=1) <= distance * distance
+        pairs.append(low[keep] * len(co) + high[keep])
+    pairs = np.unique(np.concatenate(pairs)) if pairs else np.zeros(0, dtype=np.int64)
+    return pairs // len(co), pairs % len(co)
+
+
+def merge_targets(co, distance):
+    """Index of the vertex every vertex merges into, merging by distance.
+
+    Vertices within `distance` of each other form one cluster, transitively,
+    and every vertex of a cluster merges into its lowest index. Split and
+    seam duplicates are tight clusters, where this matches Blender's Merge
+    by Distance. Unique vertices map to themselves.
+    """
+    targets = np.arange(len(co))
+    if distance <= 0 or not len(co):
+        return targets
+    low, high = close_pairs(co, distance)
+    # Connected components by label propagation: every pair hooks the root of its
+    # higher label under the lower one, then pointer jumping flattens the trees
+    while len(low):
+        root_low, root_high = targets[low], targets[high]
+        apart = root_low != root_high
+        if not apart.any():
+            break
+        low, high = low[apart], high[apart]
+        root_low, root_high = root_low[apart], root_high[apart]
+        np.minimum.at(targets, np.maximum(root_low, root_high), np.minimum(root_low, root_high))
+        while True:
+            jumped = targets[targets]
+            if np.array_equal(jumped, targets):
+                break
+            targets = jumped
+    return targets
+
+
+def polygon_areas(co, loop_verts, loop_start, loop_total):
+    """Area of every polygon by Newell's method, summed over all loops at once.
+
+    Relies on Blender storing the loops of each polygon contiguously and in
+    polygon order.
+    """
+    if not len(loop_start):
+        return np.zeros(0)
+    following = np.arange(1, len(loop_verts) + 1)
+    following[loop_start + loop_total - 1] = loop_start
+    cross = np.cross(co[loop_verts], co[loop_verts[following]])
+    return 0.5 * np.linalg.norm(np.add.reduceat(cross, loop_start, axis=0), axis=1)
+
+
+def optimize_mesh(mesh, distance=0.0001, remove_degenerate=True, remove_unused=True):
+    """Merge close vertices, drop zero-area faces and strip unused vertices of `mesh`.
+
+    NumPy works out what changes from foreach_get arrays; BMesh applies it,
+    so UVs, colors, custom attributes and vertex group weights are carried
+    over. Returns {"vertices": removed count, "faces": removed count}.
+    """
+    co, loop_verts, edge_verts, loop_start, loop_total = mesh_arrays(mesh)
+    targets = merge_targets(co, distance)
+    welded = np.flatnonzero(targets != np.arange(len(co)))
+    degenerate = np.zeros(0, dtype=np.int64)
+    if remove_degenerate:
+        # Measured after merging, so faces that collapse are caught as well
+        degenerate = np.flatnonzero(polygon_areas(co[targets], loop_verts, loop_start, loop_total) <= DEGENERATE_AREA)
+    unused = np.zeros(0, dtype=np.int64)
+    if remove_unused:
+        used = np.zeros(len(co), dtype=bool)
+        used[targets[loop_verts]] = True
+        used[targets[edge_verts]] = True
+        unused = np.flatnonzero(~used & (targets == np.arange(len(co))))
+    if not len(welded) and not len(degenerate) and not len(unused):
+        return {"vertices": 0, "faces": 0}
+    
+    bm = bmesh.new()
+    try:
+        bm.from_mesh(mesh)
+        bm.verts.ensure_lookup_table()
+        bm.faces.ensure_lookup_table()
+        verts = bm.verts
+        # BMesh operators take element lists, so only the elements that change are looked up
+        targetmap = dict(zip(map(verts.__getitem__, welded.tolist()), map(verts.__getitem__, targets[welded].tolist())))
+        unused_verts = list(map(verts.__getitem__, unused.tolist()))
+        # Faces go first, with the edges and vertices only they used; welding rebuilds the faces it touches
+        if len(degenerate):
+            bmesh.ops.delete(bm, geom=list(map(bm.faces.__getitem__, degenerate.tolist())), context='FACES')
+            targetmap = {vert: target for vert, target in targetmap.items() if vert.is_valid and target.is_valid}
+            unused_verts = [vert for vert in unused_verts if vert.is_valid]
+        if targetmap:
+            bmesh.ops.weld_verts(bm, targetmap=targetmap)
+        if unused_verts:
+            bmesh.ops.delete(bm, geom=unused_verts, context='VERTS')
+        removed = {"vertices": len(co) - len(bm.verts), "faces": len(loop_start) - len(bm.faces)}
+        bm.to_mesh(mesh)
+    finally:
+        bm.free()
+    mesh.update()
+    return removed
+
+
+def optimize_meshes(objects, distance=0.0001, remove_degenerate=True, remove_unused=True):
+    """Optimize the meshes of `objects`, each shared mesh once.
+
+    Meshes with shape keys are skipped, because merging by the base shape
+    can tear the keyed shapes apart. Returns totals plus "meshes" and
+    "skipped" counts.
+    """
+    totals = {"vertices": 0, "faces": 0, "meshes": 0, "skipped": 0}
+    meshes = {}
+    for obj in objects:
+        if obj.type == 'MESH' and obj.data is not None:
+            meshes[obj.data.as_pointer()] = obj.data
+    for mesh in meshes.values():
+        if mesh.shape_keys is not None or mesh.library is not None:
+            totals["skipped"] += 1
+            continue
+        removed = optimize_mesh(mesh, distance, remove_degenerate, remove_unused)
+        totals["vertices"] += removed["vertices"]
+        totals["faces"] += removed["faces"]
+        totals["meshes"] += 1
+    return totals
+
+
+#[HELPER] LOD Generation
+# Objects already part of an LOD chain, e.g. "Prop_LOD1"
+LOD_NAME = re.compile(r"_LOD\d+$|_LODGroup$")
+
+
+def parse_lod_list(text, label):
+    """Parse a comma-separated list of descending values between 0 and 1"""
+    try:
+        values = [float(part) for part in text.replace(";", ",").split(",") if part.strip()]
+    except ValueError:
+        raise ValueError(f"{label} must be comma-separated numbers, got '{text}'")
+    if not values or any(not 0.0 < value < 1.0 for value in values):
+        raise ValueError(f"{label} must be between 0 and 1 (exclusive), got '{text}'")
+    if values != sorted(values, reverse=True):
+        raise ValueError(f"{label} must be in descending order, got '{text}'")
+    return values
+
+
+def lod_chain_settings(operator):
+    """(ratios, screen sizes) of the LOD1..N levels configured on `operator`"""
+    ratios = parse_lod_list(operator.lod_ratios, "LOD ratios")
+    screen_sizes = parse_lod_list(operator.lod_screen_sizes, "LOD screen sizes")
+    if len(screen_sizes) < len(ratios):
+        raise ValueError(f"{len(ratios)} LOD ratios need as many screen sizes, got {len(screen_sizes)}")
+    return ratios, screen_sizes[:len(ratios)]
+
+
+def decimate_meshes(context, meshes, ratios):
+    """Decimated copies of every mesh at every ratio, as {(mesh pointer, ratio): mesh}.
+
+    Each mesh gets one temporary object per ratio with a Decimate modifier,
+    and all of them are evaluated by a single depsgraph update.
+    """
+    collection = bpy.data.collections.new("jarvis_lod_work")
+    context.scene.collection.children.link(collection)
+    temporary = {}
+    try:
+        for mesh in meshes:
+            for ratio in ratios:
+                obj = bpy.data.objects.new(f"{mesh.name}_decimate", mesh)
+                modifier = obj.modifiers.new("Decimate", 'DECIMATE')
+                modifier.ratio = ratio
+                collection.objects.link(obj)
+                temporary[(mesh.as_pointer(), ratio)] = obj
+        depsgraph = context.evaluated_depsgraph_get()
+        return {
+            key: bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph), preserve_all_data_layers=True,
+                                                 depsgraph=depsgraph)
+            for key, obj in temporary.items()
+        }
+    finally:
+        bpy.data.batch_remove(list(temporary.values()) + [collection])
+
+
+def generate_lod_chains(context, objects, ratios, screen_sizes, min_faces=0):
+    """Give every mesh object of `objects` a decimated LOD chain.
+
+    The object becomes "<name>_LOD0" under an empty "<name>_LODGroup", with
+    "<name>_LOD1".."<name>_LOD<n>" next to it, following the _LODn naming
+    that Unity's FBX importer turns into an LOD group. Each level stores its
+    "screen_size" as a custom property (exported as glTF extras). Meshes
+    shared by several objects are decimated once and shared by their LODs.
+    Returns the objects created.
+    """
+    sources = [obj for obj in objects
+               if obj.type == 'MESH' and obj.data is not None and not LOD_NAME.search(obj.name)
+               and len(obj.data.polygons) >= max(min_faces, 1)]
+    meshes = {obj.data.as_pointer(): obj.data for obj in sources}
+    lod_meshes = decimate_meshes(context, meshes.values(), ratios)
+    
+    created = []
+    for obj in sources:
+        base_name = obj.name
+        group = bpy.data.objects.new(f"{base_name}_LODGroup", None)
+        group["lod_group"] = True
+        group["lod_screen_sizes"] = [1.0] + list(screen_sizes)
+        for collection in obj.users_collection:
+            collection.objects.link(group)
+        # The group takes the object's place in the hierarchy
+        group.parent = obj.parent
+        group.parent_type = obj.parent_type
+        group.parent_bone = obj.parent_bone
+        group.matrix_parent_inverse = obj.matrix_parent_inverse.copy()
+        group.matrix_basis = obj.matrix_basis.copy()
+        obj.parent = group
+        obj.matrix_parent_inverse.identity()
+        obj.matrix_basis.identity()
+        obj.name = f"{base_name}_LOD0"
+        obj["screen_size"] = 1.0
+        created.append(group)
         
-        # Batch Conversion Section
-        box = layout.box()
-        box.label(text="Batch Conversion", icon='FILE_FOLDER')
-        box.operator("jarvis.batch_convert_xml")
-        box.operator("jarvis.batch_convert_ydr")
-        box.operator("jarvis.batch_convert_textures")
-        box.operator("jarvis.batch_clean_model")
+        for level, (ratio, screen_size) in enumerate(zip(ratios, screen_sizes), 1):
+            lod = bpy.data.objects.new(f"{base_name}_LOD{level}", lod_meshes[(obj.data.as_pointer(), ratio)])
+            lod["screen_size"] = screen_size
+            for collection in obj.users_collection:
+                collection.objects.link(lod)
+            lod.parent = group
+            # Skinned meshes keep their deformation; the decimated mesh already carries its group names
+            for vertex_group in obj.vertex_groups:
+                if vertex_group.name not in lod.vertex_groups:
+                    lod.vertex_groups.new(name=vertex_group.name)
+            for modifier in obj.modifiers:
+                if modifier.type == 'ARMATURE':
+                    lod.modifiers.new(modifier.name, 'ARMATURE').object = modifier.object
+            created.append(lod)
+    return created
+
+
+#[HELPER] Model Validation
+# Severity of every validation check; errors fail the batch gate, warnings are only reported
+VALIDATION_SEVERITY = {
+    "nonfinite_vertices": 'ERROR',
+    "nonfinite_uvs": 'ERROR',
+    "missing_uvs": 'ERROR',
+    "too_many_vertices": 'ERROR',
+    "missing_textures": 'ERROR',
+    "non_manifold_edges": 'WARNING',
+    "zero_area_faces": 'WARNING',
+    "uvs_out_of_range": 'WARNING',
+}
+
+# UVs further than this from the 0-1 square are reported; GTA textures tile, so small overruns are normal
+UV_LIMIT = 64.0
+
+
+def validate_mesh(mesh, max_vertices=65535):
+    """Count the problems of one mesh; returns {check: count} for the checks that failed"""
+    co, loop_verts, _, loop_start, loop_total = mesh_arrays(mesh)
+    problems = {}
+    finite = np.isfinite(co).all(axis=1)
+    problems["nonfinite_vertices"] = int(len(co) - np.count_nonzero(finite))
+    if max_vertices and len(co) > max_vertices:
+        problems["too_many_vertices"] = len(co)
+    
+    # Like Blender's Select Non-Manifold, an edge is manifold only when exactly two faces share it,
+    # so open borders (one face) and wire edges (no face) count as well
+    loop_edges = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+    problems["non_manifold_edges"] = int(np.count_nonzero(np.bincount(loop_edges, minlength=len(mesh.edges)) != 2))
+    
+    if len(loop_start):
+        # Faces touching a broken vertex are already reported through it
+        areas = polygon_areas(np.where(finite[:, None], co, 0.0), loop_verts, loop_start, loop_total)
+        problems["zero_area_faces"] = int(np.count_nonzero(areas <= DEGENERATE_AREA))
         
-        # Export for Web
-        box = layout.box()
-        box.label(text="Export for Web", icon='WORLD')
-        box.operator("jarvis.export_glb")
+        uv_layer = mesh.uv_layers.active
+        if uv_layer is None:
+            problems["missing_uvs"] = 1
+        else:
+            uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+            uv_layer.data.foreach_get("uv", uvs)
+            uvs = uvs.reshape(-1, 2)
+            uv_finite = np.isfinite(uvs).all(axis=1)
+            problems["nonfinite_uvs"] = int(len(uvs) - np.count_nonzero(uv_finite))
+            out_of_range = (np.abs(np.where(uv_finite[:, None], uvs, 0.5) - 0.5) > UV_LIMIT).any(axis=1)
+            problems["uvs_out_of_range"] = int(np.count_nonzero(out_of_range))
+    return {check: count for check, count in problems.items() if count}
 
-class BatchConvertXML(bpy.types.Operator, ImportHelper):
-    """Batch Convert .xml Files to .fbx using Direct Sollumz Import"""
-    bl_idname = "jarvis.batch_convert_xml"
-    bl_label = "Batch Convert XML"
+
+def missing_textures(materials):
+    """(material, image) names of image textures with no image or no readable file"""
+    missing = []
+    for material in materials:
+        if not material.use_nodes or material.node_tree is None:
+            continue
+        for node in material.node_tree.nodes:
+            if node.type != 'TEX_IMAGE':
+                continue
+            image = node.image
+            if image is None:
+                missing.append((material.name, node.name))
+            elif image.source == 'FILE' and image.packed_file is None and \
+                    not os.path.isfile(bpy.path.abspath(image.filepath, library=image.library)):
+                missing.append((material.name, image.filepath))
+    return missing
+
+
+def validate_objects(objects, max_vertices=65535):
+    """Validate the meshes and textures of `objects`, each shared mesh once.
+
+    Returns a JSON-ready report with per-mesh problems and the total
+    "errors" and "warnings" counts of the failed checks.
+    """
+    start = time.perf_counter()
+    meshes = {}
+    users = collections.defaultdict(list)
+    for obj in objects:
+        if obj.type == 'MESH' and obj.data is not None:
+            meshes[obj.data.as_pointer()] = obj.data
+            users[obj.data.as_pointer()].append(obj.name)
     
-    directory: StringProperty(subtype='DIR_PATH')
+    report = {"meshes": [], "missing_textures": [], "errors": 0, "warnings": 0}
+    for pointer, mesh in meshes.items():
+        problems = validate_mesh(mesh, max_vertices)
+        if problems:
+            report["meshes"].append({"mesh": mesh.name, "objects": users[pointer], "vertices": len(mesh.vertices),
+                                     "faces": len(mesh.polygons), "problems": problems})
+        for check in problems:
+            report["errors" if VALIDATION_SEVERITY[check] == 'ERROR' else "warnings"] += 1
+    for material, texture in missing_textures(object_materials(objects)):
+        report["missing_textures"].append({"material": material, "texture": texture})
+        report["errors"] += 1
+    report["seconds"] = round(time.perf_counter() - start, 4)
+    return report
+
+
+def write_validation_report(path, report, source=None):
+    """Write a validation report as JSON (next to the exported file in batches)"""
+    with open(path, 'w') as report_file:
+        json.dump({"source": source, **report}, report_file, indent=1)
+
+
+def benchmark_validation(context, triangles=1000000):
+    """Seconds validate_objects takes on a synthetic grid of about `triangles` triangles"""
+    size = max(2, int(math.sqrt(triangles / 2)) + 1)
+    axis = np.arange(size, dtype=np.float32)
+    x, y = np.meshgrid(axis, axis)
+    verts = np.column_stack([x.ravel(), y.ravel(), np.zeros(size * size, dtype=np.float32)])
+    corners = (np.arange(size - 1)[None, :] + size * np.arange(size - 1)[:, None]).ravel()
+    faces = np.concatenate([np.column_stack([corners, corners + 1, corners + size + 1]),
+                            np.column_stack([corners, corners + size + 1, corners + size])])
+    mesh = bpy.data.meshes.new("bench_validate")
+    mesh.from_pydata(verts.tolist(), [], faces.tolist())
+    mesh.uv_layers.new()
+    obj = bpy.data.objects.new("bench_validate", mesh)
+    context.scene.collection.objects.link(obj)
+    try:
+        start = time.perf_counter()
+        validate_objects([obj], max_vertices=0)
+        return len(mesh.polygons), time.perf_counter() - start
+    finally:
+        bpy.data.objects.remove(obj)
+        bpy.data.meshes.remove(mesh)
+
+
+#[HELPER] Transform Apply
+# Channels reset by applying each transform component; rotation covers every rotation mode
+TRANSFORM_RESETS = {
+    "location": (("location", (0.0, 0.0, 0.0)),),
+    "rotation": (("rotation_euler", (0.0, 0.0, 0.0)), ("rotation_quaternion", (1.0, 0.0, 0.0, 0.0)),
+                 ("rotation_axis_angle", (0.0, 0.0, 1.0, 0.0))),
+    "scale": (("scale", (1.0, 1.0, 1.0)),),
+}
+
+
+def transform_coordinates(data, matrix):
+    """Transform the "co" of every element of `data` (vertices or shape key points) by a 4x4 matrix"""
+    co = np.empty(len(data) * 3, dtype=np.float32)
+    data.foreach_get("co", co)
+    co = co.reshape(-1, 3).astype(np.float64) @ matrix[:3, :3].T + matrix[:3, 3]
+    data.foreach_set("co", co.astype(np.float32).ravel())
+
+
+def transform_mesh(mesh, matrix):
+    """Bake a 4x4 matrix into the vertices and shape keys of `mesh`.
+
+    A mirroring matrix turns the faces inside out, so their winding is
+    reversed to keep the normals pointing outwards. Returns True when
+    the faces were flipped.
+    """
+    transform_coordinates(mesh.vertices, matrix)
+    if mesh.shape_keys is not None:
+        for key_block in mesh.shape_keys.key_blocks:
+            transform_coordinates(key_block.data, matrix)
+    flipped = bool(np.linalg.det(matrix[:3, :3]) < 0)
+    if flipped and len(mesh.polygons):
+        bm = bmesh.new()
+        try:
+            bm.from_mesh(mesh)
+            bmesh.ops.reverse_faces(bm, faces=bm.faces[:], flip_multires=True)
+            bm.to_mesh(mesh)
+        finally:
+            bm.free()
+    mesh.update()
+    return flipped
+
+
+def apply_transforms(objects, location=True, rotation=True, scale=True):
+    """Apply the chosen transform components of `objects` to their data, without operators.
+
+    Works like Object > Apply > Transform: the channels are reset, the
+    difference is baked into the mesh and children keep their place
+    through their parent inverse. A mesh shared by objects that end up
+    with different transforms (or by objects outside `objects`) gets a
+    copy per transform. Empties are reset; other object types and
+    library data are skipped. Returns counts of "objects", "meshes",
+    "copied", "flipped" and "skipped".
+    """
+    totals = {"objects": 0, "meshes": 0, "copied": 0, "flipped": 0, "skipped": 0}
+    resets = [reset for component, enabled in (("location", location), ("rotation", rotation), ("scale", scale))
+              if enabled for reset in TRANSFORM_RESETS[component]]
+    applied = []
+    for obj in dict.fromkeys(objects):
+        if obj.type not in {'MESH', 'EMPTY'} or obj.library is not None or \
+                (obj.data is not None and obj.data.library is not None):
+            totals["skipped"] += 1
+            continue
+        before = np.array(obj.matrix_basis)
+        for channel, value in resets:
+            setattr(obj, channel, value)
+        # The part of the old local matrix the reset channels no longer carry
+        matrix = np.linalg.inv(np.array(obj.matrix_basis)) @ before
+        if np.allclose(matrix, np.identity(4), atol=1e-7):
+            continue
+        applied.append((obj, matrix))
+        totals["objects"] += 1
     
-    filter_glob: StringProperty(
-        default="*.xml",
-        options={'HIDDEN'},
-    )
+    for obj, matrix in applied:
+        for child in obj.children:
+            child.matrix_parent_inverse = Matrix((matrix @ np.array(child.matrix_parent_inverse)).tolist())
+    
+    # Group mesh users by the matrix they apply; every distinct matrix needs its own copy of the mesh
+    groups = collections.defaultdict(dict)
+    for obj, matrix in applied:
+        if obj.type == 'MESH' and obj.data is not None:
+            key = tuple(np.round(matrix, 6).ravel().tolist())
+            groups[obj.data.as_pointer()].setdefault(key, (obj.data, matrix, []))[2].append(obj)
+    jobs = []
+    for clusters in groups.values():
+        mesh = next(iter(clusters.values()))[0]
+        outside = mesh.users - mesh.use_fake_user - sum(len(users) for _, _, users in clusters.values())
+        # Copies are taken before any user of the original mesh is transformed
+        for index, (_, matrix, users) in enumerate(clusters.values()):
+            target = mesh
+            if index or outside > 0:
+                target = mesh.copy()
+                for obj in users:
+                    obj.data = target
+                totals["copied"] += 1
+            jobs.append((target, matrix))
+    for mesh, matrix in jobs:
+        totals["flipped"] += transform_mesh(mesh, matrix)
+        totals["meshes"] += 1
+    return totals
+
+
+#[HELPER] UV Repair
+UV_NORMALIZE_ITEMS = [
+    ('NONE', "Keep", "Leave the UV positions as they are"),
+    ('WRAP', "Wrap", "Move each UV layer by whole tiles so its center lies in the 0-1 square; tiling textures look the same"),
+    ('FIT', "Fit to 0-1", "Scale and move each UV layer so it fills the 0-1 square"),
+]
+
+
+def repair_uv_array(uvs, normalize='WRAP', flip_v=False):
+    """Repair, normalize and flip an (N, 2) UV array in place; returns the number of repaired UVs"""
+    finite = np.isfinite(uvs).all(axis=1)
+    repaired = int(len(uvs) - np.count_nonzero(finite))
+    if normalize != 'NONE' and repaired < len(uvs):
+        low, high = uvs[finite].min(axis=0), uvs[finite].max(axis=0)
+        if normalize == 'WRAP':
+            uvs -= np.floor((low + high) * 0.5)
+        else:
+            uvs -= low
+            uvs /= np.where(high - low > 0, high - low, 1.0)
+    if repaired:
+        uvs[~finite] = 0.0
+    if flip_v:
+        uvs[:, 1] = 1.0 - uvs[:, 1]
+    return repaired
+
+
+def planar_uvs(mesh):
+    """UVs projected along the shortest axis of the mesh bounds, scaled into the 0-1 square"""
+    co, loop_verts, _, _, _ = mesh_arrays(mesh)
+    co = np.where(np.isfinite(co), co, 0.0)
+    if not len(co):
+        return np.zeros((len(loop_verts), 2))
+    extent = co.max(axis=0) - co.min(axis=0)
+    axes = np.sort(np.argsort(extent)[1:])
+    uvs = co[loop_verts][:, axes]
+    repair_uv_array(uvs, 'FIT')
+    return uvs
+
+
+def repair_mesh_uvs(mesh, normalize='WRAP', flip_v=False, all_layers=True, create_missing=True):
+    """Repair the UV layers of `mesh` with one foreach_get/foreach_set per layer.
+
+    Non-finite UVs are zeroed, layers are normalized and optionally
+    flipped vertically, and a mesh without UVs gets a planar projection.
+    Returns {"layers": fixed count, "repaired": UV count, "created": 0 or 1}.
+    """
+    result = {"layers": 0, "repaired": 0, "created": 0}
+    if not len(mesh.loops):
+        return result
+    if not len(mesh.uv_layers):
+        if not create_missing:
+            return result
+        uv_layer = mesh.uv_layers.new(name="UVMap")
+        uv_layer.data.foreach_set("uv", planar_uvs(mesh).astype(np.float32).ravel())
+        result["created"] = 1
+        return result
     
+    layers = list(mesh.uv_layers) if all_layers else [mesh.uv_layers.active]
+    for uv_layer in layers:
+        uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+        uv_layer.data.foreach_get("uv", uvs)
+        uvs = uvs.reshape(-1, 2).astype(np.float64)
+        result["repaired"] += repair_uv_array(uvs, normalize, flip_v)
+        uv_layer.data.foreach_set("uv", uvs.astype(np.float32).ravel())
+        result["layers"] += 1
+    return result
+
+
+def repair_uvs(objects, normalize='WRAP', flip_v=False, all_layers=True, create_missing=True):
+    """Repair the UVs of the meshes of `objects`, each shared mesh once; returns totals plus mesh counts"""
+    totals = {"meshes": 0, "layers": 0, "repaired": 0, "created": 0, "skipped": 0}
+    meshes = {}
+    for obj in objects:
+        if obj.type == 'MESH' and obj.data is not None:
+            meshes[obj.data.as_pointer()] = obj.data
+    for mesh in meshes.values():
+        if mesh.library is not None:
+            totals["skipped"] += 1
+            continue
+        result = repair_mesh_uvs(mesh, normalize, flip_v, all_layers, create_missing)
+        for key, value in result.items():
+            totals[key] += value
+        totals["meshes"] += 1
+    return totals
+
+
+#[HELPER] Batch Options
+class BatchOptions:
+    """Mixin with the logging, manifest, journal and file index properties of every batch operator"""
+
     wait_time: IntProperty(
-        name="Wait Time (seconds)",
-        description="Time to wait after import to ensure processing completes",
+        name="Import Timeout (seconds)",
+        description="Longest time to wait for an asynchronous importer; synchronous imports continue as soon as their objects exist",
         default=2,
         min=0,
         max=10
@@ -94,26 +3110,351 @@ class BatchConvertXML(bpy.types.Operator, ImportHelper):
         default=True
     )
     
-    def safe_delete_all(self, context):
-        """Safely delete all objects"""
-        try:
-            # First ensure we're in object mode
-            if context.object and context.object.mode != 'OBJECT':
-                bpy.ops.object.mode_set(mode='OBJECT')
-            
-            # Select all objects
-            for obj in context.scene.objects:
-                obj.select_set(True)
-            
-            # Delete selected objects if any
-            if any(obj.select_get() for obj in context.scene.objects):
-                bpy.ops.object.delete()
-            
-            return True
-        except Exception as e:
-            if self.debug_mode:
-                print(f"Error in safe_delete_all: {str(e)}")
-            return False
+    log_level: EnumProperty(
+        name="Log Level",
+        description="Amount of detail written to the log file",
+        items=LOG_LEVEL_ITEMS,
+        default='INFO'
+    )
+    
+    json_log: BoolProperty(
+        name="JSON Lines Log",
+        description="Also write one JSON record per file, including timings, next to the log file",
+        default=False
+    )
+    
+    performance_report: BoolProperty(
+        name="Performance Report",
+        description="Time every stage of every file and write a performance report to the output folder",
+        default=True
+    )
+    
+    slowest_count: IntProperty(
+        name="Slowest Files Listed",
+        description="Number of slowest files listed in the performance report",
+        default=10,
+        min=0,
+        max=1000
+    )
+    
+    skip_unchanged: BoolProperty(
+        name="Skip Unchanged",
+        description="Skip inputs whose outputs are up to date according to the manifest in the output folder",
+        default=True
+    )
+    
+    use_content_hash: BoolProperty(
+        name="Compare Content Hash",
+        description="Hash file contents when a timestamp changed but the size did not, instead of reconverting",
+        default=False
+    )
+    
+    use_journal: BoolProperty(
+        name="Crash-Safe Journal",
+        description="Journal every file so a crashed run resumes where it stopped and quarantines the file that crashed it",
+        default=True
+    )
+    
+    retry_quarantined: BoolProperty(
+        name="Retry Quarantined Files",
+        description="Process files that crashed Blender in an earlier run instead of skipping them",
+        default=False
+    )
+    
+    use_file_index: BoolProperty(
+        name="Cache File Index",
+        description="Store the folder listing in the source folder so later runs only rescan changed folders",
+        default=True
+    )
+
+
+class ExportGroupOptions:
+    """Mixin with the properties of the batch operators that export assets in groups (see ExportGroup)"""
+
+    group_size: IntProperty(
+        name="Assets per Export",
+        description="Import this many assets side by side and write their FBX files in one export pass (1 = one export per file)",
+        default=1,
+        min=1,
+        max=256
+    )
+    
+    group_max_objects: IntProperty(
+        name="Group Object Budget",
+        description="Export the group early once the scene holds this many objects (0 = no limit)",
+        default=5000,
+        min=0,
+        max=1000000
+    )
+    
+    group_max_memory_mb: IntProperty(
+        name="Group Memory Budget (MB)",
+        description="Export the group early once Blender uses this much memory (0 = no limit)",
+        default=4096,
+        min=0,
+        max=1048576
+    )
+
+
+class AssetFixOptions:
+    """Mixin with the per-asset fix, LOD and validation properties read by prepare_assets()"""
+
+    apply_transforms: BoolProperty(
+        name="Apply Transformations",
+        description="Bake the location, rotation and scale of the imported objects into their meshes before export",
+        default=False
+    )
+    
+    fix_uvs: BoolProperty(
+        name="Fix UVs",
+        description="Repair broken UVs, normalize the UV layers and give meshes without UVs a planar projection before export",
+        default=False
+    )
+    
+    uv_normalize: EnumProperty(
+        name="UV Normalize",
+        description="How Fix UVs brings UV layers back to the 0-1 square",
+        items=UV_NORMALIZE_ITEMS,
+        default='WRAP'
+    )
+    
+    flip_uvs: BoolProperty(
+        name="Flip UVs Vertically",
+        description="Mirror the UVs vertically (V = 1 - V) when fixing them",
+        default=False
+    )
+    
+    fix_transparency: BoolProperty(
+        name="Fix Transparency",
+        description="Make the imported materials fully opaque before export, like Simplify Transparency",
+        default=False
+    )
+    
+    optimize_geometry: BoolProperty(
+        name="Optimize Geometry",
+        description="Merge duplicate vertices and remove degenerate faces and unused vertices before export",
+        default=False
+    )
+    
+    merge_distance: FloatProperty(
+        name="Merge Distance",
+        description="Merge vertices closer than this when optimizing geometry",
+        default=0.0001,
+        min=0.0,
+        precision=5
+    )
+    
+    generate_lods: BoolProperty(
+        name="Generate LODs",
+        description="Add a decimated LOD chain under an LOD group for every mesh before export",
+        default=False
+    )
+    
+    lod_ratios: StringProperty(
+        name="LOD Ratios",
+        description="Comma-separated face ratios of LOD1, LOD2, ... relative to the original mesh",
+        default="0.5, 0.25, 0.1"
+    )
+    
+    lod_screen_sizes: StringProperty(
+        name="LOD Screen Sizes",
+        description="Comma-separated screen size at which each LOD level takes over, stored on the LOD objects",
+        default="0.5, 0.25, 0.1"
+    )
+    
+    lod_min_faces: IntProperty(
+        name="LOD Minimum Faces",
+        description="Leave meshes with fewer faces than this without LODs",
+        default=100,
+        min=0
+    )
+    
+    validate_model: BoolProperty(
+        name="Validate Before Export",
+        description="Check every asset for broken geometry, UVs and textures and write a .validation.json report next to its output",
+        default=False
+    )
+    
+    skip_invalid: BoolProperty(
+        name="Skip Invalid Assets",
+        description="Do not export assets whose validation found errors; they are counted as failed",
+        default=False
+    )
+    
+    max_vertices: IntProperty(
+        name="Max Vertices per Mesh",
+        description="Report meshes with more vertices than this as errors during validation (0 = no limit)",
+        default=65535,
+        min=0
+    )
+
+
+class WorkerOptions:
+    """Mixin with the properties of the batch operators that can split their files across worker processes"""
+
+    use_workers: BoolProperty(
+        name="Parallel Workers",
+        description="Split the files across several headless Blender processes",
+        default=False
+    )
+    
+    worker_count: IntProperty(
+        name="Worker Count",
+        description="Number of worker processes (0 = one per CPU core)",
+        default=0,
+        min=0,
+        max=256
+    )
+    
+    job_path: StringProperty(
+        options={'HIDDEN', 'SKIP_SAVE'},
+    )
+
+
+#[HELPER] Asset Preparation
+class AssetRejected(ValueError):
+    """Raised by prepare_assets() when validation holds an asset back"""
+
+
+def prepare_assets(context, operator, objects, output_path, source, log, timer, lod_settings=None):
+    """Run the per-asset fixes enabled on `operator` over the imported `objects` of one file.
+
+    Transforms and UVs are fixed first, then transparency and geometry; LODs
+    are added last and validation writes its report next to `output_path`.
+    Returns the objects to export, LOD objects included. Raises AssetRejected
+    when validation finds errors and the operator skips invalid assets.
+    """
+    objects = list(objects)
+    
+    # Bake object transforms into the meshes and repair the UVs before the other fixes
+    if operator.apply_transforms:
+        with timer.stage("transforms"):
+            applied = apply_transforms(objects)
+        log.write(f"Transforms: applied {applied['objects']} objects to {applied['meshes']} meshes "
+                  f"({applied['copied']} copied, {applied['flipped']} flipped)\n")
+    if operator.fix_uvs:
+        with timer.stage("uvs"):
+            repaired = repair_uvs(objects, operator.uv_normalize, operator.flip_uvs)
+        log.write(f"UVs: fixed {repaired['layers']} layers, repaired {repaired['repaired']} UVs, "
+                  f"created {repaired['created']} layers\n")
+    
+    # Make the materials of this asset opaque before export
+    if operator.fix_transparency:
+        with timer.stage("transparency"):
+            fixed = simplify_transparency(object_materials(objects))
+        log.write(f"Transparency: fixed {len(fixed)} materials\n")
+    
+    # Merge duplicate vertices and drop degenerate faces before export
+    if operator.optimize_geometry:
+        with timer.stage("optimize"):
+            optimized = optimize_meshes(objects, operator.merge_distance)
+        log.write(f"Geometry: removed {optimized['vertices']} vertices and {optimized['faces']} faces "
+                  f"from {optimized['meshes']} meshes ({optimized['skipped']} skipped)\n")
+    
+    # Add a decimated LOD chain for every mesh; the new objects are exported with the asset
+    if lod_settings:
+        with timer.stage("lods"):
+            lod_objects = generate_lod_chains(context, objects, *lod_settings, operator.lod_min_faces)
+        objects.extend(lod_objects)
+        select_only(context, objects)
+        log.write(f"LODs: created {len(lod_objects)} objects\n")
+    
+    # Validate the asset before export and hold it back on errors if requested
+    if operator.validate_model:
+        with timer.stage("validate"):
+            validation = validate_objects(objects, operator.max_vertices)
+            write_validation_report(os.path.splitext(output_path)[0] + ".validation.json", validation, source)
+        log.write(f"Validation: {validation['errors']} errors, {validation['warnings']} warnings\n")
+        if validation["errors"] and operator.skip_invalid:
+            raise AssetRejected(f"{validation['errors']} validation errors")
+    
+    return objects
+
+
+#[HELPER] Sollumz Batch Conversion
+class SollumzBatch(BatchOptions, ExportGroupOptions, AssetFixOptions, WorkerOptions):
+    """Mixin with the properties and conversion loop of the Sollumz XML batch operators.
+
+    Subclasses set `output_name`, `log_name`, `log_title`, `report_title`,
+    `asset_label` and `asset_suffix` and provide the Sollumz parser and
+    object builder through sollumz_entry_points(); find_files(),
+    stage_inputs() and import_name() cover the remaining differences.
+    The manifest, journal, workers and grouping all run here and the
+    per-asset fixes run through prepare_assets(), so the converters stay
+    in step with each other and with the Clean and GLB batches.
+    """
+
+    use_parse_cache: BoolProperty(
+        name="Cache Parsed XML",
+        description="Keep parsed XML on disk so unchanged files are loaded instead of parsed again",
+        default=True
+    )
+    
+    parse_cache_dir: StringProperty(
+        name="Parse Cache Folder",
+        description="Folder of the parse cache (empty = a hidden folder inside the output folder)",
+        default="",
+        subtype='DIR_PATH'
+    )
+    
+    parse_cache_mb: IntProperty(
+        name="Parse Cache Size (MB)",
+        description="Least recently used entries are deleted once the parse cache grows past this size",
+        default=2048,
+        min=16,
+        max=1048576
+    )
+    
+    memory_limit_mb: IntProperty(
+        name="Memory Limit (MB)",
+        description="Once Blender uses this much memory, save progress and continue the remaining files in a fresh Blender process (0 = no limit)",
+        default=0,
+        min=0,
+        max=1048576
+    )
+    
+    use_isolation: BoolProperty(
+        name="Isolate Files",
+        description="Run small groups of files in their own Blender process, killed when it hangs or uses too much memory",
+        default=False
+    )
+    
+    files_per_process: IntProperty(
+        name="Files per Process",
+        description="Number of files handled by each isolated process",
+        default=1,
+        min=1,
+        max=100
+    )
+    
+    file_timeout: IntProperty(
+        name="File Timeout (seconds)",
+        description="Kill an isolated process that spends longer than this on one file (0 = no limit)",
+        default=600,
+        min=0
+    )
+    
+    process_memory_cap_mb: IntProperty(
+        name="Process Memory Cap (MB)",
+        description="Kill an isolated process whose memory grows past this size (0 = no limit)",
+        default=0,
+        min=0
+    )
+    
+    def sollumz_entry_points(self, sollumz_module):
+        """(parse(path), create(xml, path, name)) of the subclass's asset type"""
+        raise NotImplementedError
+    
+    def find_files(self, index, log):
+        """XML inputs of a parent run, from the scanned source folder"""
+        raise NotImplementedError
+    
+    def stage_inputs(self, index, output_folder, log, timer):
+        """Place extra inputs such as textures in the output folder before converting"""
+    
+    def import_name(self, xml_file, base_filename):
+        """Name handed to the Sollumz object builder"""
+        return base_filename
     
     def execute(self, context):
         source_folder = self.directory
@@ -121,33 +3462,31 @@ class BatchConvertXML(bpy.types.Operator, ImportHelper):
             self.report({'ERROR'}, "No source folder selected!")
             return {'CANCELLED'}
         
+        # Worker processes receive their shard and log location from the job file
+        job = load_worker_job(self.job_path) if self.job_path else None
+        
         # Create log file if debug mode is enabled
-        log_path = None
-        if self.debug_mode:
-            log_path = os.path.join(source_folder, "conversion_log.txt")
-            with open(log_path, 'w') as log_file:
-                log_file.write("Jarvis Tools XML Conversion Log\n")
-                log_file.write("===============================\n\n")
-                log_file.write(f"Started conversion at: {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                log_file.write(f"Blender version: {bpy.app.version_string}\n")
-                log_file.write(f"Wait time: {self.wait_time} seconds\n\n")
+        log = open_batch_log(self, job, os.path.join(source_folder, self.log_name))
+        return self.start_batch(context, log, self.run_batch(context, source_folder, job, log), job)
+    
+    def run_batch(self, context, source_folder, job, log):
+        timer = StageTimer()
+        log.write(f"{self.log_title}\n", 'SUMMARY')
+        log.write("=" * len(self.log_title) + "\n\n", 'SUMMARY')
+        log.write(f"Started conversion at: {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n", 'SUMMARY')
+        log.write(f"Blender version: {bpy.app.version_string}\n", 'SUMMARY')
+        log.write(f"Import timeout: {self.wait_time} seconds\n\n", 'SUMMARY')
         
         # Attempt to import Sollumz by its known dotted module name
         try:
             sollumz_module = importlib.import_module("bl_ext.user_default.sollumz")
-            YFT = sollumz_module.cwxml.fragment.YFT
-            create_fragment_obj = sollumz_module.yft.yftimport.create_fragment_obj
+            parse, create_asset = self.sollumz_entry_points(sollumz_module)
             
-            if log_path:
-                with open(log_path, 'a') as log_file:
-                    log_file.write("Successfully imported Sollumz from bl_ext.user_default.sollumz\n")
+            log.write("Successfully imported Sollumz from bl_ext.user_default.sollumz\n")
         except Exception as e:
             error_msg = f"Failed to import Sollumz modules from bl_ext.user_default.sollumz: {str(e)}"
             self.report({'ERROR'}, error_msg)
-            if log_path:
-                with open(log_path, 'a') as log_file:
-                    log_file.write(f"ERROR: {error_msg}\n")
-                    log_file.write("TRACE: " + traceback.format_exc() + "\n")
+            log.exception(error_msg)
             return {'CANCELLED'}
         
         # Optional: Check if we have access to Sollumz import functionality
@@ -156,203 +3495,214 @@ class BatchConvertXML(bpy.types.Operator, ImportHelper):
             return {'CANCELLED'}
         
         # Create output folder
-        output_folder = os.path.join(source_folder, "Converted")
+        output_folder = os.path.join(source_folder, self.output_name)
         os.makedirs(output_folder, exist_ok=True)
         
-        # Find XML files
-        xml_files = ( 
-            glob.glob(os.path.join(source_folder, "**", "*.yft.xml"), recursive=True) +
-            glob.glob(os.path.join(source_folder, "**", "*.ydr"), recursive=True)
-            )
-        texture_files = (
-            glob.glob(os.path.join(source_folder, "**", "*.png"), recursive=True) +
-            glob.glob(os.path.join(source_folder, "**", "*.jpg"), recursive=True) +
-            glob.glob(os.path.join(source_folder, "**", "*.jpeg"), recursive=True) +
-            glob.glob(os.path.join(source_folder, "**", "*.tga"), recursive=True)
-        )
+        # Find XML files (workers only handle their shard; inputs are staged by the parent)
+        index = None
+        if job:
+            xml_files = job["files"]
+        else:
+            index = FileIndex(source_folder, (self.output_name,), self.use_file_index).scan()
+            log.write(f"Scanned {index.listed} folders, {index.reused} unchanged from the file index\n")
+            xml_files = self.find_files(index, log)
         
         if not xml_files:
-            self.report({'WARNING'}, "No YFT XML files found in the selected folder.")
+            self.report({'WARNING'}, f"No {self.asset_label} XML files found in the selected folder.")
             return {'CANCELLED'}
         
         # Log file list if debug mode is enabled
-        if log_path:
-            with open(log_path, 'a') as log_file:
-                log_file.write(f"\nFound {len(xml_files)} YFT XML files to process:\n")
-                for xml in xml_files:
-                    log_file.write(f"  - {xml}\n")
-                log_file.write(f"\nFound {len(texture_files)} texture files\n")
-        
-        # Copy textures to Converted folder
-        for tex in texture_files:
-            try:
-                dest_path = os.path.join(output_folder, os.path.basename(tex))
-                shutil.copy(tex, dest_path)
-                self.report({'INFO'}, f"Copied texture: {os.path.basename(tex)}")
-            except Exception as e:
-                self.report({'ERROR'}, f"Failed copying texture {os.path.basename(tex)}: {e}")
+        log.write(f"\nFound {len(xml_files)} {self.asset_label} XML files to process:\n")
+        if log.enabled_for('DEBUG'):
+            for xml in xml_files:
+                log.write(f"  - {xml}\n", 'DEBUG')
+        if index:
+            self.stage_inputs(index, output_folder, log, timer)
+        
+        # Check the LOD chain before any file is touched
+        try:
+            lod_settings = lod_chain_settings(self) if self.generate_lods else None
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        
+        # Skip inputs that were already converted with the same settings, resume an
+        # interrupted run and leave out files that crashed Blender before
+        manifest = None
+        resume = None
+        skipped_files = []
+        if not job:
+            manifest = BatchManifest(source_folder, output_folder, operator_options(self, MANIFEST_IGNORED),
+                                     self.use_content_hash)
+            resume = BatchResume(self, source_folder, output_folder, log)
+            xml_files = resume.filter(xml_files, manifest)
+            skipped_files = list(resume.resumed)
+            if self.skip_unchanged:
+                xml_files, unchanged_files = manifest.filter(xml_files)
+                skipped_files += unchanged_files
+                log.write(f"\nSkipping {len(skipped_files)} unchanged files, {len(xml_files)} to convert\n")
+        
+        if (self.use_workers or self.use_isolation) and xml_files and not job:
+            result = yield from run_worker_farm(self, self.bl_idname, source_folder, xml_files,
+                                     self.worker_count if self.use_workers else 1, log, resume.journal_dir,
+                                     **isolation_options(self))
+            resume.add_crashed(result["crashed"])
+            manifest.record_outputs(result["outputs"])
+            manifest.save()
+            resume.finish(BatchJournal())
+            timer.merge(result["timings"])
+            if self.performance_report:
+                write_performance_report(output_folder, self.report_title, timer, self.slowest_count)
+            return self.finish_batch(log, len(xml_files), result["success"],
+                                     result["error"] + len(resume.quarantined), len(skipped_files),
+                                     len(result["cancelled"]))
         
         success_count = 0
         error_count = 0
+        outputs = {}
+        failed = []
         
-        # Process each XML file
-        for xml_file in xml_files:
-            if log_path:
-                with open(log_path, 'a') as log_file:
-                    log_file.write(f"\n{'='*50}\n")
-                    log_file.write(f"Processing: {xml_file}\n")
-                    log_file.write(f"{'='*50}\n")
+        # Process each XML file, loading unchanged ones from the parse cache
+        parse_cache = None
+        if self.use_parse_cache:
+            parse_cache = ParseCache(self.parse_cache_dir or os.path.join(output_folder, PARSE_CACHE_NAME),
+                                     f"{self.asset_label}-{sollumz_version(sollumz_module)}-{sys.version_info[0]}.{sys.version_info[1]}",
+                                     self.parse_cache_mb)
+            parse = parse_cache.wrap(parse)
+        remaining = []
+        cancelled = []
+        journal = resume.journal() if resume else BatchJournal(job.get("journal_path"),
+                                                                settings_digest(operator_options(self, MANIFEST_IGNORED)))
+        group = ExportGroup(output_folder, self.group_size, self.group_max_objects, self.group_max_memory_mb, journal)
+        for position, xml_file in enumerate(journal.iterate(xml_files, outputs, failed, group)):
+            # Past the memory limit: stop here and let a fresh Blender process convert the rest
+            if position and memory_exceeded(self.memory_limit_mb):
+                remaining = xml_files[position:]
+                break
             
-            # Set up output paths
+            # Hand control back to the UI between files; Esc stops the batch here
+            report_batch_progress(position, len(xml_files), xml_file)
+            yield
+            if batch_cancelled():
+                cancelled = xml_files[position:]
+                break
+            
+            log.write(f"\n{'='*50}\n")
+            log.write(f"Processing: {xml_file}\n")
+            log.write(f"{'='*50}\n")
+            file_start = time.perf_counter()
+            timer.start_file(xml_file)
+            
+            # Set up output paths; the asset suffix (.yft, .ydr) is dropped too
             base_filename = os.path.splitext(os.path.basename(xml_file))[0]
-            # For YFT files, remove the .yft part too
-            if base_filename.endswith(".yft"):
-                base_filename = base_filename[:-4]
+            if base_filename.endswith(self.asset_suffix):
+                base_filename = base_filename[:-len(self.asset_suffix)]
             
             output_fbx = os.path.join(output_folder, base_filename + ".fbx")
             
             self.report({'INFO'}, f"Processing file: {xml_file}")
             
-            # Clear the scene first
-            self.safe_delete_all(context)
-            
-            # Also delete all collections except the default "Scene Collection"
-            for collection in list(bpy.data.collections):
-                bpy.data.collections.remove(collection)
-                
-            # Clear unused data blocks
-            for block in bpy.data.meshes:
-                if block.users == 0:
-                    bpy.data.meshes.remove(block)
-            for block in bpy.data.materials:
-                if block.users == 0:
-                    bpy.data.materials.remove(block)
-            for block in bpy.data.textures:
-                if block.users == 0:
-                    bpy.data.textures.remove(block)
-            for block in bpy.data.images:
-                if block.users == 0:
-                    bpy.data.images.remove(block)
-            
-            bpy.context.view_layer.update()
+            # Clear the scene and every data block left by the previous file or export group
+            if not group.assets:
+                with timer.stage("reset"):
+                    reset_scene(context)
+            before = group.snapshot() if group.enabled else None
             
             # Record existing data
-            existing_objs = set(bpy.data.objects)
-            existing_meshes = set(bpy.data.meshes)
-            existing_collections = set(bpy.data.collections)
+            existing_objs = id_pointers(bpy.data.objects)
+            existing_meshes = id_pointers(bpy.data.meshes)
+            existing_collections = id_pointers(bpy.data.collections)
             
-            if log_path:
-                with open(log_path, 'a') as log_file:
-                    log_file.write(f"Before import - Objects: {len(existing_objs)}, ")
-                    log_file.write(f"Meshes: {len(existing_meshes)}, ")
-                    log_file.write(f"Collections: {len(existing_collections)}\n")
+            log.write(f"Before import - Objects: {len(existing_objs)}, ")
+            log.write(f"Meshes: {len(existing_meshes)}, ")
+            log.write(f"Collections: {len(existing_collections)}\n")
             
-            # Attempt direct import with create_fragment_obj
-            import_success = False
-            frag_obj = None
+            # Attempt direct import with the Sollumz object builder
+            asset_obj = None
             
             try:
-                # Skip _hi.yft.xml files - handle the base version only
-                if "_hi.yft.xml" in xml_file:
-                    if log_path:
-                        with open(log_path, 'a') as log_file:
-                            log_file.write("Skipping _hi.yft.xml file - will be handled with base file\n")
-                    continue
-                
-                # Load the YFT XML
-                name = os.path.splitext(os.path.basename(xml_file))[0]
-                if name.endswith(".yft"):
-                    name = name[:-4]
+                # Load the XML
+                with timer.stage("parse"):
+                    asset_xml = parse(xml_file)
                 
-                yft_xml = YFT.from_xml_file(xml_file)
+                # Create the asset object
+                with timer.stage("create"):
+                    asset_obj = create_asset(asset_xml, xml_file, self.import_name(xml_file, base_filename))
                 
-                # Create the fragment object
-                frag_obj = create_fragment_obj(yft_xml, xml_file, name)
-                
-                if frag_obj:
-                    import_success = True
-                    if log_path:
-                        with open(log_path, 'a') as log_file:
-                            log_file.write(f"Direct import succeeded, created object: {frag_obj.name}\n")
+                if asset_obj:
+                    log.write(f"Direct import succeeded, created object: {asset_obj.name}\n")
                 else:
-                    if log_path:
-                        with open(log_path, 'a') as log_file:
-                            log_file.write("Direct import returned None object\n")
-                
-                # Wait to ensure import completes
-                if self.wait_time > 0:
-                    if log_path:
-                        with open(log_path, 'a') as log_file:
-                            log_file.write(f"Waiting {self.wait_time} seconds for import to complete...\n")
-                    time.sleep(self.wait_time)
+                    log.write("Direct import returned None object\n")
                 
-                bpy.context.view_layer.update()
+                # Make sure the import is complete before collecting its objects
+                with timer.stage("sync"):
+                    ready = wait_for_import(context, len(existing_objs), len(existing_meshes), asset_obj, self.wait_time)
+                if not ready:
+                    log.write(f"Import produced no data within {self.wait_time} seconds\n")
             
             except Exception as e:
                 error_msg = f"Failed to import {xml_file}: {str(e)}"
                 self.report({'ERROR'}, error_msg)
-                if log_path:
-                    with open(log_path, 'a') as log_file:
-                        log_file.write(f"ERROR: {error_msg}\n")
-                        log_file.write("TRACE: " + traceback.format_exc() + "\n")
+                log.exception(error_msg)
+                log.record(file=xml_file, status="failed", stage="import", error=str(e),
+                           seconds=time.perf_counter() - file_start, stages=timer.current)
+                failed.append(xml_file)
+                group.discard(before)
                 error_count += 1
                 continue
             
             # Record what's new
-            new_objs = [obj for obj in bpy.data.objects if obj not in existing_objs]
-            new_meshes = [mesh for mesh in bpy.data.meshes if mesh not in existing_meshes]
-            new_collections = [coll for coll in bpy.data.collections if coll not in existing_collections]
-            
-            if log_path:
-                with open(log_path, 'a') as log_file:
-                    log_file.write(f"After import - Objects: {len(bpy.data.objects)}, ")
-                    log_file.write(f"Meshes: {len(bpy.data.meshes)}, ")
-                    log_file.write(f"Collections: {len(bpy.data.collections)}\n")
-                    log_file.write(f"New objects: {len(new_objs)}, ")
-                    log_file.write(f"New meshes: {len(new_meshes)}, ")
-                    log_file.write(f"New collections: {len(new_collections)}\n\n")
-                    
-                    # Log scene objects
-                    log_file.write("Objects in scene:\n")
-                    for obj in bpy.context.scene.objects:
-                        log_file.write(f"  - {obj.name} (Type: {obj.type})\n")
-                    
-                    # Log collections
-                    log_file.write("\nCollections:\n")
-                    for coll in bpy.data.collections:
-                        log_file.write(f"  - {coll.name}: {len(coll.objects)} objects\n")
-                        for obj in coll.objects:
-                            log_file.write(f"    * {obj.name} (Type: {obj.type})\n")
-                    
-                    # Mesh objects check
-                    mesh_objs = [obj for obj in bpy.data.objects if obj.type == 'MESH']
-                    log_file.write(f"\nMesh objects in data: {len(mesh_objs)}\n")
-                    for obj in mesh_objs:
-                        log_file.write(f"  - {obj.name} (Vertices: {len(obj.data.vertices)})\n")
+            new_objs = new_id_blocks(bpy.data.objects, existing_objs)
+            new_meshes = new_id_blocks(bpy.data.meshes, existing_meshes)
+            new_collections = new_id_blocks(bpy.data.collections, existing_collections)
+            
+            log.write(f"After import - Objects: {len(bpy.data.objects)}, ")
+            log.write(f"Meshes: {len(bpy.data.meshes)}, ")
+            log.write(f"Collections: {len(bpy.data.collections)}\n")
+            log.write(f"New objects: {len(new_objs)}, ")
+            log.write(f"New meshes: {len(new_meshes)}, ")
+            log.write(f"New collections: {len(new_collections)}\n\n")
+            
+            # The full scene dump is only written at DEBUG level
+            if log.enabled_for('DEBUG'):
+                # Log scene objects
+                log.write("Objects in scene:\n", 'DEBUG')
+                for obj in bpy.context.scene.objects:
+                    log.write(f"  - {obj.name} (Type: {obj.type})\n", 'DEBUG')
+                
+                # Log collections
+                log.write("\nCollections:\n", 'DEBUG')
+                for coll in bpy.data.collections:
+                    log.write(f"  - {coll.name}: {len(coll.objects)} objects\n", 'DEBUG')
+                    for obj in coll.objects:
+                        log.write(f"    * {obj.name} (Type: {obj.type})\n", 'DEBUG')
+                
+                # Mesh objects check
+                mesh_objs = [obj for obj in bpy.data.objects if obj.type == 'MESH']
+                log.write(f"\nMesh objects in data: {len(mesh_objs)}\n", 'DEBUG')
+                for obj in mesh_objs:
+                    log.write(f"  - {obj.name} (Vertices: {len(obj.data.vertices)})\n", 'DEBUG')
             
             self.report({'INFO'}, f"After import of {xml_file}: {len(new_objs)} new objects detected.")
             
             # If we have new meshes but no objects, create objects for them
             if not new_objs and new_meshes:
-                if log_path:
-                    with open(log_path, 'a') as log_file:
-                        log_file.write("No new objects but found new meshes. Creating objects for them...\n")
+                log.write("No new objects but found new meshes. Creating objects for them...\n")
                 for mesh in new_meshes:
                     obj = bpy.data.objects.new(f"{base_filename}_{mesh.name}", mesh)
                     bpy.context.scene.collection.objects.link(obj)
                     new_objs.append(obj)
             
             # Make sure objects in new collections are accounted for
-            for coll in new_collections:
-                for obj in coll.objects:
-                    if obj not in new_objs:
-                        new_objs.append(obj)
+            add_collection_objects(new_objs, new_collections)
             
             if not new_objs:
                 self.report({'WARNING'}, f"No objects imported from {xml_file}. Skipping export.")
-                if log_path:
-                    with open(log_path, 'a') as log_file:
-                        log_file.write("WARNING: No objects imported. Skipping export.\n")
+                log.write("WARNING: No objects imported. Skipping export.\n", 'WARNING')
+                log.record(file=xml_file, status="failed", stage="import", error="no objects imported",
+                           seconds=time.perf_counter() - file_start, stages=timer.current)
+                failed.append(xml_file)
+                group.discard(before)
                 error_count += 1
                 continue
             
@@ -362,73 +3712,325 @@ class BatchConvertXML(bpy.types.Operator, ImportHelper):
                 obj.hide_viewport = False
                 obj.hide_render = False
             
-            # Select all new objects for export
-            for obj in bpy.context.scene.objects:
-                obj.select_set(obj in new_objs)
+            # Select all new objects for export and set an active object
+            select_only(context, new_objs)
+            
+            # Fix, extend and validate the asset; a step that fails only fails this file
+            try:
+                new_objs = prepare_assets(context, self, new_objs, output_fbx, xml_file, log, timer, lod_settings)
+            except AssetRejected as e:
+                log.record(file=xml_file, status="failed", stage="validate", error=str(e),
+                           seconds=time.perf_counter() - file_start, stages=timer.current)
+                failed.append(xml_file)
+                group.discard(before)
+                error_count += 1
+                continue
+            except Exception as e:
+                error_msg = f"Failed to prepare {xml_file}: {e}"
+                self.report({'ERROR'}, error_msg)
+                log.exception(error_msg)
+                log.record(file=xml_file, status="failed", stage="prepare", error=str(e),
+                           seconds=time.perf_counter() - file_start, stages=timer.current)
+                failed.append(xml_file)
+                group.discard(before)
+                error_count += 1
+                continue
             
-            # Set an active object
-            if new_objs:
-                context.view_layer.objects.active = new_objs[0]
+            # Grouped mode: queue the asset and export it together with the rest of its group
+            if group.enabled:
+                group.add(context, xml_file, output_fbx, new_objs, before, log, timer,
+                          seconds=time.perf_counter() - file_start, stages=timer.current)
+                continue
             
             try:
-                if log_path:
-                    with open(log_path, 'a') as log_file:
-                        log_file.write(f"Exporting to: {output_fbx}\n")
-                        log_file.write(f"Selected objects: {len([obj for obj in bpy.context.scene.objects if obj.select_get()])}\n")
+                log.write(f"Exporting to: {output_fbx}\n")
+                log.write(f"Selected objects: {len(context.selected_objects)}\n")
                 
                 # Export to FBX
-                bpy.ops.export_scene.fbx(
-                    filepath=output_fbx,
-                    use_selection=True,
-                    use_mesh_modifiers=False,
-                    path_mode='COPY',
-                    embed_textures=True,  # Attempt to embed textures
-                    mesh_smooth_type='FACE'
-                )
+                with timer.stage("export"):
+                    bpy.ops.export_scene.fbx(
+                        filepath=output_fbx,
+                        use_selection=True,
+                        use_mesh_modifiers=False,
+                        path_mode='COPY',
+                        embed_textures=True,  # Attempt to embed textures
+                        mesh_smooth_type='FACE'
+                    )
                 
                 self.report({'INFO'}, f"Converted {xml_file} to {output_fbx}")
                 success_count += 1
-                if log_path:
-                    with open(log_path, 'a') as log_file:
-                        log_file.write(f"SUCCESS: Exported to {output_fbx}\n")
+                outputs[xml_file] = output_fbx
+                log.write(f"SUCCESS: Exported to {output_fbx}\n")
+                log.record(file=xml_file, status="ok", output=output_fbx, objects=len(new_objs),
+                           seconds=time.perf_counter() - file_start, stages=timer.current)
             
             except Exception as e:
                 error_msg = f"Failed to export {output_fbx}: {str(e)}"
                 self.report({'ERROR'}, error_msg)
-                if log_path:
-                    with open(log_path, 'a') as log_file:
-                        log_file.write(f"ERROR: {error_msg}\n")
-                        log_file.write("TRACE: " + traceback.format_exc() + "\n")
+                log.exception(error_msg)
+                log.record(file=xml_file, status="failed", stage="export", error=str(e),
+                           seconds=time.perf_counter() - file_start, stages=timer.current)
+                failed.append(xml_file)
                 error_count += 1
         
+        group.flush(context, log, timer)
+        success_count += len(group.exported)
+        outputs.update(group.exported)
+        error_count += len(group.failed)
+        failed.extend(group.failed)
+        timer.end_file()
+        if parse_cache:
+            log.write(f"\n{parse_cache.summary()}\n")
+            timer.counters.update(parse_cache.stats())
+        if job:
+            write_worker_result(job, success_count, error_count, outputs, failed, timer.files, remaining + cancelled)
+            journal.close()
+        else:
+            if remaining:
+                # Checkpoint the finished files before the rest of the batch runs in a new process
+                manifest.record_outputs(outputs)
+                manifest.save()
+                result = yield from continue_in_new_process(self, source_folder, remaining, log, resume.journal_dir)
+                resume.add_crashed(result["crashed"])
+                cancelled.extend(result["cancelled"])
+                success_count += result["success"]
+                error_count += result["error"]
+                outputs.update(result["outputs"])
+                failed.extend(result["failed"])
+                timer.merge(result["timings"])
+            manifest.record_outputs(outputs)
+            manifest.save()
+            resume.finish(journal)
+            error_count += len(resume.quarantined)
+            if self.performance_report:
+                write_performance_report(output_folder, self.report_title, timer, self.slowest_count)
+        
+        return self.finish_batch(log, len(xml_files), success_count, error_count, len(skipped_files), len(cancelled))
+    
+    def finish_batch(self, log, total, success_count, error_count, skipped_count=0, cancelled_count=0):
+        """Write the conversion summary and report the final counts"""
         # Log summary
-        if log_path:
-            with open(log_path, 'a') as log_file:
-                log_file.write(f"\n\nConversion Summary:\n")
-                log_file.write(f"Completed at: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-                log_file.write(f"Total files processed: {len(xml_files)}\n")
-                log_file.write(f"Successful conversions: {success_count}\n")
-                log_file.write(f"Failed conversions: {error_count}\n")
-        
-        self.report({'INFO'}, f"Batch conversion completed! {success_count} files converted, {error_count} failed.")
+        log.write(f"\n\nConversion Summary:\n", 'SUMMARY')
+        log.write(f"Completed at: {time.strftime('%Y-%m-%d %H:%M:%S')}\n", 'SUMMARY')
+        log.write(f"Total files processed: {total}\n", 'SUMMARY')
+        log.write(f"Successful conversions: {success_count}\n", 'SUMMARY')
+        log.write(f"Failed conversions: {error_count}\n", 'SUMMARY')
+        log.write(f"Skipped (up to date): {skipped_count}\n", 'SUMMARY')
+        if cancelled_count:
+            log.write(f"Cancelled (left for the next run): {cancelled_count}\n", 'SUMMARY')
+            self.report({'WARNING'}, f"Batch cancelled; {cancelled_count} files were not processed.")
+        record_batch_summary(self, total, success_count, error_count, skipped_count)
+        
+        self.report({'INFO'}, f"Batch conversion completed! {success_count} files converted, {error_count} failed, {skipped_count} up to date.")
         return {'FINISHED'}
 
 
+class JarvisToolsPanel(bpy.types.Panel):
+    """Main panel for Jarvis Tools"""
+    bl_label = "Jarvis Tools"
+    bl_idname = "OBJECT_PT_jarvis_tools"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Jarvis Tools"
+
+    def draw(self, context):
+        layout = self.layout
+        
+        # Running batch: progress, throughput and ETA
+        if BATCH_PROGRESS.get("running"):
+            box = layout.box()
+            box.label(text=BATCH_PROGRESS["label"], icon='TIME')
+            total = BATCH_PROGRESS["total"]
+            fraction = BATCH_PROGRESS["done"] / total if total else 0.0
+            if hasattr(box, "progress"):
+                box.progress(factor=fraction, text=f"{fraction:.0%}")
+            box.label(text=batch_progress_text())
+            if BATCH_PROGRESS["current"]:
+                box.label(text=os.path.basename(BATCH_PROGRESS["current"]), icon='FILE')
+            if BATCH_PROGRESS["cancelled"]:
+                box.label(text="Cancelling after the current file...", icon='CANCEL')
+            else:
+                box.label(text="Press Esc to cancel", icon='EVENT_ESC')
+        
+        # Step 1: Model Prep & Import
+        box = layout.box()
+        box.label(text="Step 1: Model Preparation & Import", icon='IMPORT')
+        box.operator("jarvis.import_model")
+        box.operator("jarvis.validate_model")
+        box.operator("jarvis.auto_fix")
+        
+        # Step 2: Modifications
+        box = layout.box()
+        box.label(text="Step 2: Modifications", icon='MODIFIER')
+        box.operator("jarvis.fix_uvs")
+        box.operator("jarvis.apply_transformations")
+        box.operator("jarvis.optimize_geometry")
+        box.operator("jarvis.generate_lods")
+        
+        # Transparency Fixes
+        box = layout.box()
+        box.label(text="Transparency Fixes", icon='SHADING_RENDERED')
+        box.operator("jarvis.simplify_transparency")
+        
+        # Step 3: Export
+        box = layout.box()
+        box.label(text="Step 3: Export", icon='EXPORT')
+        box.operator("jarvis.export_model")
+        box.operator("jarvis.verify_export")
+        box.operator("jarvis.pack_textures")
+        
+        # Batch Conversion Section
+        box = layout.box()
+        box.label(text="Batch Conversion", icon='FILE_FOLDER')
+        box.operator("jarvis.batch_convert_xml")
+        box.operator("jarvis.batch_convert_ydr")
+        box.operator("jarvis.batch_convert_textures")
+        box.operator("jarvis.batch_clean_model")
+        
+        # Export for Web
+        box = layout.box()
+        box.label(text="Export for Web", icon='WORLD')
+        box.operator("jarvis.export_glb")
+        box.operator("jarvis.batch_export_glb")
+
+class BatchConvertXML(bpy.types.Operator, ImportHelper, ModalBatch, SollumzBatch):
+    """Batch Convert .xml Files to .fbx using Direct Sollumz Import"""
+    bl_idname = "jarvis.batch_convert_xml"
+    bl_label = "Batch Convert XML"
+    output_name = "Converted"
+    log_name = "conversion_log.txt"
+    log_title = "Jarvis Tools XML Conversion Log"
+    report_title = "XML Conversion"
+    asset_label = "YFT"
+    asset_suffix = ".yft"
+    
+    directory: StringProperty(subtype='DIR_PATH')
+    
+    filter_glob: StringProperty(
+        default="*.xml",
+        options={'HIDDEN'},
+    )
+    
+    texture_link_mode: EnumProperty(
+        name="Texture Staging",
+        description="How textures are placed in the Converted folder",
+        items=TEXTURE_LINK_ITEMS,
+        default='AUTO'
+    )
+    
+    def sollumz_entry_points(self, sollumz_module):
+        return sollumz_module.cwxml.fragment.YFT.from_xml_file, sollumz_module.yft.yftimport.create_fragment_obj
+    
+    def find_files(self, index, log):
+        # _hi.yft.xml files are handled with their base file, so they are not timed or converted on their own
+        log.write(f"Leaving out {len(index.files('_hi.yft.xml'))} _hi.yft.xml files (handled with their base file)\n")
+        return index.files(".yft.xml", ".ydr")
+    
+    def stage_inputs(self, index, output_folder, log, timer):
+        texture_files = index.files(*TEXTURE_SUFFIXES)
+        log.write(f"\nFound {len(texture_files)} texture files\n")
+        
+        # Stage textures in the Converted folder, skipping those already up to date
+        with timer.stage("textures"):
+            counts, failed_textures = stage_textures(texture_files, output_folder, self.texture_link_mode)
+            for tex, e in failed_textures:
+                self.report({'ERROR'}, f"Failed copying texture {os.path.basename(tex)}: {e}")
+                log.write(f"ERROR: Failed copying texture {tex}: {e}\n", 'ERROR')
+            log.write(f"Textures: {counts['skipped']} up to date, {counts['linked']} hard-linked, "
+                      f"{counts['reflinked']} reflinked, {counts['copied']} copied, {len(failed_textures)} failed\n")
+
+
 class ExportGLB(bpy.types.Operator):
     """Export model as GLB"""
     bl_idname = "jarvis.export_glb"
     bl_label = "Export GLB"
 
-    filepath: StringProperty(subtype="FILE_PATH")
+    filepath: StringProperty(subtype="FILE_PATH")
+    
+    use_selection: BoolProperty(
+        name="Selected Only",
+        description="Export only the selected objects",
+        default=False
+    )
+    
+    web_profile: BoolProperty(
+        name="Web Optimized",
+        description="Compress meshes, resize textures and apply modifiers for serving the GLB on the web",
+        default=False
+    )
+    
+    compression: EnumProperty(
+        name="Mesh Compression",
+        description="Geometry compression of the web profile",
+        items=GLB_COMPRESSION_ITEMS,
+        default='DRACO'
+    )
+    
+    compression_level: IntProperty(
+        name="Compression Level",
+        description="Draco compression effort (higher is smaller and slower to encode)",
+        default=6,
+        min=0,
+        max=10
+    )
+    
+    position_bits: IntProperty(
+        name="Position Bits",
+        description="Quantization bits of vertex positions (0 = no quantization)",
+        default=14,
+        min=0,
+        max=30
+    )
+    
+    normal_bits: IntProperty(
+        name="Normal Bits",
+        description="Quantization bits of normals (0 = no quantization)",
+        default=10,
+        min=0,
+        max=30
+    )
+    
+    texcoord_bits: IntProperty(
+        name="UV Bits",
+        description="Quantization bits of texture coordinates (0 = no quantization)",
+        default=12,
+        min=0,
+        max=30
+    )
+    
+    max_texture_size: IntProperty(
+        name="Max Texture Size",
+        description="Downscale larger textures to this many pixels on their longest side (0 = keep the original size)",
+        default=2048,
+        min=0,
+        max=16384
+    )
+    
+    image_format: EnumProperty(
+        name="Texture Format",
+        description="Image format of the textures embedded in the GLB",
+        items=GLB_IMAGE_FORMAT_ITEMS,
+        default='WEBP'
+    )
+
+    def invoke(self, context, event):
+        if self.filepath:
+            return self.execute(context)
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
 
     def execute(self, context):
         if not self.filepath:
             self.report({'ERROR'}, "No export file path provided!")
             return {'CANCELLED'}
 
+        objects = context.selected_objects if self.use_selection else context.scene.objects
         try:
-            bpy.ops.export_scene.gltf(filepath=self.filepath, export_format='GLB')
-            self.report({'INFO'}, f"Successfully exported GLB to {self.filepath}")
+            downscaled, unsupported = export_web_glb(self, self.filepath, objects, self.use_selection)
+            if unsupported:
+                self.report({'WARNING'}, f"The glTF exporter does not support: {', '.join(unsupported)}")
+            self.report({'INFO'}, f"Successfully exported GLB to {self.filepath}"
+                                  + (f" ({downscaled} textures downscaled)" if downscaled else ""))
         except Exception as e:
             self.report({'ERROR'}, f"Failed to export GLB: {str(e)}")
             return {'CANCELLED'}
@@ -441,28 +4043,225 @@ class SimplifyTransparency(bpy.types.Operator):
     bl_label = "Simplify Transparency"
 
     def execute(self, context):
-        for material in bpy.data.materials:
-            if material.use_nodes:
-                node_tree = material.node_tree
-                for node in node_tree.nodes:
-                    if node.type == 'BSDF_PRINCIPLED':
-                        # Find the Alpha input
-                        alpha_input = node.inputs['Alpha']
-
-                        # Break any existing links to the Alpha input
-                        for link in list(node_tree.links):
-                            if link.to_socket == alpha_input:
-                                node_tree.links.remove(link)
-
-                        # Set Alpha to full opacity
-                        alpha_input.default_value = 1.0
-                        self.report({'INFO'}, f"Fixed transparency for {material.name}")
+        fixed = simplify_transparency(bpy.data.materials)
+        self.report({'INFO'}, f"Fixed transparency for {len(fixed)} of {len(bpy.data.materials)} materials")
+        return {'FINISHED'}
+    
+
+class FixUVs(bpy.types.Operator):
+    """Repair, normalize or flip the UV layers of the selected meshes (or every mesh in the scene)"""
+    bl_idname = "jarvis.fix_uvs"
+    bl_label = "Fix UVs"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    uv_normalize: EnumProperty(
+        name="Normalize",
+        description="How to bring UV layers back to the 0-1 square",
+        items=UV_NORMALIZE_ITEMS,
+        default='WRAP'
+    )
+    
+    flip_v: BoolProperty(
+        name="Flip V",
+        description="Mirror the UVs vertically (V = 1 - V), e.g. for textures authored with a top-left origin",
+        default=False
+    )
+    
+    all_layers: BoolProperty(
+        name="All UV Layers",
+        description="Fix every UV layer instead of only the active one",
+        default=True
+    )
+    
+    create_missing: BoolProperty(
+        name="Create Missing UVs",
+        description="Give meshes without UVs a planar projection",
+        default=True
+    )
+
+    def execute(self, context):
+        if context.mode != 'OBJECT':
+            self.report({'ERROR'}, "Fix UVs works in Object Mode")
+            return {'CANCELLED'}
+        objects = context.selected_objects or context.scene.objects
+        start = time.perf_counter()
+        totals = repair_uvs(objects, self.uv_normalize, self.flip_v, self.all_layers, self.create_missing)
+        message = (f"Fixed {totals['layers']} UV layers of {totals['meshes']} meshes in "
+                   f"{time.perf_counter() - start:.2f}s: repaired {totals['repaired']} UVs, "
+                   f"created {totals['created']} layers")
+        if totals["skipped"]:
+            message += f", skipped {totals['skipped']} library meshes"
+        self.report({'INFO'}, message)
+        return {'FINISHED'}
+    
+
+class ApplyTransformations(bpy.types.Operator):
+    """Apply the location, rotation and scale of the selected objects to their meshes"""
+    bl_idname = "jarvis.apply_transformations"
+    bl_label = "Apply Transformations"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    location: BoolProperty(
+        name="Location",
+        description="Apply the location",
+        default=True
+    )
+    
+    rotation: BoolProperty(
+        name="Rotation",
+        description="Apply the rotation",
+        default=True
+    )
+    
+    scale: BoolProperty(
+        name="Scale",
+        description="Apply the scale; mirrored meshes get their faces flipped",
+        default=True
+    )
+
+    def execute(self, context):
+        if context.mode != 'OBJECT':
+            self.report({'ERROR'}, "Apply Transformations works in Object Mode")
+            return {'CANCELLED'}
+        if not context.selected_objects:
+            self.report({'WARNING'}, "No objects selected")
+            return {'CANCELLED'}
+        start = time.perf_counter()
+        totals = apply_transforms(context.selected_objects, self.location, self.rotation, self.scale)
+        message = (f"Applied transforms of {totals['objects']} objects to {totals['meshes']} meshes in "
+                   f"{time.perf_counter() - start:.2f}s ({totals['copied']} shared meshes copied, "
+                   f"{totals['flipped']} flipped)")
+        if totals["skipped"]:
+            message += f", skipped {totals['skipped']} objects that are not meshes or empties or come from libraries"
+        self.report({'INFO'}, message)
+        return {'FINISHED'}
+    
+
+class OptimizeGeometry(bpy.types.Operator):
+    """Merge duplicate vertices, remove degenerate faces and strip unused vertices of the selected meshes"""
+    bl_idname = "jarvis.optimize_geometry"
+    bl_label = "Optimize Geometry"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    merge_distance: FloatProperty(
+        name="Merge Distance",
+        description="Merge vertices closer than this (0 = do not merge)",
+        default=0.0001,
+        min=0.0,
+        precision=5
+    )
+    
+    remove_degenerate: BoolProperty(
+        name="Remove Degenerate Faces",
+        description="Remove faces with zero area, including those that collapse when vertices merge",
+        default=True
+    )
+    
+    remove_unused: BoolProperty(
+        name="Remove Unused Vertices",
+        description="Remove vertices that no face or edge uses",
+        default=True
+    )
+
+    def execute(self, context):
+        if context.mode != 'OBJECT':
+            self.report({'ERROR'}, "Optimize Geometry works in Object Mode")
+            return {'CANCELLED'}
+        objects = context.selected_objects or context.scene.objects
+        start = time.perf_counter()
+        totals = optimize_meshes(objects, self.merge_distance, self.remove_degenerate, self.remove_unused)
+        message = (f"Optimized {totals['meshes']} meshes in {time.perf_counter() - start:.2f}s: removed "
+                   f"{totals['vertices']} vertices and {totals['faces']} faces")
+        if totals["skipped"]:
+            message += f", skipped {totals['skipped']} meshes with shape keys or from libraries"
+        self.report({'INFO'}, message)
+        return {'FINISHED'}
+    
+
+class GenerateLODs(bpy.types.Operator):
+    """Generate a decimated LOD chain for the selected meshes (or every mesh in the scene)"""
+    bl_idname = "jarvis.generate_lods"
+    bl_label = "Generate LODs"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    lod_ratios: StringProperty(
+        name="LOD Ratios",
+        description="Comma-separated face ratios of LOD1, LOD2, ... relative to the original mesh",
+        default="0.5, 0.25, 0.1"
+    )
+    
+    lod_screen_sizes: StringProperty(
+        name="LOD Screen Sizes",
+        description="Comma-separated screen size at which each LOD level takes over, stored on the LOD objects",
+        default="0.5, 0.25, 0.1"
+    )
+    
+    lod_min_faces: IntProperty(
+        name="LOD Minimum Faces",
+        description="Leave meshes with fewer faces than this without LODs",
+        default=100,
+        min=0
+    )
+
+    def execute(self, context):
+        if context.mode != 'OBJECT':
+            self.report({'ERROR'}, "Generate LODs works in Object Mode")
+            return {'CANCELLED'}
+        try:
+            ratios, screen_sizes = lod_chain_settings(self)
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        
+        objects = list(context.selected_objects or context.scene.objects)
+        start = time.perf_counter()
+        created = generate_lod_chains(context, objects, ratios, screen_sizes, self.lod_min_faces)
+        groups = sum(1 for obj in created if obj.type == 'EMPTY')
+        self.report({'INFO'}, f"Generated {len(ratios)} LOD levels for {groups} objects "
+                              f"in {time.perf_counter() - start:.2f}s")
+        return {'FINISHED'}
+    
+
+class ValidateModel(bpy.types.Operator):
+    """Check the selected meshes (or every mesh in the scene) for broken geometry, UVs and textures"""
+    bl_idname = "jarvis.validate_model"
+    bl_label = "Validate Model"
 
+    max_vertices: IntProperty(
+        name="Max Vertices per Mesh",
+        description="Report meshes with more vertices than this (0 = no limit)",
+        default=65535,
+        min=0
+    )
+    
+    report_path: StringProperty(
+        name="Report File",
+        description="Also write the validation report as JSON to this file",
+        subtype='FILE_PATH',
+        default=""
+    )
+
+    def execute(self, context):
+        objects = list(context.selected_objects or context.scene.objects)
+        report = validate_objects(objects, self.max_vertices)
+        if self.report_path:
+            write_validation_report(bpy.path.abspath(self.report_path), report, bpy.data.filepath or None)
+        
+        # Show the worst meshes first; the full list goes to the report file
+        entries = sorted(report["meshes"], key=lambda entry: -sum(entry["problems"].values()))
+        for entry in entries[:10]:
+            problems = ", ".join(f"{check} {count}" for check, count in entry["problems"].items())
+            self.report({'WARNING'}, f"{entry['mesh']}: {problems}")
+        for entry in report["missing_textures"][:10]:
+            self.report({'WARNING'}, f"{entry['material']}: missing texture {entry['texture']}")
+        self.report({'ERROR' if report["errors"] else 'INFO'},
+                    f"Validation: {report['errors']} errors, {report['warnings']} warnings "
+                    f"in {len(report['meshes'])} meshes ({report['seconds']:.3f}s)")
         return {'FINISHED'}
     
 
 #[FUNCTION] Batch Convert Textures
-class BatchConvertTextures(bpy.types.Operator, ImportHelper):
+class BatchConvertTextures(bpy.types.Operator, ImportHelper, ModalBatch):
     """Batch convert all .dds textures to .png in a folder tree,
     replicating the folder structure in a 'Converted Textures' folder."""
     bl_idname = "jarvis.batch_convert_textures"
@@ -477,31 +4276,106 @@ class BatchConvertTextures(bpy.types.Operator, ImportHelper):
         # type: ignore
     )
     
+    worker_count: IntProperty(
+        name="Worker Threads",
+        description="Number of textures converted in parallel (0 = one per CPU core)",
+        default=0,
+        min=0,
+        max=256
+    )
+    
+    compress_level: IntProperty(
+        name="PNG Compression",
+        description="zlib compression level of the PNG files (0 = fastest and largest, 9 = slowest and smallest)",
+        default=6,
+        min=0,
+        max=9
+    )
+    
+    decoder: EnumProperty(
+        name="DDS Decoder",
+        description="How DDS textures are decoded",
+        items=DDS_DECODER_ITEMS,
+        default='NATIVE'
+    )
+    
+    use_file_index: BoolProperty(
+        name="Cache File Index",
+        description="Store the folder listing in the source folder so later runs only rescan changed folders",
+        default=True
+    )
+    
     def convert_dds_to_png(self, src_folder, out_folder):
-        total = 0
+        if self.decoder == 'PILLOW' and Image is None:
+            self.report({'ERROR'}, "Pillow (PIL) is not installed in Blender's Python; cannot convert DDS textures.")
+            return {'CANCELLED'}
+        
+        # Collect every texture first so each target directory is created only once
+        jobs = []
+        target_dirs = set()
+        index = FileIndex(src_folder, (os.path.basename(out_folder),), self.use_file_index).scan()
+        for src_path in index.files(".dds"):
+            # Calculate relative path from the source folder
+            root, file = os.path.split(src_path)
+            target_dir = os.path.join(out_folder, os.path.relpath(root, src_folder))
+            # Build output filename with .png extension
+            out_file = os.path.join(target_dir, os.path.splitext(file)[0] + ".png")
+            jobs.append((src_path, out_file))
+            target_dirs.add(target_dir)
+        for target_dir in target_dirs:
+            os.makedirs(target_dir, exist_ok=True)
+        
+        total = len(jobs)
         converted = 0
         failed = 0
-        for root, dirs, files in os.walk(src_folder):
-            for file in files:
-                if file.lower().endswith('.dds'):
-                    total += 1
-                    src_path = os.path.join(root, file)
-                    # Calculate relative path from the source folder
-                    rel_path = os.path.relpath(root, src_folder)
-                    target_dir = os.path.join(out_folder, rel_path)
-                    os.makedirs(target_dir, exist_ok=True)
-                    # Build output filename with .png extension
-                    out_file = os.path.join(target_dir, os.path.splitext(file)[0] + ".png")
-                    self.report({'INFO'}, f"Processing {src_path} ...")
+        # Formats the threaded decoders cannot read are retried through Blender on the main thread
+        blender_jobs = list(jobs) if self.decoder == 'BLENDER' else []
+        cancelled = 0
+        if self.decoder != 'BLENDER':
+            # NumPy, Pillow and zlib release the GIL for the heavy work, so threads scale across cores
+            with ThreadPoolExecutor(max_workers=resolve_worker_count(self.worker_count)) as pool:
+                futures = {
+                    pool.submit(convert_dds_file, src_path, out_file, self.compress_level, self.decoder): (src_path, out_file)
+                    for src_path, out_file in jobs
+                }
+                for done, future in enumerate(as_completed(futures), 1):
+                    src_path, out_file = futures[future]
                     try:
-                        img = Image.open(src_path)
-                        img.save(out_file, "PNG")
-                        self.report({'INFO'}, f"Converted: {src_path} -> {out_file}")
+                        future.result()
+                        self.report({'INFO'}, f"[{done}/{total}] Converted: {src_path} -> {out_file}")
                         converted += 1
+                    except DDSFormatError:
+                        blender_jobs.append((src_path, out_file))
                     except Exception as e:
-                        self.report({'ERROR'}, f"Failed to convert {src_path}: {e}")
+                        self.report({'ERROR'}, f"[{done}/{total}] Failed to convert {src_path}: {e}")
                         failed += 1
+                    
+                    # Hand control back to the UI; Esc drops the textures that have not started yet
+                    report_batch_progress(done, total, src_path)
+                    yield
+                    if batch_cancelled():
+                        cancelled = sum(future.cancel() for future in futures)
+                        break
+        
+        for position, (src_path, out_file) in enumerate(blender_jobs):
+            if batch_cancelled():
+                cancelled += len(blender_jobs) - position
+                break
+            try:
+                convert_dds_with_blender(src_path, out_file)
+                self.report({'INFO'}, f"Converted with Blender: {src_path} -> {out_file}")
+                converted += 1
+            except Exception as e:
+                self.report({'ERROR'}, f"Failed to convert {src_path}: {e}")
+                failed += 1
+            report_batch_progress(converted + failed, total, src_path)
+            yield
+        
+        if cancelled:
+            self.report({'WARNING'}, f"Batch cancelled; {cancelled} textures were not converted.")
+        record_batch_summary(self, total, converted, failed)
         self.report({'INFO'}, f"Conversion Summary: Total: {total}, Converted: {converted}, Failed: {failed}")
+        return {'FINISHED'}
 
     def execute(self, context):
         src_folder = self.directory
@@ -512,12 +4386,12 @@ class BatchConvertTextures(bpy.types.Operator, ImportHelper):
         out_folder = os.path.join(src_folder, "Converted_Textures")
         os.makedirs(out_folder, exist_ok=True)
         
-        self.convert_dds_to_png(src_folder, out_folder)
-        return {'FINISHED'}
+        return self.start_batch(context, BatchLogger(), self.convert_dds_to_png(src_folder, out_folder))
     
 
 #[FUNCTION] Batch Clean Model
-class BatchCleanModel(bpy.types.Operator, ImportHelper):
+class BatchCleanModel(bpy.types.Operator, ImportHelper, ModalBatch, BatchOptions, ExportGroupOptions,
+                      AssetFixOptions):
     """Batch Clean Model:
     Processes every FBX file in the selected source folder,
     cleans the scene to keep only the valid base mesh group (name ending in '.mesh' but not containing '.damaged.mesh') 
@@ -530,35 +4404,6 @@ class BatchCleanModel(bpy.types.Operator, ImportHelper):
     directory: StringProperty(subtype='DIR_PATH')
     filter_glob: StringProperty(default="*.fbx", options={'HIDDEN'})
 
-    wait_time: IntProperty(
-        name="Wait Time (seconds)",
-        description="Time to wait after import to ensure processing completes",
-        default=2,
-        min=0,
-        max=10
-    )
-    
-    debug_mode: BoolProperty(
-        name="Debug Mode",
-        description="Create a detailed log file to diagnose issues",
-        default=True
-    )
-    
-    def safe_delete_all(self, context):
-        """Safely delete all objects in the scene."""
-        try:
-            if context.object and context.object.mode != 'OBJECT':
-                bpy.ops.object.mode_set(mode='OBJECT')
-            for obj in context.scene.objects:
-                obj.select_set(True)
-            if any(obj.select_get() for obj in context.scene.objects):
-                bpy.ops.object.delete()
-            return True
-        except Exception as e:
-            if self.debug_mode:
-                print(f"Error in safe_delete_all: {e}")
-            return False
-
     def execute(self, context):
         source_folder = self.directory
         if not source_folder:
@@ -566,39 +4411,71 @@ class BatchCleanModel(bpy.types.Operator, ImportHelper):
             return {'CANCELLED'}
         
         # Create log file if debug mode is enabled.
-        log_path = None
-        if self.debug_mode:
-            log_path = os.path.join(source_folder, "batch_clean_log.txt")
-            with open(log_path, 'w') as log_file:
-                log_file.write("Jarvis Tools Batch Clean Log\n")
-                log_file.write("=============================\n\n")
-                log_file.write(f"Started cleaning at: {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                log_file.write(f"Blender version: {bpy.app.version_string}\n")
-                log_file.write(f"Wait time: {self.wait_time} seconds\n\n")
+        log = open_batch_log(self, None, os.path.join(source_folder, "batch_clean_log.txt"))
+        return self.start_batch(context, log, self.run_batch(context, source_folder, log))
+    
+    def run_batch(self, context, source_folder, log):
+        timer = StageTimer()
+        log.write("Jarvis Tools Batch Clean Log\n", 'SUMMARY')
+        log.write("=============================\n\n", 'SUMMARY')
+        log.write(f"Started cleaning at: {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n", 'SUMMARY')
+        log.write(f"Blender version: {bpy.app.version_string}\n", 'SUMMARY')
+        log.write(f"Import timeout: {self.wait_time} seconds\n\n", 'SUMMARY')
         
         # Create output folder "Cleaned" inside the source folder.
         cleaned_folder = os.path.join(source_folder, "Cleaned")
         os.makedirs(cleaned_folder, exist_ok=True)
         
         # Find FBX files in the source folder.
-        fbx_files = glob.glob(os.path.join(source_folder, "**", "*.fbx"), recursive=True)
+        index = FileIndex(source_folder, ("Cleaned",), self.use_file_index).scan()
+        log.write(f"Scanned {index.listed} folders, {index.reused} unchanged from the file index\n")
+        fbx_files = index.files(".fbx")
         if not fbx_files:
             self.report({'WARNING'}, "No FBX files found in the selected folder.")
             return {'CANCELLED'}
         
-        if log_path:
-            with open(log_path, 'a') as log_file:
-                log_file.write(f"Found {len(fbx_files)} FBX files to process.\n")
+        log.write(f"Found {len(fbx_files)} FBX files to process.\n")
+        
+        # Check the LOD chain before any file is touched
+        try:
+            lod_settings = lod_chain_settings(self) if self.generate_lods else None
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        
+        # Skip inputs that were already cleaned with the same settings, resume an
+        # interrupted run and leave out files that crashed Blender before
+        manifest = BatchManifest(source_folder, cleaned_folder, operator_options(self, MANIFEST_IGNORED),
+                                 self.use_content_hash)
+        resume = BatchResume(self, source_folder, cleaned_folder, log)
+        fbx_files = resume.filter(fbx_files, manifest)
+        skipped_files = list(resume.resumed)
+        if self.skip_unchanged:
+            fbx_files, unchanged_files = manifest.filter(fbx_files)
+            skipped_files += unchanged_files
+            log.write(f"Skipping {len(skipped_files)} unchanged files, {len(fbx_files)} to clean\n")
         
         success_count = 0
         error_count = 0
+        outputs = {}
+        failed = []
+        cancelled = []
+        journal = resume.journal()
+        group = ExportGroup(cleaned_folder, self.group_size, self.group_max_objects, self.group_max_memory_mb, journal)
         
-        for fbx_file in fbx_files:
-            if log_path:
-                with open(log_path, 'a') as log_file:
-                    log_file.write("\n" + "="*50 + "\n")
-                    log_file.write(f"Processing: {fbx_file}\n")
-                    log_file.write("="*50 + "\n")
+        for position, fbx_file in enumerate(journal.iterate(fbx_files, outputs, failed, group)):
+            # Hand control back to the UI between files; Esc stops the batch here
+            report_batch_progress(position, len(fbx_files), fbx_file)
+            yield
+            if batch_cancelled():
+                cancelled = fbx_files[position:]
+                break
+            
+            log.write("\n" + "="*50 + "\n")
+            log.write(f"Processing: {fbx_file}\n")
+            log.write("="*50 + "\n")
+            file_start = time.perf_counter()
+            timer.start_file(fbx_file)
             
             # Define output filename for cleaned FBX.
             base_filename = os.path.splitext(os.path.basename(fbx_file))[0]
@@ -606,103 +4483,145 @@ class BatchCleanModel(bpy.types.Operator, ImportHelper):
             
             self.report({'INFO'}, f"Processing file: {fbx_file}")
             
-            # Clear scene.
-            self.safe_delete_all(context)
-            for coll in list(bpy.data.collections):
-                bpy.data.collections.remove(coll)
-            for block in list(bpy.data.meshes):
-                if block.users == 0:
-                    bpy.data.meshes.remove(block)
-            for block in list(bpy.data.materials):
-                if block.users == 0:
-                    bpy.data.materials.remove(block)
-            for block in list(bpy.data.textures):
-                if block.users == 0:
-                    bpy.data.textures.remove(block)
-            for block in list(bpy.data.images):
-                if block.users == 0:
-                    bpy.data.images.remove(block)
-            bpy.context.view_layer.update()
+            # Clear scene (grouped exports keep their assets until the group is flushed).
+            if not group.assets:
+                with timer.stage("reset"):
+                    reset_scene(context)
+            before = group.snapshot() if group.enabled else None
             
             # Import the FBX file.
+            existing_objs = id_pointers(bpy.data.objects)
+            object_count = len(existing_objs)
+            mesh_count = len(bpy.data.meshes)
             try:
-                bpy.ops.import_scene.fbx(filepath=fbx_file)
-                if self.wait_time > 0:
-                    time.sleep(self.wait_time)
-                bpy.context.view_layer.update()
+                with timer.stage("import"):
+                    bpy.ops.import_scene.fbx(filepath=fbx_file)
+                with timer.stage("sync"):
+                    ready = wait_for_import(context, object_count, mesh_count, timeout=self.wait_time)
+                if not ready:
+                    log.write(f"Import produced no data within {self.wait_time} seconds\n")
             except Exception as e:
                 error_msg = f"Failed to import {fbx_file}: {e}"
                 self.report({'ERROR'}, error_msg)
-                if log_path:
-                    with open(log_path, 'a') as log_file:
-                        log_file.write("ERROR: " + error_msg + "\n")
-                        log_file.write("TRACE: " + traceback.format_exc() + "\n")
+                log.exception(error_msg)
+                log.record(file=fbx_file, status="failed", stage="import", error=str(e),
+                           seconds=time.perf_counter() - file_start, stages=timer.current)
+                failed.append(fbx_file)
+                group.discard(before)
                 error_count += 1
                 continue
             
             # --- CLEANING STEP ---
             # Collect valid base mesh groups (name ending with '.mesh' and not containing '.damaged.mesh')
             # and all of their children.
-            objects_to_keep = set()
-            for obj in bpy.data.objects:
-                name_lower = obj.name.lower().strip()
-                if name_lower.endswith(".mesh") and ".damaged.mesh" not in name_lower:
-                    objects_to_keep.add(obj)
-                    for child in obj.children_recursive:
-                        objects_to_keep.add(child)
-            
-            # Remove all objects not in the keep set.
-            objects_to_remove = [obj for obj in list(bpy.data.objects) if obj not in objects_to_keep]
-            for obj in objects_to_remove:
-                bpy.data.objects.remove(obj, do_unlink=True)
-            if log_path:
-                with open(log_path, 'a') as log_file:
-                    log_file.write(f"Cleaned: kept {len(objects_to_keep)} objects, removed {len(objects_to_remove)} objects\n")
+            # Only objects of this file are considered, so grouped assets are left alone.
+            with timer.stage("clean"):
+                new_objs = new_id_blocks(bpy.data.objects, existing_objs)
+                roots = []
+                for obj in new_objs:
+                    name_lower = obj.name.lower().strip()
+                    if name_lower.endswith(".mesh") and ".damaged.mesh" not in name_lower:
+                        roots.append(obj)
+                objects_to_keep = with_descendants(roots, new_objs)
+                
+                # Remove all objects not in the keep set in one batch.
+                kept_objs = [obj for obj in new_objs if obj.as_pointer() in objects_to_keep]
+                objects_to_remove = [obj for obj in new_objs if obj.as_pointer() not in objects_to_keep]
+                bpy.data.batch_remove(objects_to_remove)
+            log.write(f"Cleaned: kept {len(objects_to_keep)} objects, removed {len(objects_to_remove)} objects\n")
             # --- END CLEANING STEP ---
             
             # Select remaining objects for export.
-            for obj in bpy.data.objects:
-                obj.select_set(True)
-            if bpy.data.objects:
-                context.view_layer.objects.active = bpy.data.objects[0]
+            select_only(context, kept_objs)
             
+            # Fix, extend and validate the asset; a step that fails only fails this file
             try:
-                if log_path:
-                    with open(log_path, 'a') as log_file:
-                        log_file.write(f"Exporting cleaned model to: {output_fbx}\n")
-                bpy.ops.export_scene.fbx(
-                    filepath=output_fbx,
-                    use_selection=True,
-                    use_mesh_modifiers=False,
-                    path_mode='COPY',
-                    embed_textures=True,
-                    mesh_smooth_type='FACE'
-                )
+                kept_objs = prepare_assets(context, self, kept_objs, output_fbx, fbx_file, log, timer, lod_settings)
+            except AssetRejected as e:
+                log.record(file=fbx_file, status="failed", stage="validate", error=str(e),
+                           seconds=time.perf_counter() - file_start, stages=timer.current)
+                failed.append(fbx_file)
+                group.discard(before)
+                error_count += 1
+                continue
+            except Exception as e:
+                error_msg = f"Failed to prepare {fbx_file}: {e}"
+                self.report({'ERROR'}, error_msg)
+                log.exception(error_msg)
+                log.record(file=fbx_file, status="failed", stage="prepare", error=str(e),
+                           seconds=time.perf_counter() - file_start, stages=timer.current)
+                failed.append(fbx_file)
+                group.discard(before)
+                error_count += 1
+                continue
+            
+            # Grouped mode: queue the asset and export it together with the rest of its group
+            if group.enabled:
+                group.add(context, fbx_file, output_fbx, kept_objs, before, log, timer,
+                          seconds=time.perf_counter() - file_start, stages=timer.current)
+                continue
+            
+            try:
+                log.write(f"Exporting cleaned model to: {output_fbx}\n")
+                with timer.stage("export"):
+                    bpy.ops.export_scene.fbx(
+                        filepath=output_fbx,
+                        use_selection=True,
+                        use_mesh_modifiers=False,
+                        path_mode='COPY',
+                        embed_textures=True,
+                        mesh_smooth_type='FACE'
+                    )
                 self.report({'INFO'}, f"Cleaned and exported {fbx_file} to {output_fbx}")
                 success_count += 1
+                outputs[fbx_file] = output_fbx
+                log.record(file=fbx_file, status="ok", output=output_fbx, objects=len(objects_to_keep),
+                           seconds=time.perf_counter() - file_start, stages=timer.current)
             except Exception as e:
                 error_msg = f"Failed to export {output_fbx}: {e}"
                 self.report({'ERROR'}, error_msg)
-                if log_path:
-                    with open(log_path, 'a') as log_file:
-                        log_file.write("ERROR: " + error_msg + "\n")
-                        log_file.write("TRACE: " + traceback.format_exc() + "\n")
+                log.exception(error_msg)
+                log.record(file=fbx_file, status="failed", stage="export", error=str(e),
+                           seconds=time.perf_counter() - file_start, stages=timer.current)
+                failed.append(fbx_file)
                 error_count += 1
         
-        if log_path:
-            with open(log_path, 'a') as log_file:
-                log_file.write("\n\nBatch Clean Summary:\n")
-                log_file.write(f"Successful: {success_count}\n")
-                log_file.write(f"Failed: {error_count}\n")
-        self.report({'INFO'}, f"Batch cleaning completed! {success_count} cleaned, {error_count} failed.")
+        group.flush(context, log, timer)
+        success_count += len(group.exported)
+        outputs.update(group.exported)
+        error_count += len(group.failed)
+        failed.extend(group.failed)
+        timer.end_file()
+        manifest.record_outputs(outputs)
+        manifest.save()
+        resume.finish(journal)
+        error_count += len(resume.quarantined)
+        if self.performance_report:
+            write_performance_report(cleaned_folder, "Batch Clean", timer, self.slowest_count)
+        
+        log.write("\n\nBatch Clean Summary:\n", 'SUMMARY')
+        log.write(f"Successful: {success_count}\n", 'SUMMARY')
+        log.write(f"Failed: {error_count}\n", 'SUMMARY')
+        log.write(f"Skipped (up to date): {len(skipped_files)}\n", 'SUMMARY')
+        if cancelled:
+            log.write(f"Cancelled (left for the next run): {len(cancelled)}\n", 'SUMMARY')
+            self.report({'WARNING'}, f"Batch cancelled; {len(cancelled)} files were not processed.")
+        record_batch_summary(self, len(fbx_files), success_count, error_count, len(skipped_files))
+        self.report({'INFO'}, f"Batch cleaning completed! {success_count} cleaned, {error_count} failed, {len(skipped_files)} up to date.")
         return {'FINISHED'}
 
 
 
-class BatchConvertYDR(bpy.types.Operator, ImportHelper):
+class BatchConvertYDR(bpy.types.Operator, ImportHelper, ModalBatch, SollumzBatch):
     """Batch Convert YDR .xml Files to .fbx using Direct Sollumz Import for YDR files"""
     bl_idname = "jarvis.batch_convert_ydr"
     bl_label = "Batch Convert YDR"
+    output_name = "Converted_YDR"
+    log_name = "ydr_conversion_log.txt"
+    log_title = "Batch Convert YDR Log"
+    report_title = "YDR Conversion"
+    asset_label = "YDR"
+    asset_suffix = ".ydr"
     
     directory: StringProperty(subtype='DIR_PATH')
     
@@ -711,34 +4630,100 @@ class BatchConvertYDR(bpy.types.Operator, ImportHelper):
         options={'HIDDEN'},
     )
     
-    wait_time: IntProperty(
-        name="Wait Time (seconds)",
-        description="Time to wait after import to ensure processing completes",
-        default=2,
+    def sollumz_entry_points(self, sollumz_module):
+        return sollumz_module.cwxml.drawable.YDR.from_xml_file, sollumz_module.ydr.ydrimport.create_drawable_obj
+    
+    def find_files(self, index, log):
+        # _hi files are left out before anything is timed or parsed
+        xml_files = index.files(".ydr.xml")
+        hi_count = len(xml_files)
+        xml_files = [path for path in xml_files if "_hi" not in os.path.basename(path).lower()]
+        hi_count -= len(xml_files)
+        if hi_count:
+            log.write(f"Leaving out {hi_count} _hi files\n")
+        return xml_files
+    
+    def import_name(self, xml_file, base_filename):
+        # The drawable keeps the .ydr suffix in its name, as it always has
+        return os.path.splitext(os.path.basename(xml_file))[0]
+
+
+#[FUNCTION] Batch Export GLB
+class BatchExportGLB(bpy.types.Operator, ImportHelper, ModalBatch, BatchOptions, AssetFixOptions, WorkerOptions):
+    """Batch export every FBX file in a folder tree (such as the Converted or
+    Cleaned output) as a web-optimized GLB in a 'GLB' folder."""
+    bl_idname = "jarvis.batch_export_glb"
+    bl_label = "Batch Export GLB"
+    
+    directory: StringProperty(subtype='DIR_PATH')
+    filter_glob: StringProperty(default="*.fbx", options={'HIDDEN'})
+    
+    web_profile: BoolProperty(
+        name="Web Optimized",
+        description="Compress meshes, resize textures and apply modifiers for serving the GLB on the web",
+        default=True
+    )
+    
+    compression: EnumProperty(
+        name="Mesh Compression",
+        description="Geometry compression of the web profile",
+        items=GLB_COMPRESSION_ITEMS,
+        default='DRACO'
+    )
+    
+    compression_level: IntProperty(
+        name="Compression Level",
+        description="Draco compression effort (higher is smaller and slower to encode)",
+        default=6,
         min=0,
         max=10
     )
     
-    debug_mode: BoolProperty(
-        name="Debug Mode",
-        description="Create a detailed log file to diagnose issues",
-        default=True
+    position_bits: IntProperty(
+        name="Position Bits",
+        description="Quantization bits of vertex positions (0 = no quantization)",
+        default=14,
+        min=0,
+        max=30
     )
     
-    def safe_delete_all(self, context):
-        """Safely delete all objects in the scene."""
-        try:
-            if context.object and context.object.mode != 'OBJECT':
-                bpy.ops.object.mode_set(mode='OBJECT')
-            for obj in context.scene.objects:
-                obj.select_set(True)
-            if any(obj.select_get() for obj in context.scene.objects):
-                bpy.ops.object.delete()
-            return True
-        except Exception as e:
-            if self.debug_mode:
-                print(f"Error in safe_delete_all: {str(e)}")
-            return False
+    normal_bits: IntProperty(
+        name="Normal Bits",
+        description="Quantization bits of normals (0 = no quantization)",
+        default=10,
+        min=0,
+        max=30
+    )
+    
+    texcoord_bits: IntProperty(
+        name="UV Bits",
+        description="Quantization bits of texture coordinates (0 = no quantization)",
+        default=12,
+        min=0,
+        max=30
+    )
+    
+    max_texture_size: IntProperty(
+        name="Max Texture Size",
+        description="Downscale larger textures to this many pixels on their longest side (0 = keep the original size)",
+        default=2048,
+        min=0,
+        max=16384
+    )
+    
+    image_format: EnumProperty(
+        name="Texture Format",
+        description="Image format of the textures embedded in the GLB",
+        items=GLB_IMAGE_FORMAT_ITEMS,
+        default='WEBP'
+    )
+    
+    # GLB exports are independent of each other, so they run in workers by default
+    use_workers: BoolProperty(
+        name="Parallel Workers",
+        description="Split the files across several headless Blender processes",
+        default=True
+    )
     
     def execute(self, context):
         source_folder = self.directory
@@ -746,249 +4731,318 @@ class BatchConvertYDR(bpy.types.Operator, ImportHelper):
             self.report({'ERROR'}, "No source folder selected!")
             return {'CANCELLED'}
         
-        # Create a debug log if needed.
-        log_path = None
-        if self.debug_mode:
-            log_path = os.path.join(source_folder, "ydr_conversion_log.txt")
-            with open(log_path, 'w') as log_file:
-                log_file.write("Batch Convert YDR Log\n")
-                log_file.write("======================\n")
-                log_file.write(f"Started: {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                log_file.write(f"Blender version: {bpy.app.version_string}\n")
-                log_file.write(f"Wait time: {self.wait_time} seconds\n\n")
-        
-        # Import the necessary Sollumz modules for YDR
-        try:
-            sollumz_module = importlib.import_module("bl_ext.user_default.sollumz")
-            # Import YDR importer components (adjust paths as needed)
-            YDR = sollumz_module.cwxml.drawable.YDR
-            create_drawable_obj = sollumz_module.ydr.ydrimport.create_drawable_obj
-            if log_path:
-                with open(log_path, 'a') as log_file:
-                    log_file.write("Successfully imported YDR modules from Sollumz\n")
-        except Exception as e:
-            error_msg = f"Failed to import YDR modules: {str(e)}"
-            self.report({'ERROR'}, error_msg)
-            if log_path:
-                with open(log_path, 'a') as log_file:
-                    log_file.write("ERROR: " + error_msg + "\n")
-                    log_file.write("TRACE: " + traceback.format_exc() + "\n")
-            return {'CANCELLED'}
+        # Worker processes receive their shard and log location from the job file
+        job = load_worker_job(self.job_path) if self.job_path else None
         
-        # Optional: check for Sollumz import functionality if needed.
-        if not hasattr(bpy.ops.sollumz, "import_assets"):
-            self.report({'ERROR'}, "Sollumz import_assets operator not found! Ensure the add-on is properly installed and enabled.")
-            return {'CANCELLED'}
+        log = open_batch_log(self, job, os.path.join(source_folder, "glb_export_log.txt"))
+        return self.start_batch(context, log, self.run_batch(context, source_folder, job, log), job)
+    
+    def run_batch(self, context, source_folder, job, log):
+        timer = StageTimer()
+        log.write("Jarvis Tools GLB Export Log\n", 'SUMMARY')
+        log.write("===========================\n\n", 'SUMMARY')
+        log.write(f"Started export at: {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n", 'SUMMARY')
+        log.write(f"Blender version: {bpy.app.version_string}\n", 'SUMMARY')
+        log.write(f"Web profile: {self.web_profile}, compression: {self.compression}, "
+                  f"textures: {self.image_format} up to {self.max_texture_size or 'full'} px\n\n", 'SUMMARY')
         
-        # Create output folder for converted FBX files
-        output_folder = os.path.join(source_folder, "Converted_YDR")
+        # Create output folder "GLB" inside the source folder.
+        output_folder = os.path.join(source_folder, "GLB")
         os.makedirs(output_folder, exist_ok=True)
         
-        # Find all YDR XML files
-        xml_files = glob.glob(os.path.join(source_folder, "**", "*.ydr.xml"), recursive=True)
+        # Find FBX files (workers only handle their shard)
+        if job:
+            fbx_files = job["files"]
+        else:
+            index = FileIndex(source_folder, ("GLB",), self.use_file_index).scan()
+            log.write(f"Scanned {index.listed} folders, {index.reused} unchanged from the file index\n")
+            fbx_files = index.files(".fbx")
+        if not fbx_files:
+            self.report({'WARNING'}, "No FBX files found in the selected folder.")
+            return {'CANCELLED'}
         
-        if not xml_files:
-            self.report({'WARNING'}, "No YDR XML files found in the selected folder.")
+        log.write(f"Found {len(fbx_files)} FBX files to export.\n")
+        
+        # Check the LOD chain before any file is touched
+        try:
+            lod_settings = lod_chain_settings(self) if self.generate_lods else None
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
             return {'CANCELLED'}
         
-        if log_path:
-            with open(log_path, 'a') as log_file:
-                log_file.write(f"\nFound {len(xml_files)} YDR XML files to process:\n")
-                for xml in xml_files:
-                    log_file.write(f"  - {xml}\n")
+        # Skip inputs that were already exported with the same settings, resume an
+        # interrupted run and leave out files that crashed Blender before
+        manifest = None
+        resume = None
+        skipped_files = []
+        if not job:
+            manifest = BatchManifest(source_folder, output_folder, operator_options(self, MANIFEST_IGNORED),
+                                     self.use_content_hash)
+            resume = BatchResume(self, source_folder, output_folder, log)
+            fbx_files = resume.filter(fbx_files, manifest)
+            skipped_files = list(resume.resumed)
+            if self.skip_unchanged:
+                fbx_files, unchanged_files = manifest.filter(fbx_files)
+                skipped_files += unchanged_files
+                log.write(f"Skipping {len(skipped_files)} unchanged files, {len(fbx_files)} to export\n")
+        
+        if self.use_workers and fbx_files and not job:
+            result = yield from run_worker_farm(self, self.bl_idname, source_folder, fbx_files, self.worker_count,
+                                                log, resume.journal_dir)
+            resume.add_crashed(result["crashed"])
+            manifest.record_outputs(result["outputs"])
+            manifest.save()
+            resume.finish(BatchJournal())
+            timer.merge(result["timings"])
+            if self.performance_report:
+                write_performance_report(output_folder, "GLB Export", timer, self.slowest_count)
+            return self.finish_batch(log, len(fbx_files), result["success"],
+                                     result["error"] + len(resume.quarantined), len(skipped_files),
+                                     len(result["cancelled"]))
         
         success_count = 0
         error_count = 0
+        outputs = {}
+        failed = []
+        unsupported_logged = False
+        cancelled = []
+        journal = resume.journal() if resume else BatchJournal(job.get("journal_path"),
+                                                                settings_digest(operator_options(self, MANIFEST_IGNORED)))
         
-        # Process each YDR XML file
-        for xml_file in xml_files:
-            if log_path:
-                with open(log_path, 'a') as log_file:
-                    log_file.write("\n" + "="*50 + "\n")
-                    log_file.write(f"Processing: {xml_file}\n")
-                    log_file.write("="*50 + "\n")
+        for position, fbx_file in enumerate(journal.iterate(fbx_files, outputs, failed)):
+            # Hand control back to the UI between files; Esc stops the batch here
+            report_batch_progress(position, len(fbx_files), fbx_file)
+            yield
+            if batch_cancelled():
+                cancelled = fbx_files[position:]
+                break
             
-            # Set output FBX filename
-            base_filename = os.path.splitext(os.path.basename(xml_file))[0]
-            # Remove trailing .ydr if present
-            if base_filename.endswith(".ydr"):
-                base_filename = base_filename[:-4]
-            output_fbx = os.path.join(output_folder, base_filename + ".fbx")
-            self.report({'INFO'}, f"Processing file: {xml_file}")
+            log.write("\n" + "="*50 + "\n")
+            log.write(f"Processing: {fbx_file}\n")
+            log.write("="*50 + "\n")
+            file_start = time.perf_counter()
+            timer.start_file(fbx_file)
             
-            # Clear scene
-            self.safe_delete_all(context)
-            for coll in list(bpy.data.collections):
-                bpy.data.collections.remove(coll)
-            for block in list(bpy.data.meshes):
-                if block.users == 0:
-                    bpy.data.meshes.remove(block)
-            for block in list(bpy.data.materials):
-                if block.users == 0:
-                    bpy.data.materials.remove(block)
-            for block in list(bpy.data.textures):
-                if block.users == 0:
-                    bpy.data.textures.remove(block)
-            for block in list(bpy.data.images):
-                if block.users == 0:
-                    bpy.data.images.remove(block)
-            bpy.context.view_layer.update()
-            
-            # Record existing objects
-            existing_objs = set(bpy.data.objects)
-            existing_meshes = set(bpy.data.meshes)
-            existing_collections = set(bpy.data.collections)
-            
-            if log_path:
-                with open(log_path, 'a') as log_file:
-                    log_file.write(f"Before import - Objects: {len(existing_objs)}, ")
-                    log_file.write(f"Meshes: {len(existing_meshes)}, ")
-                    log_file.write(f"Collections: {len(existing_collections)}\n")
-            
-            # Attempt import using YDR importer
-            imported_obj = None
-            try:
-                # Optionally skip files with "_hi" if desired
-                if "_hi" in xml_file.lower():
-                    if log_path:
-                        with open(log_path, 'a') as log_file:
-                            log_file.write("Skipping _hi file\n")
-                    continue
-                
-                # Use the YDR importer
-                name = os.path.splitext(os.path.basename(xml_file))[0]
-                ydr_data = YDR.from_xml_file(xml_file)
-                imported_obj = create_drawable_obj(ydr_data, xml_file, name)
-                
-                if imported_obj:
-                    if log_path:
-                        with open(log_path, 'a') as log_file:
-                            log_file.write(f"Import succeeded, created object: {imported_obj.name}\n")
-                else:
-                    if log_path:
-                        with open(log_path, 'a') as log_file:
-                            log_file.write("Importer returned None object\n")
-                
-                if self.wait_time > 0:
-                    if log_path:
-                        with open(log_path, 'a') as log_file:
-                            log_file.write(f"Waiting {self.wait_time} seconds for import to complete...\n")
-                    time.sleep(self.wait_time)
-                bpy.context.view_layer.update()
+            # Mirror the source folder layout so assets with the same name do not collide
+            relative = os.path.relpath(os.path.splitext(fbx_file)[0], source_folder)
+            output_glb = os.path.join(output_folder, relative + ".glb")
             
+            with timer.stage("reset"):
+                reset_scene(context)
+            
+            object_count = len(bpy.data.objects)
+            mesh_count = len(bpy.data.meshes)
+            try:
+                with timer.stage("import"):
+                    bpy.ops.import_scene.fbx(filepath=fbx_file)
+                with timer.stage("sync"):
+                    ready = wait_for_import(context, object_count, mesh_count, timeout=self.wait_time)
+                if not ready:
+                    log.write(f"Import produced no data within {self.wait_time} seconds\n")
             except Exception as e:
-                error_msg = f"Failed to import {xml_file}: {str(e)}"
+                error_msg = f"Failed to import {fbx_file}: {e}"
                 self.report({'ERROR'}, error_msg)
-                if log_path:
-                    with open(log_path, 'a') as log_file:
-                        log_file.write("ERROR: " + error_msg + "\n")
-                        log_file.write("TRACE: " + traceback.format_exc() + "\n")
+                log.exception(error_msg)
+                log.record(file=fbx_file, status="failed", stage="import", error=str(e),
+                           seconds=time.perf_counter() - file_start, stages=timer.current)
+                failed.append(fbx_file)
                 error_count += 1
                 continue
             
-            # Record newly imported objects
-            new_objs = [obj for obj in bpy.data.objects if obj not in existing_objs]
-            new_meshes = [mesh for mesh in bpy.data.meshes if mesh not in existing_meshes]
-            new_collections = [coll for coll in bpy.data.collections if coll not in existing_collections]
-            
-            if log_path:
-                with open(log_path, 'a') as log_file:
-                    log_file.write(f"After import - Objects: {len(bpy.data.objects)}, ")
-                    log_file.write(f"Meshes: {len(bpy.data.meshes)}, ")
-                    log_file.write(f"Collections: {len(bpy.data.collections)}\n")
-                    log_file.write(f"New objects: {len(new_objs)}, ")
-                    log_file.write(f"New meshes: {len(new_meshes)}, ")
-                    log_file.write(f"New collections: {len(new_collections)}\n\n")
-                    log_file.write("Objects in scene:\n")
-                    for obj in bpy.context.scene.objects:
-                        log_file.write(f"  - {obj.name} (Type: {obj.type})\n")
-            
-            self.report({'INFO'}, f"After import of {xml_file}: {len(new_objs)} new objects detected.")
-            
-            # If necessary, create objects for orphaned meshes
-            if not new_objs and new_meshes:
-                if log_path:
-                    with open(log_path, 'a') as log_file:
-                        log_file.write("No new objects but found new meshes. Creating objects for them...\n")
-                for mesh in new_meshes:
-                    obj = bpy.data.objects.new(f"{base_filename}_{mesh.name}", mesh)
-                    bpy.context.scene.collection.objects.link(obj)
-                    new_objs.append(obj)
-            
-            for coll in new_collections:
-                for obj in coll.objects:
-                    if obj not in new_objs:
-                        new_objs.append(obj)
-            
-            if not new_objs:
-                self.report({'WARNING'}, f"No objects imported from {xml_file}. Skipping export.")
-                if log_path:
-                    with open(log_path, 'a') as log_file:
-                        log_file.write("WARNING: No objects imported. Skipping export.\n")
+            # Fix, extend and validate the asset; a step that fails only fails this file
+            os.makedirs(os.path.dirname(output_glb), exist_ok=True)
+            try:
+                objects = prepare_assets(context, self, context.scene.objects, output_glb, fbx_file, log, timer,
+                                         lod_settings)
+            except AssetRejected as e:
+                log.record(file=fbx_file, status="failed", stage="validate", error=str(e),
+                           seconds=time.perf_counter() - file_start, stages=timer.current)
+                failed.append(fbx_file)
+                error_count += 1
+                continue
+            except Exception as e:
+                error_msg = f"Failed to prepare {fbx_file}: {e}"
+                self.report({'ERROR'}, error_msg)
+                log.exception(error_msg)
+                log.record(file=fbx_file, status="failed", stage="prepare", error=str(e),
+                           seconds=time.perf_counter() - file_start, stages=timer.current)
+                failed.append(fbx_file)
                 error_count += 1
                 continue
-            
-            for obj in new_objs:
-                obj.hide_set(False)
-                obj.hide_viewport = False
-                obj.hide_render = False
-            
-            for obj in bpy.context.scene.objects:
-                obj.select_set(obj in new_objs)
-            
-            if new_objs:
-                context.view_layer.objects.active = new_objs[0]
             
             try:
-                if log_path:
-                    with open(log_path, 'a') as log_file:
-                        log_file.write(f"Exporting to: {output_fbx}\n")
-                        log_file.write(f"Selected objects: {len([obj for obj in bpy.context.scene.objects if obj.select_get()])}\n")
-                
-                bpy.ops.export_scene.fbx(
-                    filepath=output_fbx,
-                    use_selection=True,
-                    use_mesh_modifiers=False,
-                    path_mode='COPY',
-                    embed_textures=True,
-                    mesh_smooth_type='FACE'
-                )
-                self.report({'INFO'}, f"Converted {xml_file} to {output_fbx}")
+                with timer.stage("export"):
+                    downscaled, unsupported = export_web_glb(self, output_glb, objects)
+                if unsupported and not unsupported_logged:
+                    log.write(f"The glTF exporter does not support: {', '.join(unsupported)}\n", 'WARNING')
+                    unsupported_logged = True
+                log.write(f"SUCCESS: Exported to {output_glb} ({downscaled} textures downscaled)\n")
                 success_count += 1
-                if log_path:
-                    with open(log_path, 'a') as log_file:
-                        log_file.write(f"SUCCESS: Exported to {output_fbx}\n")
+                outputs[fbx_file] = output_glb
+                log.record(file=fbx_file, status="ok", output=output_glb, textures_downscaled=downscaled,
+                           bytes=os.path.getsize(output_glb),
+                           seconds=time.perf_counter() - file_start, stages=timer.current)
             except Exception as e:
-                error_msg = f"Failed to export {output_fbx}: {str(e)}"
+                error_msg = f"Failed to export {output_glb}: {e}"
                 self.report({'ERROR'}, error_msg)
-                if log_path:
-                    with open(log_path, 'a') as log_file:
-                        log_file.write(f"ERROR: {error_msg}\n")
-                        log_file.write("TRACE: " + traceback.format_exc() + "\n")
+                log.exception(error_msg)
+                log.record(file=fbx_file, status="failed", stage="export", error=str(e),
+                           seconds=time.perf_counter() - file_start, stages=timer.current)
+                failed.append(fbx_file)
                 error_count += 1
         
-        if log_path:
-            with open(log_path, 'a') as log_file:
-                log_file.write(f"\n\nConversion Summary:\n")
-                log_file.write(f"Completed at: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-                log_file.write(f"Total files processed: {len(xml_files)}\n")
-                log_file.write(f"Successful conversions: {success_count}\n")
-                log_file.write(f"Failed conversions: {error_count}\n")
+        timer.end_file()
+        if job:
+            write_worker_result(job, success_count, error_count, outputs, failed, timer.files, cancelled)
+            journal.close()
+        else:
+            manifest.record_outputs(outputs)
+            manifest.save()
+            resume.finish(journal)
+            error_count += len(resume.quarantined)
+            if self.performance_report:
+                write_performance_report(output_folder, "GLB Export", timer, self.slowest_count)
         
-        self.report({'INFO'}, f"Batch conversion completed! {success_count} files converted, {error_count} failed.")
+        return self.finish_batch(log, len(fbx_files), success_count, error_count, len(skipped_files), len(cancelled))
+    
+    def finish_batch(self, log, total, success_count, error_count, skipped_count=0, cancelled_count=0):
+        """Write the export summary and report the final counts"""
+        log.write("\n\nGLB Export Summary:\n", 'SUMMARY')
+        log.write(f"Completed at: {time.strftime('%Y-%m-%d %H:%M:%S')}\n", 'SUMMARY')
+        log.write(f"Successful: {success_count}\n", 'SUMMARY')
+        log.write(f"Failed: {error_count}\n", 'SUMMARY')
+        log.write(f"Skipped (up to date): {skipped_count}\n", 'SUMMARY')
+        if cancelled_count:
+            log.write(f"Cancelled (left for the next run): {cancelled_count}\n", 'SUMMARY')
+            self.report({'WARNING'}, f"Batch cancelled; {cancelled_count} files were not processed.")
+        record_batch_summary(self, total, success_count, error_count, skipped_count)
+        self.report({'INFO'}, f"Batch GLB export completed! {success_count} exported, {error_count} failed, {skipped_count} up to date.")
         return {'FINISHED'}
 
 
 
+#[HELPER] Command Line
+# blender -b -P jarvis_tools.py -- <command> <directory> [options]
+# Options are generated from the operator properties, e.g. --worker-count 8 --no-debug-mode.
+CLI_COMMANDS = {
+    "convert-yft": BatchConvertXML,
+    "convert-ydr": BatchConvertYDR,
+    "clean": BatchCleanModel,
+    "textures": BatchConvertTextures,
+    "glb": BatchExportGLB,
+}
+
+# Process exit codes of the command-line entry point
+EXIT_OK = 0
+EXIT_FAILURES = 1
+EXIT_USAGE = 2
+EXIT_CANCELLED = 3
+
+# Properties filled in by the CLI itself or only meaningful in the file browser
+CLI_IGNORED = {"rna_type", "directory", "filepath", "filter_glob", "job_path"}
+
+
+def build_cli_parser():
+    """Build the argument parser; operator classes must be registered"""
+    parser = argparse.ArgumentParser(
+        prog="blender -b -P jarvis_tools.py --",
+        description="Run Jarvis Tools batch pipelines without the UI. "
+                    f"Exit codes: {EXIT_OK} success, {EXIT_FAILURES} some files failed, "
+                    f"{EXIT_USAGE} invalid arguments, {EXIT_CANCELLED} the batch could not run.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    for command, operator_class in CLI_COMMANDS.items():
+        sub = commands.add_parser(command, help=operator_class.bl_label)
+        sub.add_argument("directory", help="Source folder")
+        sub.add_argument("--summary", metavar="PATH", help="Also write the JSON summary to PATH")
+        for prop in operator_class.bl_rna.properties:
+            name = prop.identifier
+            if name in CLI_IGNORED or prop.is_hidden or prop.is_readonly:
+                continue
+            flag = "--" + name.replace("_", "-")
+            # Unset options stay None so the operator's own defaults apply
+            if prop.type == 'BOOLEAN':
+                sub.add_argument(flag, dest=name, action=argparse.BooleanOptionalAction, help=prop.description)
+            elif prop.type == 'INT':
+                sub.add_argument(flag, dest=name, type=int, metavar="N", help=prop.description)
+            elif prop.type == 'FLOAT':
+                sub.add_argument(flag, dest=name, type=float, metavar="X", help=prop.description)
+            elif prop.type == 'ENUM':
+                sub.add_argument(flag, dest=name, choices=[item.identifier for item in prop.enum_items],
+                                 help=prop.description)
+            elif prop.type == 'STRING':
+                sub.add_argument(flag, dest=name, help=prop.description)
+    return parser
+
+
+def run_cli(argv):
+    """Run one batch pipeline from command-line arguments and return the exit code.
+
+    The summary is printed as a single 'JARVIS_SUMMARY {json}' line so it can
+    be picked out of Blender's own console output.
+    """
+    try:
+        args = build_cli_parser().parse_args(argv)
+    except SystemExit as e:
+        return e.code
+    directory = os.path.abspath(args.directory)
+    if not os.path.isdir(directory):
+        print(f"Error: {directory} is not a folder", file=sys.stderr)
+        return EXIT_USAGE
+    
+    operator_class = CLI_COMMANDS[args.command]
+    options = {
+        name: value for name, value in vars(args).items()
+        if name not in ("command", "directory", "summary") and value is not None
+    }
+    BATCH_SUMMARY.clear()
+    start = time.perf_counter()
+    error = None
+    try:
+        result = resolve_operator(operator_class.bl_idname)(directory=directory, **options)
+    except Exception as e:
+        result = {'CANCELLED'}
+        error = str(e)
+    
+    # bpy.ops raises for the ERROR reports of failed files after the batch has finished,
+    # so a recorded summary decides the exit code even when the call raised
+    if not BATCH_SUMMARY:
+        exit_code = EXIT_CANCELLED
+    elif BATCH_SUMMARY["failed"]:
+        exit_code = EXIT_FAILURES
+    else:
+        exit_code = EXIT_OK
+    summary = {
+        "command": args.command,
+        "directory": directory,
+        "result": sorted(result),
+        "exit_code": exit_code,
+        "seconds": round(time.perf_counter() - start, 3),
+        "error": error,
+        **BATCH_SUMMARY,
+    }
+    print("JARVIS_SUMMARY " + json.dumps(summary), flush=True)
+    if args.summary:
+        with open(args.summary, 'w') as summary_file:
+            json.dump(summary, summary_file, indent=2)
+    return exit_code
+
+
 # Register classes
 classes = [
     JarvisToolsPanel,
     BatchConvertXML,
     ExportGLB,
     SimplifyTransparency,
+    FixUVs,
+    ApplyTransformations,
+    OptimizeGeometry,
+    GenerateLODs,
+    ValidateModel,
     BatchConvertTextures,
     BatchCleanModel,
     BatchConvertYDR,
+    BatchExportGLB,
 ]
 
 def register():
@@ -1001,3 +5055,40 @@ def unregister():
 
 if __name__ == "__main__":
     register()
+    
+    # Headless worker launched by run_worker_farm: blender -b -P jarvis_tools.py -- --jarvis-worker <job.json>
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    if len(argv) >= 2 and argv[0] == WORKER_ARG:
+        run_worker_job(argv[1])
+    
+    # Scene reset benchmark: blender -b -P jarvis_tools.py -- --jarvis-benchmark scene-reset [files]
+    elif len(argv) >= 2 and argv[0] == "--jarvis-benchmark" and argv[1] == "scene-reset":
+        file_count = int(argv[2]) if len(argv) > 2 else 1000
+        for first_index, seconds in benchmark_scene_reset(bpy.context, file_count):
+            print(f"files {first_index:>6}+: {seconds * 1000:8.3f} ms/file")
+    
+    # Import diff benchmark: blender -b -P jarvis_tools.py -- --jarvis-benchmark import-diff [sizes...]
+    elif len(argv) >= 2 and argv[0] == "--jarvis-benchmark" and argv[1] == "import-diff":
+        sizes = [int(size) for size in argv[2:]] or (1000, 2500, 5000, 10000)
+        for size, entry in benchmark_import_diff(bpy.context, sizes).items():
+            legacy = entry["legacy_seconds"]
+            legacy_text = f"{legacy * 1e6 / size:8.2f} us/object" if legacy is not None else "skipped"
+            print(f"objects {size:>7}: {entry['seconds'] * 1e6 / size:8.2f} us/object  (list-based: {legacy_text})")
+    
+    # Validation benchmark: blender -b -P jarvis_tools.py -- --jarvis-benchmark validate [triangles]
+    elif len(argv) >= 2 and argv[0] == "--jarvis-benchmark" and argv[1] == "validate":
+        face_count, seconds = benchmark_validation(bpy.context, int(argv[2]) if len(argv) > 2 else 1000000)
+        print(f"validated {face_count} triangles in {seconds:.3f} s")
+    
+    # DDS decoder benchmark: blender -b -P jarvis_tools.py -- --jarvis-benchmark dds <folder> [limit]
+    elif len(argv) >= 3 and argv[0] == "--jarvis-benchmark" and argv[1] == "dds":
+        limit = int(argv[3]) if len(argv) > 3 else 0
+        for texture_format, entry in sorted(benchmark_dds_decoders(argv[2], limit).items()):
+            native = entry["megapixels"] / entry["native_seconds"] if entry["native_seconds"] else 0.0
+            pillow = entry["megapixels"] / entry["pillow_seconds"] if entry["pillow_seconds"] else 0.0
+            print(f"{texture_format:<6} files {entry['files']:>5}  native {native:8.1f} MP/s "
+                  f"({entry['native_failures']} failed)  pillow {pillow:8.1f} MP/s ({entry['pillow_failures']} failed)")
+    
+    # Batch pipelines: blender -b -P jarvis_tools.py -- convert-yft|convert-ydr|clean|textures <dir> [options]
+    elif argv:
+        sys.exit(run_cli(argv))
@@ -0,0 +1,76 @@
+"""Crash recovery of grouped exports.
+
+Needs Blender's Python modules (run inside Blender or with the `bpy` wheel):
+    blender -b --python-expr "import pytest, sys; sys.exit(pytest.main(['tests']))"
+"""
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("bpy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import jarvis_tools
+
+
+def fake_export(group):
+    """Stand-in for ExportGroup.export that writes an empty file per queued asset"""
+    def export(context):
+        for asset in group.assets:
+            with open(asset.output_path, 'w'):
+                pass
+        return {}
+    return export
+
+
+def crash(journal):
+    """Stop journaling as a killed Blender process would, with no 'interrupted' entry"""
+    journal.file.close()
+    journal.file = None
+
+
+def test_crash_between_groups_keeps_flushed_assets(tmp_path):
+    source = [str(tmp_path / f"asset{index}.yft.xml") for index in range(5)]
+    output_folder = tmp_path / "Converted"
+    output_folder.mkdir()
+    journal_dir = str(output_folder / jarvis_tools.JOURNAL_DIR)
+    journal = jarvis_tools.BatchJournal(os.path.join(journal_dir, "batch.jsonl"), "settings")
+    group = jarvis_tools.ExportGroup(str(output_folder), max_assets=2, journal=journal)
+    group.export = fake_export(group)
+    log = jarvis_tools.BatchLogger()
+    timer = jarvis_tools.StageTimer()
+
+    # Two groups of two are exported, then Blender dies while the fifth asset is imported
+    for path in journal.iterate(source, {}, [], group):
+        output_path = str(output_folder / os.path.basename(path).replace(".yft.xml", ".fbx"))
+        if path == source[4]:
+            crash(journal)
+            break
+        group.assets.append(jarvis_tools.GroupedAsset(path, output_path, None, [], [], {}))
+        if group.is_full():
+            group.flush(None, log, timer)
+
+    completed, crashed = jarvis_tools.recover_journal(journal_dir, "settings")
+    assert sorted(completed) == source[:4]
+    assert crashed == [source[4]]
+
+
+def test_unflushed_group_is_converted_again(tmp_path):
+    source = [str(tmp_path / f"asset{index}.yft.xml") for index in range(3)]
+    output_folder = tmp_path / "Converted"
+    output_folder.mkdir()
+    journal_dir = str(output_folder / jarvis_tools.JOURNAL_DIR)
+    journal = jarvis_tools.BatchJournal(os.path.join(journal_dir, "batch.jsonl"), "settings")
+    group = jarvis_tools.ExportGroup(str(output_folder), max_assets=4, journal=journal)
+    group.export = fake_export(group)
+
+    # All three assets are still queued when Blender dies after the last one
+    for path in journal.iterate(source, {}, [], group):
+        output_path = str(output_folder / os.path.basename(path).replace(".yft.xml", ".fbx"))
+        group.assets.append(jarvis_tools.GroupedAsset(path, output_path, None, [], [], {}))
+    crash(journal)
+
+    completed, crashed = jarvis_tools.recover_journal(journal_dir, "settings")
+    assert completed == {}
+    assert crashed == []